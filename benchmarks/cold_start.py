@@ -0,0 +1,61 @@
+"""Compare container creation plus a first resolution with eager and lazy compilation.
+
+Simulates a CLI tool or serverless function which registers many services but only uses a few per invocation.
+
+Usage: python benchmarks/cold_start.py [services] [used]
+"""
+
+import inspect
+import sys
+import time
+from typing import Any, List
+
+import wireup
+
+
+def make_services(count: int) -> List[Any]:
+    services: List[Any] = []
+
+    for i in range(count):
+        # Services form a tree where each one depends on its parent, so that resolving one compiles a few others.
+        deps = [services[(i - 1) // 2]] if i else []
+
+        def __init__(self: Any, **kwargs: Any) -> None:
+            self.deps = kwargs
+
+        # Declare the dependencies through the signature, which is what Wireup inspects.
+        __init__.__signature__ = _signature(deps)  # type: ignore[attr-defined]
+        services.append(wireup.service(type(f"Service{i}", (), {"__init__": __init__})))
+
+    return services
+
+
+def _signature(deps: List[Any]) -> inspect.Signature:
+    params = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    params += [
+        inspect.Parameter(f"dep{n}", inspect.Parameter.KEYWORD_ONLY, annotation=dep) for n, dep in enumerate(deps)
+    ]
+    return inspect.Signature(params)
+
+
+def _measure(services: List[Any], used: int, *, lazy_compilation: bool) -> float:
+    start = time.perf_counter()
+    container = wireup.create_sync_container(services=services, lazy_compilation=lazy_compilation)
+    for klass in services[-used:]:
+        container.get(klass)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    used = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    for lazy_compilation in (False, True):
+        best = min(_measure(make_services(count), used, lazy_compilation=lazy_compilation) for _ in range(5))
+        label = "lazy" if lazy_compilation else "eager"
+        print(f"{label:<6} {count} services, {used} used: {best * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Compare container creation without a compile cache, on a cache miss and on a cache hit.
+
+Services are written to a temporary module, as cached registrations must be importable.
+
+Usage: python benchmarks/compile_cache.py [services]
+"""
+
+import importlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import wireup
+
+
+def _write_module(directory: Path, count: int) -> None:
+    lines = ["import wireup", ""]
+
+    for i in range(count):
+        dependency = f"dep: Service{(i - 1) // 2}" if i else ""
+        lines += ["@wireup.service", f"class Service{i}:", f"    def __init__(self, {dependency}) -> None: ...", ""]
+
+    (directory / "generated_services.py").write_text("\n".join(lines))
+
+
+def _measure(cache_dir: Optional[Path]) -> float:
+    module = importlib.import_module("generated_services")
+    start = time.perf_counter()
+    wireup.create_sync_container(service_modules=[module], compile_cache_dir=cache_dir)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_module(Path(tmp), count)
+        sys.path.insert(0, tmp)
+        cache_dir = Path(tmp) / "cache"
+
+        print(f"{count} services")
+        print(f"  no cache:   {min(_measure(None) for _ in range(3)) * 1000:.1f}ms")
+        print(f"  cache miss: {_measure(cache_dir) * 1000:.1f}ms")
+        print(f"  cache hit:  {min(_measure(cache_dir) for _ in range(3)) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
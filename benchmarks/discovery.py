@@ -0,0 +1,68 @@
+"""Compare service discovery of a large package by importing, with a discovery manifest and by parsing sources.
+
+Generates a package where only some modules declare services, then measures discovery in fresh interpreters so that
+module imports are not cached between runs.
+
+Usage: python benchmarks/discovery.py [modules] [modules declaring services]
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+_MEASURE = """
+import sys, time
+start = time.perf_counter()
+import wireup, generated_pkg
+from wireup._discovery import StaticDiscovery, discover_wireup_registrations
+discover_wireup_registrations(
+    [generated_pkg],
+    manifest_dir=sys.argv[2] if len(sys.argv) > 2 else None,
+    static=StaticDiscovery(max_workers=int(sys.argv[1])) if int(sys.argv[1]) else None,
+)
+print(time.perf_counter() - start)
+"""
+
+
+def _write_package(root: Path, modules: int, with_services: int) -> None:
+    package = root / "generated_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+
+    for i in range(modules):
+        lines = ["import dataclasses", "import wireup", ""]
+        lines += [f"@dataclasses.dataclass\nclass Model{n}:\n    value: int = {n}\n" for n in range(20)]
+
+        if i % (modules // with_services) == 0:
+            lines.append(f"@wireup.service\nclass Service{i}: ...\n")
+
+        (package / f"module{i}.py").write_text("\n".join(lines))
+
+
+def _measure(root: Path, static_workers: int = 0, manifest_dir: Optional[Path] = None) -> float:
+    args = [sys.executable, "-c", _MEASURE, str(static_workers)] + ([str(manifest_dir)] if manifest_dir else [])
+    env = {"PYTHONPATH": f"{root}:{Path(__file__).parent.parent}"}
+
+    return min(float(subprocess.check_output(args, env=env)) for _ in range(3))
+
+
+def main() -> None:
+    modules = int(sys.argv[1]) if len(sys.argv) > 1 else 900
+    with_services = int(sys.argv[2]) if len(sys.argv) > 2 else 90
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write_package(root, modules, with_services)
+
+        print(f"{modules} modules, {with_services} declaring services")
+        print(f"  import:            {_measure(root) * 1000:.1f}ms")
+        _measure(root, manifest_dir=root / "cache")
+        print(f"  manifest:          {_measure(root, manifest_dir=root / 'cache') * 1000:.1f}ms")
+        print(f"  static:            {_measure(root, static_workers=1) * 1000:.1f}ms")
+        print(f"  static, 4 workers: {_measure(root, static_workers=4) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
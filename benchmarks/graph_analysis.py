@@ -0,0 +1,51 @@
+"""Measure how container creation scales with the size of a diamond-heavy dependency graph.
+
+Services are arranged in layers where each one depends on two services of the previous layer, so the number of
+distinct paths through the graph doubles with every layer while the number of edges grows linearly.
+
+Usage: python benchmarks/graph_analysis.py [services ...]
+"""
+
+import inspect
+import sys
+import time
+from typing import Any, List
+
+import wireup
+
+WIDTH = 4
+
+
+def make_layered_services(count: int) -> List[Any]:
+    services: List[Any] = []
+
+    for i in range(count):
+        layer_start = i - i % WIDTH
+        deps = [services[layer_start - WIDTH + (i + n) % WIDTH] for n in range(2)] if layer_start else []
+
+        def __init__(self: Any, **kwargs: Any) -> None:
+            self.deps = kwargs
+
+        params = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        params += [
+            inspect.Parameter(f"dep{n}", inspect.Parameter.KEYWORD_ONLY, annotation=dep) for n, dep in enumerate(deps)
+        ]
+        __init__.__signature__ = inspect.Signature(params)  # type: ignore[attr-defined]
+        services.append(wireup.service(type(f"Service{i}", (), {"__init__": __init__})))
+
+    return services
+
+
+def main() -> None:
+    counts = [int(arg) for arg in sys.argv[1:]] or [500, 1000, 2000, 4000, 8000]
+
+    for count in counts:
+        services = make_layered_services(count)
+        start = time.perf_counter()
+        wireup.create_sync_container(services=services, lazy_compilation=True)
+        elapsed = time.perf_counter() - start
+        print(f"{count:>6} services: {elapsed * 1000:8.1f}ms ({elapsed / count * 1e6:.1f}us per service)")
+
+
+if __name__ == "__main__":
+    main()
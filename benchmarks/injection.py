@@ -0,0 +1,69 @@
+"""Measure the per-call overhead of functions decorated with `inject_from_container`.
+
+Usage: python benchmarks/injection.py [number]
+"""
+
+import asyncio
+import sys
+import time
+import timeit
+
+import wireup
+from typing_extensions import Annotated
+from wireup import Inject, Injected
+
+
+@wireup.service
+class Settings: ...
+
+
+@wireup.service(lifetime="scoped")
+class Repository:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    parameters = {"env": "prod", "region": "eu"}
+    container = wireup.create_sync_container(services=[Settings, Repository], parameters=parameters)
+    async_container = wireup.create_async_container(services=[Settings, Repository], parameters=parameters)
+
+    def handler(
+        settings: Injected[Settings],
+        repository: Injected[Repository],
+        env: Annotated[str, Inject(param="env")],
+        name: Annotated[str, Inject(expr="${env}-${region}")],
+    ) -> None: ...
+
+    async def async_handler(
+        settings: Injected[Settings],
+        repository: Injected[Repository],
+        env: Annotated[str, Inject(param="env")],
+    ) -> None: ...
+
+    def singleton_handler(settings: Injected[Settings], env: Annotated[str, Inject(param="env")]) -> None: ...
+
+    sync_target = wireup.inject_from_container(container)(handler)
+    sync_time = min(timeit.repeat(sync_target, number=number, repeat=5))
+
+    singleton_target = wireup.inject_from_container(container)(singleton_handler)
+    singleton_time = min(timeit.repeat(singleton_target, number=number, repeat=5))
+
+    async_target = wireup.inject_from_container(async_container)(async_handler)
+
+    async def _run_async() -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            await async_target()
+        return time.perf_counter() - start
+
+    async_time = min(asyncio.run(_run_async()) for _ in range(5))
+
+    print(f"sync target:  {sync_time / number * 1e6:.2f}us per call")
+    print(f"async target: {async_time / number * 1e6:.2f}us per call")
+    print(f"singletons only target: {singleton_time / number * 1e6:.2f}us per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare creating services which inject parameters with and without `constant_parameters`.
+
+Usage: python benchmarks/parameters.py [number]
+"""
+
+import sys
+import timeit
+
+import wireup
+from typing_extensions import Annotated
+from wireup import Inject, Injected
+
+
+@wireup.service(lifetime="transient")
+class Request:
+    def __init__(
+        self,
+        env: Annotated[str, Inject(param="env")],
+        timeout: Annotated[int, Inject(param="timeout")],
+        url: Annotated[str, Inject(expr="https://${env}.example.com/${region}")],
+    ) -> None:
+        self.env = env
+        self.timeout = timeout
+        self.url = url
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    parameters = {"env": "prod", "region": "eu", "timeout": 30}
+
+    for constant_parameters in (False, True):
+        container = wireup.create_sync_container(
+            services=[Request], parameters=parameters, constant_parameters=constant_parameters
+        )
+
+        @wireup.inject_from_container(container)
+        def handler(
+            request: Injected[Request],
+            env: Annotated[str, Inject(param="env")],
+            url: Annotated[str, Inject(expr="https://${env}.example.com/${region}")],
+        ) -> None: ...
+
+        with container.enter_scope() as scope:
+            resolve = scope.resolver(Request)
+            resolve_time = min(timeit.repeat(lambda: resolve(scope), number=number, repeat=5))  # noqa: B023
+
+        handler_time = min(timeit.repeat(handler, number=number // 5, repeat=5))
+
+        print(
+            f"constant_parameters={constant_parameters!s:<5}  "
+            f"transient: {resolve_time / number * 1e9:.0f}ns  "
+            f"injected function: {handler_time / (number // 5) * 1e9:.0f}ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Compare resolving services via `container.get` against precomputed `container.resolver` handles.
+
+Usage: python benchmarks/resolver.py [number]
+"""
+
+import sys
+import timeit
+
+import wireup
+
+
+@wireup.service
+class Settings: ...
+
+
+@wireup.service(lifetime="scoped")
+class Repository:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+@wireup.service(lifetime="transient")
+class UseCase:
+    def __init__(self, repository: Repository, settings: Settings) -> None:
+        self.repository = repository
+        self.settings = settings
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    container = wireup.create_sync_container(services=[Settings, Repository, UseCase])
+
+    with container.enter_scope() as scope:
+        for klass in (Settings, Repository, UseCase):
+            resolve = container.resolver(klass)
+            get_time = min(timeit.repeat(lambda klass=klass: scope.get(klass), number=number, repeat=5))
+            resolver_time = min(timeit.repeat(lambda resolve=resolve: resolve(scope), number=number, repeat=5))
+
+            print(
+                f"{klass.__name__:<12} get: {get_time:.3f}s  resolver: {resolver_time:.3f}s  "
+                f"({get_time / resolver_time:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Measure entering a scope and resolving every service of a request with 50 scoped services.
+
+Usage: python benchmarks/scope_storage.py [number]
+"""
+
+import sys
+import timeit
+from typing import Any, List
+
+import wireup
+
+SCOPED_SERVICES = 50
+
+
+@wireup.service
+class Settings: ...
+
+
+def _make_services() -> List[Any]:
+    services: List[Any] = []
+
+    for i in range(SCOPED_SERVICES):
+        previous = services[-1] if services else Settings
+
+        def __init__(self: Any, dep: Any) -> None:
+            self.dep = dep
+
+        __init__.__annotations__ = {"dep": previous, "return": None}
+        services.append(wireup.service(lifetime="scoped")(type(f"Scoped{i}", (), {"__init__": __init__})))
+
+    return services
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    services = _make_services()
+    container = wireup.create_sync_container(services=[Settings, *services])
+
+    def request() -> None:
+        with container.enter_scope() as scope:
+            for klass in services:
+                scope.get(klass)
+
+    def cached_lookups() -> None:
+        for klass in services:
+            scope.get(klass)
+
+    request_time = min(timeit.repeat(request, number=number, repeat=5))
+
+    with container.enter_scope() as scope:
+        cached_lookups()
+        lookup_time = min(timeit.repeat(cached_lookups, number=number, repeat=5))
+
+    print(f"Request scope with {SCOPED_SERVICES} scoped services ({number} iterations)")
+    print(f"  enter scope + create all: {request_time / number * 1e6:.2f}us per request")
+    print(f"  cached lookups:           {lookup_time / number * 1e6:.2f}us per {SCOPED_SERVICES} lookups")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Measure container creation time for registries of increasing size.
+
+Usage: python benchmarks/startup.py [sizes...]
+"""
+
+import sys
+import time
+
+import wireup
+from cold_start import make_services
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1_000, 10_000]
+
+    for size in sizes:
+        services = make_services(size)
+        best = float("inf")
+
+        for _ in range(3):
+            start = time.perf_counter()
+            wireup.create_sync_container(services=services)
+            best = min(best, time.perf_counter() - start)
+
+        print(f"{size:>6} services: {best * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
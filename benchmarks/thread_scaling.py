@@ -0,0 +1,69 @@
+"""Measure how container throughput scales with the number of threads sharing it.
+
+Each thread repeatedly enters a scope and resolves a scoped service depending on a singleton.
+On free-threaded builds (e.g.: python3.13t) throughput should grow with the thread count,
+while with the GIL enabled it stays roughly flat.
+
+Usage: python benchmarks/thread_scaling.py [max_threads] [iterations_per_thread]
+"""
+
+import os
+import sys
+import threading
+import time
+
+import wireup
+
+
+@wireup.service
+class Settings: ...
+
+
+@wireup.service(lifetime="scoped")
+class Repository:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+def _run(container: wireup.SyncContainer, thread_count: int, iterations: int) -> float:
+    barrier = threading.Barrier(thread_count + 1)
+
+    def _work() -> None:
+        barrier.wait()
+        for _ in range(iterations):
+            with container.enter_scope() as scope:
+                scope.get(Repository)
+                scope.get(Settings)
+
+    threads = [threading.Thread(target=_work) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+
+    return thread_count * iterations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000  # noqa: PLR2004
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if is_gil_enabled else 'disabled'}")
+
+    container = wireup.create_sync_container(services=[Settings, Repository], thread_safe=True)
+    baseline = None
+    thread_count = 1
+
+    while thread_count <= max_threads:
+        ops = _run(container, thread_count, iterations)
+        baseline = baseline or ops
+        print(f"{thread_count:>3} threads: {ops:>12,.0f} scopes/s ({ops / baseline:.2f}x)")
+        thread_count *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import functools
 from typing import Union
 
 import pytest
@@ -8,7 +9,15 @@ from test.unit import services
 Container = Union[wireup.SyncContainer, wireup.AsyncContainer]
 
 
-@pytest.fixture(params=[wireup.create_sync_container, wireup.create_async_container])
+@pytest.fixture(
+    params=[
+        wireup.create_sync_container,
+        wireup.create_async_container,
+        functools.partial(wireup.create_sync_container, lazy_compilation=True),
+        functools.partial(wireup.create_async_container, lazy_compilation=True),
+    ],
+    ids=["sync", "async", "sync-lazy", "async-lazy"],
+)
 def container(request: pytest.FixtureRequest) -> Container:
     return request.param(
         service_modules=[services],
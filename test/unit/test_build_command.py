@@ -0,0 +1,69 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+import wireup
+from wireup import _discovery
+from wireup.__main__ import main
+from wireup.ioc.service_registry import ServiceRegistry
+
+from test.unit import services
+from test.unit.services.with_annotations.env import EnvService
+
+
+def test_build_writes_cache_loaded_by_containers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert (
+        main(["build", "--service-module", "test.unit.services", "--parameter", "env_name", "--output", str(tmp_path)])
+        == 0
+    )
+
+    out = capsys.readouterr().out
+    assert "services:" in out
+    assert "max depth:" in out
+    assert "build time:" in out
+
+    def _fail(*_: Any) -> None:
+        pytest.fail("Registrations built ahead of time must not be validated again.")
+
+    monkeypatch.setattr(ServiceRegistry, "assert_dependencies_valid", _fail)
+    container = wireup.create_sync_container(
+        service_modules=[services], parameters={"env_name": "prod"}, compile_cache_dir=tmp_path
+    )
+
+    assert container.get(EnvService).env_name == "prod"
+
+
+def test_build_reports_invalid_registrations(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["build", "--service-module", "test.unit.services", "--output", str(tmp_path)]) == 1
+    assert "unknown Wireup parameter 'env_name'" in capsys.readouterr().err
+    assert not list(tmp_path.glob("*.wireup"))
+
+
+def test_build_with_roots_reports_unreachable_services(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    args = ["build", "--service-module", "test.unit.services", "--parameter", "env_name", "--output", str(tmp_path)]
+    root = "test.unit.services.with_annotations.services:Foo"
+
+    assert main([*args, "--root", root]) == 0
+    assert "unreachable:        8" in capsys.readouterr().out
+
+
+def test_build_with_static_discovery_writes_manifest_used_by_containers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    args = ["build", "--service-module", "test.unit.services", "--parameter", "env_name", "--output", str(tmp_path)]
+    assert main([*args, "--static-discovery", "--exclude", "*.abstract_multiple_bases"]) == 0
+
+    def _fail(*_: Any, **__: Any) -> None:
+        pytest.fail("Modules must not be parsed while the manifest is valid.")
+
+    monkeypatch.setattr(_discovery, "_find_objects_statically", _fail)
+    container = wireup.create_sync_container(
+        service_modules=[services],
+        parameters={"env_name": "prod"},
+        compile_cache_dir=tmp_path,
+        discovery=wireup.StaticDiscovery(exclude=["*.abstract_multiple_bases"]),
+    )
+
+    assert container.get(EnvService).env_name == "prod"
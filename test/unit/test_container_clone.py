@@ -0,0 +1,158 @@
+from typing import AsyncIterator, Iterator, List
+from unittest.mock import MagicMock
+
+import pytest
+import wireup
+from wireup.errors import WireupError
+from wireup.ioc.factory_compiler import FactoryCompiler
+
+from test.unit.services.with_annotations.services import Foo, FooImpl
+
+
+class Settings: ...
+
+
+class Repository:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class Handler:
+    def __init__(self, repository: Repository) -> None:
+        self.repository = repository
+
+
+def _create_container() -> wireup.SyncContainer:
+    return wireup.create_sync_container(
+        services=[wireup.service(Settings), wireup.service(Repository), wireup.service(lifetime="scoped")(Handler)]
+    )
+
+
+def test_clone_has_own_singletons() -> None:
+    container = _create_container()
+    repository = container.get(Repository)
+    clone = container.clone()
+
+    assert clone.get(Repository) is not repository
+    assert clone.get(Repository) is clone.get(Repository)
+    assert clone.get(Repository).settings is clone.get(Settings)
+    assert container.get(Repository) is repository
+
+    with clone.enter_scope() as scoped:
+        assert scoped.get(Handler).repository is clone.get(Repository)
+
+
+def test_clone_reuses_compiled_code(monkeypatch: pytest.MonkeyPatch) -> None:
+    container = _create_container()
+
+    def _fail(*_: object) -> None:
+        pytest.fail("Cloned containers must not generate factories again.")
+
+    monkeypatch.setattr(FactoryCompiler, "_get_factory_code", _fail)
+    clone = container.clone()
+
+    with clone.enter_scope() as scoped:
+        assert isinstance(scoped.get(Handler), Handler)
+
+
+def test_clones_are_extended_separately() -> None:
+    container = wireup.create_sync_container(services=[wireup.service(Settings), wireup.service(Repository)])
+    first, second = container.clone(), container.clone()
+
+    first._extend([wireup.service(Handler).__wireup_registration__])  # type: ignore[attr-defined]
+    second._extend([wireup.service(Handler).__wireup_registration__])  # type: ignore[attr-defined]
+
+    with first.enter_scope() as scoped:
+        assert scoped.get(Handler).repository is first.get(Repository)
+
+    with second.enter_scope() as scoped:
+        assert scoped.get(Handler).repository is second.get(Repository)
+
+    assert not container._registry.is_type_with_qualifier_known(Handler, None)
+
+
+def test_clone_does_not_inherit_overrides() -> None:
+    container = wireup.create_sync_container(services=[Foo, FooImpl])
+    foo_mock = MagicMock()
+
+    with container.override.service(Foo, new=foo_mock):
+        clone = container.clone()
+
+        assert container.get(Foo) is foo_mock
+        assert isinstance(clone.get(Foo), FooImpl)
+
+
+def test_restore_discards_singletons_created_after_checkpoint() -> None:
+    container = _create_container()
+    settings = container.get(Settings)
+    checkpoint = container.checkpoint()
+    repository = container.get(Repository)
+
+    container.restore(checkpoint)
+
+    assert container.get(Settings) is settings
+    assert container.get(Repository) is not repository
+    assert container.get(Repository).settings is settings
+
+    with container.enter_scope() as scoped:
+        assert scoped.get(Handler).repository is container.get(Repository)
+
+
+def test_restore_cleans_up_singletons_created_after_checkpoint() -> None:
+    events: List[str] = []
+
+    @wireup.service
+    def settings_factory() -> Iterator[Settings]:
+        events.append("created")
+        yield Settings()
+        events.append("closed")
+
+    container = wireup.create_sync_container(services=[settings_factory])
+    checkpoint = container.checkpoint()
+    container.get(Settings)
+
+    container.restore(checkpoint)
+    assert events == ["created", "closed"]
+
+    container.get(Settings)
+    container.close()
+    assert events == ["created", "closed", "created", "closed"]
+
+
+def test_restore_while_override_is_active() -> None:
+    container = wireup.create_sync_container(services=[Foo, FooImpl])
+    checkpoint = container.checkpoint()
+    foo = container.get(Foo)
+
+    with container.override.service(Foo, new=MagicMock()):
+        container.restore(checkpoint)
+
+    assert container.get(Foo) is not foo
+    assert container.get(Foo) is container.get(Foo)
+
+
+def test_restore_rejects_checkpoint_of_other_container() -> None:
+    container = _create_container()
+
+    with pytest.raises(WireupError, match="different container"):
+        container.restore(container.clone().checkpoint())
+
+
+async def test_async_restore_cleans_up_async_singletons() -> None:
+    events: List[str] = []
+
+    @wireup.service
+    async def settings_factory() -> AsyncIterator[Settings]:
+        events.append("created")
+        yield Settings()
+        events.append("closed")
+
+    container = wireup.create_async_container(services=[settings_factory, wireup.service(Repository)])
+    checkpoint = container.checkpoint()
+    settings = await container.get(Settings)
+
+    await container.restore(checkpoint)
+
+    assert events == ["created", "closed"]
+    assert (await container.get(Repository)).settings is not settings
+    assert (await container.clone().get(Repository)).settings is not await container.get(Settings)
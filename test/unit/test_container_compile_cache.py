@@ -0,0 +1,91 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+import wireup
+from wireup.ioc import factory_compiler
+from wireup.ioc.factory_compiler import FactoryCompiler
+from wireup.ioc.service_registry import ServiceRegistry
+
+from test.unit import services
+from test.unit.services.with_annotations.env import EnvService
+from test.unit.services.with_annotations.services import Foo, FooImpl
+
+
+def _create_container(cache_dir: Path, env_name: str = "test") -> wireup.SyncContainer:
+    return wireup.create_sync_container(
+        service_modules=[services], parameters={"env_name": env_name}, compile_cache_dir=cache_dir
+    )
+
+
+def test_compile_cache_is_loaded_by_later_containers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _create_container(tmp_path)
+    assert len(list(tmp_path.glob("*.wireup"))) == 1
+
+    def _fail(*_: Any) -> None:
+        pytest.fail("Registrations loaded from the cache must not be validated or compiled again.")
+
+    monkeypatch.setattr(ServiceRegistry, "assert_dependencies_valid", _fail)
+    monkeypatch.setattr(factory_compiler, "compile", _fail, raising=False)
+    container = _create_container(tmp_path, env_name="prod")
+
+    assert container.get(EnvService).env_name == "prod"
+    assert isinstance(container.get(Foo), FooImpl)
+
+    with container.enter_scope() as scoped:
+        assert scoped.get(Foo) is container.get(Foo)
+
+
+def test_compile_cache_hit_does_not_generate_code(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _create_container(tmp_path)
+
+    def _fail(*_: Any) -> None:
+        pytest.fail("Factories loaded from the cache must not be generated again.")
+
+    monkeypatch.setattr(FactoryCompiler, "_get_factory_code", _fail)
+    container = _create_container(tmp_path)
+
+    with container.enter_scope() as scoped:
+        assert scoped.get(Foo) is container.get(Foo)
+        assert scoped.get(EnvService).env_name == "test"
+
+
+def test_compile_cache_changes_with_options(tmp_path: Path) -> None:
+    _create_container(tmp_path)
+    wireup.create_sync_container(
+        service_modules=[services], parameters={"env_name": "test"}, compile_cache_dir=tmp_path, thread_safe=True
+    )
+
+    assert len(list(tmp_path.glob("*.wireup"))) == 2
+
+
+def test_compile_cache_does_not_store_parameter_values(tmp_path: Path) -> None:
+    _create_container(tmp_path, env_name="s3cr3t-value")
+
+    assert all(b"s3cr3t-value" not in file.read_bytes() for file in tmp_path.iterdir())
+
+
+def test_compile_cache_changes_with_registrations(tmp_path: Path) -> None:
+    _create_container(tmp_path)
+    wireup.create_sync_container(services=[Foo, FooImpl], compile_cache_dir=tmp_path)
+
+    assert len(list(tmp_path.glob("*.wireup"))) == 2
+
+
+def test_compile_cache_ignores_corrupt_files(tmp_path: Path) -> None:
+    _create_container(tmp_path)
+    (cache_file,) = tmp_path.glob("*.wireup")
+    cache_file.write_bytes(b"not a cache file")
+
+    assert _create_container(tmp_path).get(EnvService).env_name == "test"
+    assert cache_file.read_bytes() != b"not a cache file"
+
+
+def test_compile_cache_skips_services_which_cannot_be_imported(tmp_path: Path) -> None:
+    @wireup.service
+    class LocalService: ...
+
+    container = wireup.create_sync_container(services=[LocalService], compile_cache_dir=tmp_path)
+
+    assert isinstance(container.get(LocalService), LocalService)
+    assert not list(tmp_path.glob("*.wireup"))
@@ -0,0 +1,202 @@
+import asyncio
+from typing import AsyncIterator, Iterator, List
+
+import pytest
+import wireup
+
+
+class TenantConfig: ...
+
+
+class FeatureFlags: ...
+
+
+class Principal: ...
+
+
+class Handler:
+    def __init__(self, config: TenantConfig, flags: FeatureFlags, principal: Principal) -> None:
+        self.config = config
+        self.flags = flags
+        self.principal = principal
+
+
+async def test_independent_async_dependencies_are_created_concurrently() -> None:
+    config_started = asyncio.Event()
+    flags_started = asyncio.Event()
+
+    @wireup.service(lifetime="scoped")
+    async def config_factory() -> TenantConfig:
+        config_started.set()
+        await flags_started.wait()
+        return TenantConfig()
+
+    @wireup.service(lifetime="scoped")
+    async def flags_factory() -> FeatureFlags:
+        flags_started.set()
+        await config_started.wait()
+        return FeatureFlags()
+
+    @wireup.service(lifetime="scoped")
+    def principal_factory() -> Principal:
+        return Principal()
+
+    @wireup.service(lifetime="scoped")
+    def handler_factory(config: TenantConfig, flags: FeatureFlags, principal: Principal) -> Handler:
+        return Handler(config, flags, principal)
+
+    container = wireup.create_async_container(
+        services=[config_factory, flags_factory, principal_factory, handler_factory],
+        concurrent_dependencies=True,
+    )
+
+    async with container.enter_scope() as scope:
+        handler = await asyncio.wait_for(scope.get(Handler), timeout=1)
+
+        assert handler.config is await scope.get(TenantConfig)
+        assert handler.flags is await scope.get(FeatureFlags)
+        assert handler.principal is await scope.get(Principal)
+
+
+async def test_concurrent_dependencies_keep_exit_stack_order() -> None:
+    events: List[str] = []
+
+    @wireup.service(lifetime="scoped")
+    async def config_factory() -> AsyncIterator[TenantConfig]:
+        await asyncio.sleep(0.01)
+        yield TenantConfig()
+        events.append("config")
+
+    @wireup.service(lifetime="scoped")
+    async def flags_factory() -> AsyncIterator[FeatureFlags]:
+        yield FeatureFlags()
+        events.append("flags")
+
+    @wireup.service(lifetime="scoped")
+    async def principal_factory() -> AsyncIterator[Principal]:
+        yield Principal()
+        events.append("principal")
+
+    @wireup.service(lifetime="scoped")
+    def handler_factory(config: TenantConfig, flags: FeatureFlags, principal: Principal) -> Handler:
+        return Handler(config, flags, principal)
+
+    container = wireup.create_async_container(
+        services=[config_factory, flags_factory, principal_factory, handler_factory],
+        concurrent_dependencies=True,
+    )
+
+    async with container.enter_scope() as scope:
+        await scope.get(Handler)
+
+    assert events == ["principal", "flags", "config"]
+
+
+async def test_concurrent_dependencies_are_only_grouped_with_adjacent_ones() -> None:
+    events: List[str] = []
+
+    @wireup.service(lifetime="scoped")
+    async def config_factory() -> AsyncIterator[TenantConfig]:
+        yield TenantConfig()
+        events.append("config")
+
+    @wireup.service(lifetime="scoped")
+    def flags_factory() -> Iterator[FeatureFlags]:
+        yield FeatureFlags()
+        events.append("flags")
+
+    @wireup.service(lifetime="scoped")
+    async def principal_factory() -> AsyncIterator[Principal]:
+        yield Principal()
+        events.append("principal")
+
+    @wireup.service(lifetime="scoped")
+    async def handler_factory(config: TenantConfig, flags: FeatureFlags, principal: Principal) -> Handler:
+        return Handler(config, flags, principal)
+
+    container = wireup.create_async_container(
+        services=[config_factory, flags_factory, principal_factory, handler_factory],
+        concurrent_dependencies=True,
+    )
+
+    async with container.enter_scope() as scope:
+        await scope.get(Handler)
+
+    assert events == ["principal", "flags", "config"]
+
+
+async def test_concurrent_dependencies_cancel_siblings_on_error() -> None:
+    cancelled = False
+    events: List[str] = []
+
+    @wireup.service(lifetime="scoped")
+    async def config_factory() -> TenantConfig:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return TenantConfig()
+
+    @wireup.service(lifetime="scoped")
+    async def flags_factory() -> AsyncIterator[FeatureFlags]:
+        try:
+            yield FeatureFlags()
+        finally:
+            events.append("flags")
+
+    @wireup.service(lifetime="scoped")
+    async def principal_factory() -> Principal:
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    @wireup.service(lifetime="scoped")
+    def handler_factory(config: TenantConfig, flags: FeatureFlags, principal: Principal) -> Handler:
+        return Handler(config, flags, principal)
+
+    container = wireup.create_async_container(
+        services=[config_factory, flags_factory, principal_factory, handler_factory],
+        concurrent_dependencies=True,
+    )
+
+    with pytest.raises(ValueError, match="boom"):
+        async with container.enter_scope() as scope:
+            await scope.get(Handler)
+
+    assert cancelled
+    # Resources created by siblings which succeeded are still cleaned up on scope exit.
+    assert events == ["flags"]
+
+
+async def test_dependencies_sharing_cached_services_are_not_created_concurrently() -> None:
+    created: List[type] = []
+
+    @wireup.service(lifetime="scoped")
+    async def principal_factory() -> Principal:
+        await asyncio.sleep(0)
+        created.append(Principal)
+        return Principal()
+
+    @wireup.service(lifetime="scoped")
+    async def config_factory(_principal: Principal) -> TenantConfig:
+        return TenantConfig()
+
+    @wireup.service(lifetime="scoped")
+    async def flags_factory(_principal: Principal) -> FeatureFlags:
+        return FeatureFlags()
+
+    @wireup.service(lifetime="scoped")
+    def handler_factory(config: TenantConfig, flags: FeatureFlags, principal: Principal) -> Handler:
+        return Handler(config, flags, principal)
+
+    container = wireup.create_async_container(
+        services=[config_factory, flags_factory, principal_factory, handler_factory],
+        concurrent_dependencies=True,
+    )
+
+    async with container.enter_scope() as scope:
+        handler = await scope.get(Handler)
+
+    assert created == [Principal]
+    assert isinstance(handler.principal, Principal)
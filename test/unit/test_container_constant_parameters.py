@@ -0,0 +1,79 @@
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+import wireup
+from typing_extensions import Annotated
+from wireup import Inject, Injected, inject_from_container
+from wireup.ioc.parameter import ParameterBag
+
+
+@wireup.service(lifetime="transient")
+class Settings:
+    def __init__(
+        self,
+        env: Annotated[str, Inject(param="env")],
+        url: Annotated[str, Inject(expr="https://${env}.example.com")],
+    ) -> None:
+        self.env = env
+        self.url = url
+
+
+@pytest.mark.parametrize("create_container", [wireup.create_sync_container, wireup.create_async_container])
+def test_constant_parameters_are_injected(create_container: Callable[..., Any]) -> None:
+    container = create_container(services=[Settings], parameters={"env": "prod"}, constant_parameters=True)
+
+    @inject_from_container(container)
+    def target(settings: Injected[Settings]) -> Settings:
+        return settings
+
+    settings = target()
+
+    assert settings.env == "prod"
+    assert settings.url == "https://prod.example.com"
+
+
+def test_constant_parameters_are_copied_on_creation() -> None:
+    parameters = {"env": "prod"}
+    container = wireup.create_sync_container(services=[Settings], parameters=parameters, constant_parameters=True)
+
+    @inject_from_container(container)
+    def target(env: Annotated[str, Inject(param="env")]) -> str:
+        return env
+
+    parameters["env"] = "dev"
+
+    with container.enter_scope() as scope:
+        assert scope.get(Settings).env == "prod"
+
+    assert target() == "prod"
+    assert container.params.get("env") == "prod"
+
+
+def test_parameter_bag_references_values_unless_constant() -> None:
+    values = {"env": "prod"}
+    bag, constant_bag = ParameterBag(values), ParameterBag(values, constant=True)
+    values["env"] = "dev"
+
+    assert not bag.constant
+    assert bag.get("env") == "dev"
+    assert constant_bag.constant
+    assert constant_bag.get("env") == "prod"
+
+
+def test_constant_parameters_are_not_written_to_compile_cache(tmp_path: Path) -> None:
+    for env in ("secret-value", "other-value"):
+        container = wireup.create_sync_container(
+            services=[Settings], parameters={"env": env}, constant_parameters=True, compile_cache_dir=tmp_path
+        )
+
+        with container.enter_scope() as scope:
+            assert scope.get(Settings).env == env
+
+    assert all(b"secret-value" not in file.read_bytes() for file in tmp_path.glob("*.wireup"))
+
+
+def test_constant_parameters_resolve_expressions_on_creation() -> None:
+    container = wireup.create_sync_container(services=[Settings], parameters={"env": "prod"}, constant_parameters=True)
+
+    assert container.params._ParameterBag__cache == {"https://${env}.example.com": "https://prod.example.com"}  # type: ignore[attr-defined]
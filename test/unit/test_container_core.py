@@ -15,6 +15,7 @@ from wireup.errors import (
     UnknownServiceRequestedError,
     WireupError,
 )
+from wireup.ioc.service_registry import ServiceRegistry
 
 from test.unit import service_refs, services
 from test.unit.services.abstract_multiple_bases import FooBase, FooBaseAnother
@@ -284,3 +285,75 @@ def test_container_deduplicates_services_from_multiple_modules() -> None:
     # This should not result in a duplicate error since the container should deduplicate classes
     # when imported from multiple modules.
     wireup.create_async_container(service_modules=[services, service_refs], parameters={"env_name": "test"})
+
+
+def test_container_shares_instance_between_interface_and_impl() -> None:
+    container = wireup.create_sync_container(services=[Foo, FooImpl])
+
+    with container.enter_scope() as scoped:
+        assert scoped.get(Foo) is scoped.get(FooImpl) is container.get(FooImpl)
+
+
+def test_container_extend_registers_services_in_existing_scopes() -> None:
+    @wireup.service
+    class Late:
+        def __init__(self, foo: Foo) -> None:
+            self.foo = foo
+
+    container = wireup.create_sync_container(services=[Foo, FooImpl])
+
+    with container.enter_scope() as scoped:
+        container._extend([Late.__wireup_registration__])  # type: ignore[attr-defined]
+
+        assert scoped.get(Late) is container.get(Late)
+        assert scoped.get(Late).foo is container.get(Foo)
+
+
+def test_container_extend_registers_scoped_services_in_existing_scopes() -> None:
+    @wireup.service(lifetime="scoped")
+    class LateScoped:
+        def __init__(self, foo: Foo) -> None:
+            self.foo = foo
+
+    container = wireup.create_sync_container(services=[Foo, FooImpl])
+
+    with container.enter_scope() as scoped:
+        container._extend([LateScoped.__wireup_registration__])  # type: ignore[attr-defined]
+
+        assert scoped.get(LateScoped) is scoped.get(LateScoped)
+        assert scoped.get(LateScoped).foo is container.get(Foo)
+
+    with container.enter_scope() as scoped:
+        assert isinstance(scoped.get(LateScoped), LateScoped)
+
+
+def test_container_extend_only_validates_new_services(monkeypatch: pytest.MonkeyPatch) -> None:
+    @wireup.service
+    class Late:
+        def __init__(self, foo: Foo) -> None:
+            self.foo = foo
+
+    container = wireup.create_sync_container(services=[Foo, FooImpl])
+    validated: list[Any] = []
+    original = ServiceRegistry.get_service_dependencies
+
+    def _get_service_dependencies(self: ServiceRegistry, obj_id: Any) -> Any:
+        validated.append(obj_id)
+        return original(self, obj_id)
+
+    monkeypatch.setattr(ServiceRegistry, "get_service_dependencies", _get_service_dependencies)
+    container._extend([Late.__wireup_registration__])  # type: ignore[attr-defined]
+
+    assert validated == [(Late, None)]
+    assert isinstance(container.get(Late).foo, FooImpl)
+
+
+def test_container_extend_rejects_invalid_batch() -> None:
+    @wireup.service
+    class Late:
+        def __init__(self, unknown: RandomService) -> None: ...
+
+    container = wireup.create_sync_container(services=[Foo, FooImpl])
+
+    with pytest.raises(WireupError, match="depends on an unknown service"):
+        container._extend([Late.__wireup_registration__])  # type: ignore[attr-defined]
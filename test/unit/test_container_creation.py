@@ -1,5 +1,7 @@
+import inspect
 import re
 from dataclasses import dataclass
+from typing import Any
 
 import pytest
 import wireup
@@ -143,6 +145,72 @@ def test_validates_container_raises_when_cyclical_dependencies() -> None:
         wireup.create_sync_container(services=[make_foo, make_bar])
 
 
+def test_validates_container_raises_when_service_depends_on_itself() -> None:
+    class Foo: ...
+
+    @wireup.service
+    def make_foo(foo: Foo) -> Foo:
+        return foo
+
+    with pytest.raises(
+        WireupError,
+        match=re.escape(
+            "Circular dependency detected for test.unit.test_container_creation.Foo "
+            "(created via test.unit.test_container_creation.make_foo)"
+            "\n -> test.unit.test_container_creation.Foo (created via test.unit.test_container_creation.make_foo)"
+            " ! Cycle here"
+        ),
+    ):
+        wireup.create_sync_container(services=[make_foo])
+
+
+def test_validates_container_raises_when_cyclical_dependencies_via_interface() -> None:
+    @abstract
+    class Base: ...
+
+    class Foo(Base): ...
+
+    class Bar: ...
+
+    @wireup.service
+    def make_foo(_bar: Bar) -> Foo:
+        return Foo()
+
+    @wireup.service
+    def make_bar(_base: Base) -> Bar:
+        return Bar()
+
+    with pytest.raises(WireupError, match="Circular dependency detected"):
+        wireup.create_sync_container(services=[Base, make_foo, make_bar])
+
+
+def test_validates_deep_diamond_dependency_graph() -> None:
+    @wireup.service
+    async def make_root() -> RandomService:
+        return RandomService()
+
+    services: list[Any] = [make_root]
+    types: list[type] = [RandomService]
+    for i in range(1500):
+        # Each service depends on the two before it, which doubles the number of paths through the graph every time.
+        params = [
+            inspect.Parameter("self", inspect.Parameter.POSITIONAL_ONLY),
+            *(
+                inspect.Parameter(f"dep{n}", inspect.Parameter.KEYWORD_ONLY, annotation=t)
+                for n, t in enumerate(types[-2:])
+            ),
+        ]
+        init = lambda _self, **_: None  # noqa: E731
+        init.__signature__ = inspect.Signature(params)
+        types.append(type(f"Service{i}", (), {"__init__": init}))
+        services.append(wireup.service(types[-1]))
+
+    container = wireup.create_async_container(services=services, lazy_compilation=True)
+
+    assert container._registry.factories[services[-1], None].is_async
+    assert container._registry.depths[services[-1], None] == 1500
+
+
 def test_validates_container_does_not_raise_when_no_dependency_cycle() -> None:
     class Foo:
         def __init__(self, bar): ...
@@ -209,3 +277,31 @@ def test_registers_abstract() -> None:
 
     container = wireup.create_sync_container(services=[Foo, FooImpl])
     assert isinstance(container.get(Foo), FooImpl)
+
+
+@wireup.service
+class Settings: ...
+
+
+@wireup.service(lifetime="scoped")
+class Session:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+def test_singleton_factories_are_compiled_once_for_both_compilers() -> None:
+    container = wireup.create_sync_container(services=[Settings, Session])
+    singleton_id = hash(Settings)
+
+    assert (
+        container._compiler.factories[singleton_id].factory.__code__
+        is container._scoped_compiler.factories[singleton_id].factory.__code__
+    )
+    assert container._compiler._code_cache == {}
+
+
+def test_base_container_raises_for_scoped_services() -> None:
+    container = wireup.create_sync_container(services=[Settings, Session])
+
+    with pytest.raises(WireupError, match="Please enter a scope using container.enter_scope"):
+        container.get(Session)
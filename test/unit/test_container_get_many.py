@@ -0,0 +1,86 @@
+import dataclasses
+
+import pytest
+import wireup
+from wireup.errors import UnknownServiceRequestedError, WireupError
+from wireup.ioc.factory_compiler import FactoryCompiler
+
+from test.conftest import Container
+from test.unit.services.no_annotations.random.random_service import RandomService
+from test.unit.services.with_annotations.env import EnvService
+from test.unit.services.with_annotations.services import Foo, FooImpl, OtherFooImpl, ScopedService
+from test.unit.util import run
+
+
+class AsyncService: ...
+
+
+@wireup.service
+async def async_service_factory() -> AsyncService:
+    return AsyncService()
+
+
+async def test_get_many(container: Container) -> None:
+    env, foo, other_foo, random = await run(
+        container.get_many([EnvService, Foo, (Foo, "other"), (RandomService, "foo")])
+    )
+
+    assert isinstance(env, EnvService)
+    assert isinstance(foo, FooImpl)
+    assert isinstance(other_foo, OtherFooImpl)
+    assert isinstance(random, RandomService)
+    assert env is await run(container.get(EnvService))
+    assert foo is await run(container.get(Foo))
+
+
+async def test_get_many_empty(container: Container) -> None:
+    assert await run(container.get_many([])) == ()
+
+
+async def test_get_many_in_scope(container: Container) -> None:
+    if isinstance(container, wireup.SyncContainer):
+        with container.enter_scope() as scope:
+            scoped, foo = scope.get_many([ScopedService, Foo])
+            assert scoped is scope.get(ScopedService)
+    else:
+        async with container.enter_scope() as scope:
+            scoped, foo = await scope.get_many([ScopedService, Foo])
+            assert scoped is await scope.get(ScopedService)
+
+    assert isinstance(foo, FooImpl)
+
+
+async def test_get_many_unknown_service_raises(container: Container) -> None:
+    with pytest.raises(UnknownServiceRequestedError):
+        await run(container.get_many([EnvService, (RandomService, "unknown")]))
+
+
+def test_get_many_sync_container_async_service_raises() -> None:
+    container = wireup.create_sync_container(services=[async_service_factory])
+
+    with pytest.raises(WireupError, match="is an async dependency"):
+        container.get_many([AsyncService])
+
+
+async def test_get_many_async_container_async_services() -> None:
+    container = wireup.create_async_container(services=[async_service_factory, Foo, FooImpl])
+
+    async_service, foo = await container.get_many([AsyncService, Foo])
+
+    assert isinstance(async_service, AsyncService)
+    assert (async_service, foo) == await container.get_many([AsyncService, Foo])
+
+
+async def test_created_async_singletons_are_returned_without_calling_factory() -> None:
+    container = wireup.create_async_container(services=[async_service_factory])
+    await container.warmup()
+    async_service = await container.get(AsyncService)
+
+    def _fail(_: object) -> None:
+        pytest.fail("Created singletons must be returned from storage.")
+
+    obj_id = FactoryCompiler.get_object_id(AsyncService, None)
+    container._factories[obj_id] = dataclasses.replace(container._factories[obj_id], factory=_fail)
+
+    assert await container.get_many([AsyncService]) == (async_service,)
+    assert await container.get(AsyncService) is async_service
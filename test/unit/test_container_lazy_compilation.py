@@ -0,0 +1,88 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+import wireup
+from wireup.errors import WireupError
+
+from test.unit.services.with_annotations.services import Foo, FooImpl
+
+
+class Settings: ...
+
+
+class Repository:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class Unused: ...
+
+
+def _is_compiled(container: wireup.SyncContainer, klass: type) -> bool:
+    return container._factories[hash(klass)].factory.__name__ not in {"_stub", "_async_stub"}
+
+
+def test_lazy_container_compiles_only_requested_services() -> None:
+    container = wireup.create_sync_container(
+        services=[wireup.service(Settings), wireup.service(Repository), wireup.service(Unused)],
+        lazy_compilation=True,
+    )
+
+    assert not _is_compiled(container, Repository)
+
+    repository = container.get(Repository)
+
+    assert repository.settings is container.get(Settings)
+    assert _is_compiled(container, Repository)
+    assert not _is_compiled(container, Unused)
+
+
+def test_lazy_container_still_validates_registrations() -> None:
+    with pytest.raises(WireupError, match="depends on an unknown service"):
+        wireup.create_sync_container(services=[wireup.service(Repository)], lazy_compilation=True)
+
+
+async def test_lazy_async_container_resolves_async_dependencies() -> None:
+    @wireup.service
+    async def settings_factory() -> Settings:
+        return Settings()
+
+    container = wireup.create_async_container(
+        services=[settings_factory, wireup.service(lifetime="scoped")(Repository)],
+        lazy_compilation=True,
+    )
+
+    async with container.enter_scope() as scoped:
+        repository = await scoped.get(Repository)
+
+    assert repository.settings is await container.get(Settings)
+
+
+def test_lazy_container_override_before_first_use() -> None:
+    container = wireup.create_sync_container(services=[Foo, FooImpl], lazy_compilation=True)
+    foo_mock = MagicMock()
+
+    with container.override.service(Foo, new=foo_mock):
+        assert container.get(Foo) is foo_mock
+
+    assert isinstance(container.get(Foo), FooImpl)
+
+
+def test_lazy_container_compiles_once_when_called_from_many_threads() -> None:
+    container = wireup.create_sync_container(
+        services=[wireup.service(Settings), wireup.service(Repository)],
+        lazy_compilation=True,
+        thread_safe=True,
+    )
+    barrier = threading.Barrier(16)
+
+    def _get() -> Repository:
+        barrier.wait()
+        return container.get(Repository)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(lambda _: _get(), range(16)))
+
+    assert all(res is results[0] for res in results)
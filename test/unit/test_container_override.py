@@ -3,7 +3,8 @@ from unittest.mock import MagicMock
 
 import pytest
 import wireup
-from wireup._annotations import Injected
+from typing_extensions import Annotated
+from wireup._annotations import Inject, Injected
 from wireup.errors import UnknownOverrideRequestedError
 from wireup.ioc.types import ServiceOverride
 
@@ -91,3 +92,54 @@ async def test_overrides_async_dependency() -> None:
 
     res = await container.get(FooBar)
     assert res.foo == "bar"
+
+
+async def test_overrides_async_dependency_of_other_service() -> None:
+    @wireup.service
+    async def async_foo_factory() -> FooBar:
+        return FooBar()
+
+    @wireup.service(lifetime="transient")
+    class FooBarConsumer:
+        def __init__(self, foo: FooBar) -> None:
+            self.foo = foo
+
+    container = wireup.create_async_container(services=[async_foo_factory, FooBarConsumer])
+
+    foo_mock = MagicMock()
+
+    with container.override.service(target=FooBar, new=foo_mock):
+        async with container.enter_scope() as scoped:
+            assert (await scoped.get(FooBarConsumer)).foo is foo_mock
+
+    async with container.enter_scope() as scoped:
+        assert (await scoped.get(FooBarConsumer)).foo.foo == "bar"
+
+
+def test_override_relinks_transitive_dependents() -> None:
+    @wireup.service(lifetime="transient")
+    class Consumer:
+        def __init__(self, random: Annotated[RandomService, Inject(qualifier="foo")]) -> None:
+            self.random = random
+
+    container = wireup.create_sync_container(services=[random_service_factory, Consumer])
+    random_mock = MagicMock()
+
+    with container.enter_scope() as scoped:
+        with container.override.service(target=RandomService, qualifier="foo", new=random_mock):
+            assert scoped.get(Consumer).random is random_mock
+
+        assert scoped.get(Consumer).random is not random_mock
+
+
+def test_override_clear_restores_all() -> None:
+    container = wireup.create_sync_container(services=[Foo, FooImpl, random_service_factory])
+    foo_mock = MagicMock()
+    random_mock = MagicMock()
+
+    container.override.set(Foo, foo_mock)
+    container.override.set(RandomService, random_mock, qualifier="foo")
+    container.override.clear()
+
+    assert isinstance(container.get(Foo), FooImpl)
+    assert container.get(RandomService, qualifier="foo") is not random_mock
@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock
+
+import pytest
+import wireup
+from wireup.errors import UnknownServiceRequestedError, WireupError
+
+from test.unit.services.no_annotations.random.random_service import RandomService
+from test.unit.services.with_annotations.services import Foo, FooImpl, ScopedService, TransientService
+
+
+class AsyncService: ...
+
+
+@wireup.service
+async def async_service_factory() -> AsyncService:
+    return AsyncService()
+
+
+def test_resolver_sync_container() -> None:
+    container = wireup.create_sync_container(services=[Foo, FooImpl, ScopedService, TransientService])
+    resolve_foo = container.resolver(Foo)
+    resolve_scoped = container.resolver(ScopedService)
+    resolve_transient = container.resolver(TransientService)
+
+    assert resolve_foo(container) is container.get(Foo)
+    assert isinstance(resolve_foo(container), FooImpl)
+
+    with container.enter_scope() as scope:
+        assert resolve_foo(scope) is container.get(Foo)
+        assert resolve_scoped(scope) is scope.get(ScopedService)
+        assert resolve_transient(scope) is not resolve_transient(scope)
+
+    with container.enter_scope() as scope:
+        assert resolve_scoped(scope) is scope.get(ScopedService)
+
+
+def test_resolver_scoped_service_requires_scope() -> None:
+    container = wireup.create_sync_container(services=[ScopedService])
+    resolve = container.resolver(ScopedService)
+
+    with pytest.raises(WireupError, match="Cannot create 'transient' or 'scoped' lifetime objects"):
+        resolve(container)
+
+
+def test_resolver_unknown_service_raises() -> None:
+    container = wireup.create_sync_container()
+
+    with pytest.raises(UnknownServiceRequestedError):
+        container.resolver(RandomService)
+
+
+def test_resolver_sync_container_async_service_raises() -> None:
+    container = wireup.create_sync_container(services=[async_service_factory])
+
+    with pytest.raises(WireupError, match="is an async dependency"):
+        container.resolver(AsyncService)
+
+
+async def test_resolver_async_container() -> None:
+    container = wireup.create_async_container(services=[async_service_factory, Foo, FooImpl])
+    resolve_async = container.resolver(AsyncService)
+    resolve_foo = container.resolver(Foo)
+
+    async with container.enter_scope() as scope:
+        assert await resolve_async(scope) is await container.get(AsyncService)
+        assert resolve_foo(scope) is await container.get(Foo)
+
+
+async def test_resolver_respects_overrides() -> None:
+    container = wireup.create_async_container(services=[async_service_factory, Foo, FooImpl])
+    resolve_async = container.resolver(AsyncService)
+    resolve_foo = container.resolver(Foo)
+    async_mock = MagicMock()
+    foo_mock = MagicMock()
+
+    with container.override.services(
+        [wireup.ServiceOverride(AsyncService, async_mock), wireup.ServiceOverride(Foo, foo_mock)]
+    ):
+        assert await resolve_async(container) is async_mock
+        assert resolve_foo(container) is foo_mock
+
+    assert isinstance(await resolve_async(container), AsyncService)
+    assert isinstance(resolve_foo(container), FooImpl)
+
+
+def test_resolver_follows_lazily_compiled_and_overridden_factories() -> None:
+    container = wireup.create_sync_container(services=[Foo, FooImpl, TransientService], lazy_compilation=True)
+    resolve_foo = container.resolver(Foo)
+    resolve_transient = container.resolver(TransientService)
+    foo_mock = MagicMock()
+
+    with container.enter_scope() as scope:
+        assert isinstance(resolve_transient(scope), TransientService)
+
+        with container.override.service(Foo, foo_mock):
+            assert resolve_foo(scope) is foo_mock
+            assert resolve_foo(container) is foo_mock
+
+        assert resolve_foo(scope) is container.get(Foo)
+
+    with pytest.raises(WireupError, match="Cannot create 'transient' or 'scoped' lifetime objects"):
+        resolve_transient(container)
@@ -0,0 +1,69 @@
+import logging
+
+import pytest
+import wireup
+from wireup._discovery import discover_wireup_registrations
+from wireup.errors import UnknownServiceRequestedError
+from wireup.ioc.parameter import ParameterBag
+from wireup.ioc.service_registry import ServiceRegistry
+
+from test.unit import services
+from test.unit.services.no_annotations.random.random_service import RandomService
+from test.unit.services.no_annotations.random.truly_random_service import TrulyRandomService
+from test.unit.services.with_annotations.env import EnvService
+from test.unit.services.with_annotations.services import Foo, FooImpl
+
+
+def test_roots_only_register_reachable_services() -> None:
+    container = wireup.create_sync_container(service_modules=[services], parameters={"env_name": "test"}, roots=[Foo])
+
+    assert isinstance(container.get(Foo), FooImpl)
+    assert container.get(FooImpl) is container.get(Foo)
+
+    with pytest.raises(UnknownServiceRequestedError):
+        container.get(EnvService)
+
+
+async def test_roots_include_dependencies_of_roots() -> None:
+    container = wireup.create_async_container(
+        service_modules=[services], parameters={"env_name": "test"}, roots=[(TrulyRandomService, "foo")]
+    )
+
+    truly_random = await container.get(TrulyRandomService, qualifier="foo")
+    assert truly_random.random_service is await container.get(RandomService, qualifier="foo")
+
+    with pytest.raises(UnknownServiceRequestedError):
+        await container.get(Foo)
+
+
+def test_roots_must_be_registered() -> None:
+    with pytest.raises(UnknownServiceRequestedError):
+        wireup.create_sync_container(services=[Foo, FooImpl], roots=[RandomService])
+
+
+def test_roots_report_unreachable_services(caplog: pytest.LogCaptureFixture) -> None:
+    @wireup.service
+    class Unused: ...
+
+    with caplog.at_level(logging.INFO, logger="wireup"):
+        wireup.create_sync_container(services=[Foo, FooImpl, Unused], roots=[Foo])
+
+    assert "Skipped 1 services not reachable from roots" in caplog.text
+    assert "Unused" in caplog.text
+
+
+def test_restricted_registry_matches_registry_of_reachable_services() -> None:
+    abstracts, impls = discover_wireup_registrations([services])
+    registry = ServiceRegistry(parameters=ParameterBag({"env_name": "test"}), abstracts=abstracts, impls=impls)
+    reachable = registry.get_reachable([(TrulyRandomService, "foo"), (Foo, None)])
+    reachable_factories = {(registry.factories[obj_id].factory, obj_id[1]) for obj_id in reachable}
+
+    restricted = registry.restrict(reachable)
+    expected = ServiceRegistry(
+        parameters=registry.parameters,
+        abstracts=abstracts,
+        impls=[impl for impl in impls if (impl.obj, impl.qualifier) in reachable_factories],
+    )
+
+    for name in ServiceRegistry.__slots__:
+        assert getattr(restricted, name) == getattr(expected, name), name
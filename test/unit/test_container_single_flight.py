@@ -0,0 +1,120 @@
+import asyncio
+from typing import List
+
+import pytest
+import wireup
+
+
+class Pool: ...
+
+
+class RequestContext: ...
+
+
+async def test_concurrent_get_creates_async_singleton_once() -> None:
+    created: List[Pool] = []
+
+    @wireup.service
+    async def pool_factory() -> Pool:
+        await asyncio.sleep(0.01)
+        created.append(Pool())
+        return created[-1]
+
+    container = wireup.create_async_container(services=[pool_factory])
+
+    async with container.enter_scope() as scope:
+        results = await asyncio.gather(*(container.get(Pool) for _ in range(5)), scope.get(Pool))
+
+    assert len(created) == 1
+    assert all(res is created[0] for res in results)
+
+
+async def test_concurrent_get_creates_async_scoped_service_once_per_scope() -> None:
+    created: List[RequestContext] = []
+
+    @wireup.service(lifetime="scoped")
+    async def request_context_factory() -> RequestContext:
+        await asyncio.sleep(0.01)
+        created.append(RequestContext())
+        return created[-1]
+
+    container = wireup.create_async_container(services=[request_context_factory])
+
+    async def _get_in_new_scope() -> List[RequestContext]:
+        async with container.enter_scope() as scope:
+            return await asyncio.gather(*(scope.get(RequestContext) for _ in range(5)))
+
+    first, second = await asyncio.gather(_get_in_new_scope(), _get_in_new_scope())
+
+    assert len(created) == 2
+    assert all(res is first[0] for res in first)
+    assert all(res is second[0] for res in second)
+    assert first[0] is not second[0]
+
+
+async def test_concurrent_get_propagates_errors_and_retries() -> None:
+    calls = 0
+
+    @wireup.service
+    async def pool_factory() -> Pool:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        if calls == 1:
+            raise ValueError("boom")
+
+        return Pool()
+
+    container = wireup.create_async_container(services=[pool_factory])
+    results = await asyncio.gather(container.get(Pool), container.get(Pool), return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(res, ValueError) for res in results)
+    assert isinstance(await container.get(Pool), Pool)
+    assert calls == 2
+
+
+async def test_cancelling_waiter_does_not_cancel_creation() -> None:
+    @wireup.service
+    async def pool_factory() -> Pool:
+        await asyncio.sleep(0.01)
+        return Pool()
+
+    container = wireup.create_async_container(services=[pool_factory])
+
+    creator = asyncio.ensure_future(container.get(Pool))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(container.get(Pool))
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert await creator is await container.get(Pool)
+
+
+async def test_cancelling_creator_lets_waiters_create_instance() -> None:
+    created: List[Pool] = []
+
+    @wireup.service
+    async def pool_factory() -> Pool:
+        await asyncio.sleep(0.01)
+        created.append(Pool())
+        return created[-1]
+
+    container = wireup.create_async_container(services=[pool_factory])
+
+    creator = asyncio.ensure_future(container.get(Pool))
+    await asyncio.sleep(0)
+    waiters = [asyncio.ensure_future(container.get(Pool)) for _ in range(3)]
+    await asyncio.sleep(0)
+    creator.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await creator
+
+    results = await asyncio.gather(*waiters)
+
+    assert len(created) == 1
+    assert all(res is created[0] for res in results)
@@ -0,0 +1,95 @@
+from typing import List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+import wireup
+from wireup.errors import WireupError
+from wireup.ioc.container.async_container import async_container_force_sync_scope
+
+from test.unit.services.with_annotations.services import Foo, FooImpl
+
+
+class EmptyCollection:
+    def __len__(self) -> int:
+        return 0
+
+
+class Consumer:
+    def __init__(self, collection: EmptyCollection) -> None:
+        self.collection = collection
+
+
+def test_falsy_singleton_is_created_once() -> None:
+    created: List[EmptyCollection] = []
+
+    @wireup.service
+    def collection_factory() -> EmptyCollection:
+        created.append(EmptyCollection())
+        return created[-1]
+
+    container = wireup.create_sync_container(services=[collection_factory, wireup.service(lifetime="scoped")(Consumer)])
+
+    assert container.get(EmptyCollection) is container.get(EmptyCollection)
+
+    with container.enter_scope() as scoped:
+        assert scoped.get(Consumer).collection is scoped.get(EmptyCollection) is created[0]
+
+    assert len(created) == 1
+
+
+def test_none_singleton_is_created_once() -> None:
+    calls = MagicMock()
+
+    @wireup.service
+    def maybe_collection_factory() -> Optional[EmptyCollection]:
+        calls()
+        return None
+
+    container = wireup.create_sync_container(services=[maybe_collection_factory])
+
+    assert container.get(EmptyCollection) is None
+
+    with container.enter_scope() as scoped:
+        assert scoped.get(EmptyCollection) is None
+
+    calls.assert_called_once()
+
+
+def test_override_is_kept_when_singleton_is_created_through_impl() -> None:
+    container = wireup.create_sync_container(services=[Foo, FooImpl])
+    foo_mock = MagicMock()
+
+    with container.override.service(Foo, new=foo_mock):
+        assert isinstance(container.get(FooImpl), FooImpl)
+        assert container.get(Foo) is foo_mock
+
+        with container.enter_scope() as scoped:
+            assert isinstance(scoped.get(FooImpl), FooImpl)
+            assert scoped.get(Foo) is foo_mock
+
+    assert container.get(Foo) is container.get(FooImpl)
+
+
+def test_override_of_created_singleton_is_restored() -> None:
+    container = wireup.create_sync_container(services=[Foo, FooImpl])
+    foo = container.get(Foo)
+
+    with container.override.service(Foo, new=MagicMock()):
+        assert container.get(Foo) is not foo
+
+    assert container.get(Foo) is foo
+
+
+async def test_created_async_singleton_remains_async() -> None:
+    @wireup.service
+    async def collection_factory() -> EmptyCollection:
+        return EmptyCollection()
+
+    container = wireup.create_async_container(services=[collection_factory])
+    collection = await container.get(EmptyCollection)
+
+    async with container.enter_scope() as scoped:
+        assert await scoped.get(EmptyCollection) is collection
+
+    with pytest.raises(WireupError, match="is an async dependency"):
+        async_container_force_sync_scope(container).get(EmptyCollection)
@@ -0,0 +1,153 @@
+import itertools
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+import wireup
+from wireup.ioc.container.async_container import async_container_force_sync_scope
+
+THREAD_COUNT = 64
+
+
+class ConnectionPool: ...
+
+
+class Repository:
+    def __init__(self, pool: ConnectionPool) -> None:
+        self.pool = pool
+
+
+def _hammer(fn: Callable[[], Any]) -> List[Any]:
+    barrier = threading.Barrier(THREAD_COUNT)
+
+    def _run() -> Any:
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        futures = [executor.submit(_run) for _ in range(THREAD_COUNT)]
+
+        return [future.result() for future in futures]
+
+
+def test_thread_safe_singletons_are_created_once() -> None:
+    created: List[type] = []
+
+    @wireup.service
+    def pool_factory() -> ConnectionPool:
+        created.append(ConnectionPool)
+        time.sleep(0.01)
+        return ConnectionPool()
+
+    @wireup.service
+    def repository_factory(pool: ConnectionPool) -> Repository:
+        created.append(Repository)
+        time.sleep(0.01)
+        return Repository(pool)
+
+    container = wireup.create_sync_container(services=[pool_factory, repository_factory], thread_safe=True)
+
+    def _get_in_scope() -> Repository:
+        with container.enter_scope() as scope:
+            return scope.get(Repository)
+
+    results = _hammer(lambda: container.get(Repository)) + _hammer(_get_in_scope)
+
+    assert created == [ConnectionPool, Repository]
+    assert all(res is results[0] for res in results)
+    assert results[0].pool is container.get(ConnectionPool)
+
+
+def test_thread_safe_async_container_sync_singletons_are_created_once() -> None:
+    created: List[type] = []
+
+    @wireup.service
+    def pool_factory() -> ConnectionPool:
+        created.append(ConnectionPool)
+        time.sleep(0.01)
+        return ConnectionPool()
+
+    container = wireup.create_async_container(services=[pool_factory], thread_safe=True)
+
+    def _get_in_sync_scope() -> ConnectionPool:
+        with async_container_force_sync_scope(container) as scope:
+            return scope.get(ConnectionPool)
+
+    results = _hammer(_get_in_sync_scope)
+
+    assert created == [ConnectionPool]
+    assert all(res is results[0] for res in results)
+
+
+def test_thread_safe_scoped_services_are_unaffected() -> None:
+    @wireup.service(lifetime="scoped")
+    class ScopedService: ...
+
+    container = wireup.create_sync_container(services=[ScopedService], thread_safe=True)
+
+    with container.enter_scope() as scope:
+        assert scope.get(ScopedService) is scope.get(ScopedService)
+
+
+def test_lazily_compiled_singletons_are_created_once_from_root_and_scopes() -> None:
+    # Switch threads as often as possible so that both compilers are likely to compile the singleton at once.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        for _ in range(50):
+            _assert_lazily_compiled_singleton_created_once()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def _assert_lazily_compiled_singleton_created_once() -> None:
+    created: List[type] = []
+
+    @wireup.service
+    def pool_factory() -> ConnectionPool:
+        created.append(ConnectionPool)
+        time.sleep(0.001)
+        return ConnectionPool()
+
+    container = wireup.create_sync_container(services=[pool_factory], thread_safe=True, lazy_compilation=True)
+    calls = itertools.count()
+
+    def _get_from_root_or_scope() -> ConnectionPool:
+        if next(calls) % 2:
+            return container.get(ConnectionPool)
+
+        with container.enter_scope() as scope:
+            return scope.get(ConnectionPool)
+
+    results = _hammer(_get_from_root_or_scope)
+
+    assert created == [ConnectionPool]
+    assert all(res is results[0] for res in results)
+
+
+def test_resolvers_and_lazy_factories_are_created_concurrently() -> None:
+    # Switch threads as often as possible so that threads are likely to generate code at once.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        for _ in range(20):
+            _assert_resolvers_created_concurrently()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def _assert_resolvers_created_concurrently() -> None:
+    container = wireup.create_sync_container(
+        services=[wireup.service(ConnectionPool), wireup.service(Repository)], thread_safe=True, lazy_compilation=True
+    )
+    calls = itertools.count()
+
+    def _resolve() -> Any:
+        klass = Repository if next(calls) % 2 else ConnectionPool
+        return klass, container.resolver(klass)(container)
+
+    assert all(isinstance(res, klass) for klass, res in _hammer(_resolve))
@@ -0,0 +1,132 @@
+import asyncio
+from typing import List
+
+import pytest
+import wireup
+from wireup.errors import UnknownServiceRequestedError
+
+
+class DbPool: ...
+
+
+class HttpClient: ...
+
+
+class Cache: ...
+
+
+class Repository:
+    def __init__(self, db: DbPool, cache: Cache) -> None:
+        self.db = db
+        self.cache = cache
+
+
+async def test_warmup_creates_independent_async_singletons_concurrently() -> None:
+    db_started = asyncio.Event()
+    http_started = asyncio.Event()
+
+    @wireup.service
+    async def db_pool_factory() -> DbPool:
+        db_started.set()
+        await http_started.wait()
+        return DbPool()
+
+    @wireup.service
+    async def http_client_factory() -> HttpClient:
+        http_started.set()
+        await db_started.wait()
+        return HttpClient()
+
+    container = wireup.create_async_container(services=[db_pool_factory, http_client_factory])
+
+    await asyncio.wait_for(container.warmup(), timeout=1)
+
+    assert await container.get(DbPool) is await container.get(DbPool)
+    assert await container.get(HttpClient) is await container.get(HttpClient)
+
+
+async def test_warmup_creates_dependencies_before_dependents() -> None:
+    created: List[type] = []
+
+    @wireup.service
+    async def db_pool_factory() -> DbPool:
+        await asyncio.sleep(0)
+        created.append(DbPool)
+        return DbPool()
+
+    @wireup.service
+    def cache_factory() -> Cache:
+        created.append(Cache)
+        return Cache()
+
+    @wireup.service
+    def repository_factory(db: DbPool, cache: Cache) -> Repository:
+        created.append(Repository)
+        return Repository(db, cache)
+
+    container = wireup.create_async_container(services=[repository_factory, db_pool_factory, cache_factory])
+    await container.warmup()
+
+    assert created[-1] is Repository
+    assert set(created) == {DbPool, Cache, Repository}
+
+    repository = await container.get(Repository)
+    assert repository.db is await container.get(DbPool)
+    assert created.count(Repository) == 1
+
+
+async def test_warmup_roots_only_creates_reachable_singletons() -> None:
+    created: List[type] = []
+
+    @wireup.service
+    def db_pool_factory() -> DbPool:
+        created.append(DbPool)
+        return DbPool()
+
+    @wireup.service
+    def http_client_factory() -> HttpClient:
+        created.append(HttpClient)
+        return HttpClient()
+
+    @wireup.service(lifetime="scoped")
+    def cache_factory(_db: DbPool) -> Cache:
+        created.append(Cache)
+        return Cache()
+
+    container = wireup.create_async_container(services=[db_pool_factory, http_client_factory, cache_factory])
+    await container.warmup([Cache])
+
+    assert created == [DbPool]
+
+
+async def test_warmup_unknown_root_raises() -> None:
+    container = wireup.create_async_container()
+
+    with pytest.raises(UnknownServiceRequestedError):
+        await container.warmup([DbPool])
+
+
+async def test_warmup_cancels_siblings_on_error() -> None:
+    cancelled = False
+
+    @wireup.service
+    async def db_pool_factory() -> DbPool:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return DbPool()
+
+    @wireup.service
+    async def http_client_factory() -> HttpClient:
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    container = wireup.create_async_container(services=[db_pool_factory, http_client_factory])
+
+    with pytest.raises(ValueError, match="boom"):
+        await container.warmup()
+
+    assert cancelled
@@ -0,0 +1,64 @@
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterator, Set
+
+import pytest
+from wireup import _discovery
+from wireup._discovery import discover_wireup_registrations
+
+from test.unit import services
+
+
+@pytest.fixture
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    root = tmp_path / "src"
+    (root / "manifest_pkg").mkdir(parents=True)
+    (root / "manifest_pkg" / "__init__.py").write_text("")
+    (root / "manifest_pkg" / "services.py").write_text("import wireup\n\n@wireup.service\nclass First: ...\n")
+    (root / "manifest_pkg" / "unrelated.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(root))
+
+    yield root / "manifest_pkg"
+
+    for name in [name for name in sys.modules if name.startswith("manifest_pkg")]:
+        del sys.modules[name]
+
+
+def _discover(module: ModuleType, manifest_dir: Path) -> Set[str]:
+    _, impls = discover_wireup_registrations([module], manifest_dir=manifest_dir)
+    return {impl.obj.__qualname__ for impl in impls}
+
+
+def test_manifest_is_used_by_later_discovery(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    expected = discover_wireup_registrations([services])
+    discover_wireup_registrations([services], manifest_dir=tmp_path)
+
+    def _fail(*_: Any, **__: Any) -> None:
+        pytest.fail("Modules must not be scanned while the manifest is valid.")
+
+    monkeypatch.setattr(_discovery, "_find_objects_in_module", _fail)
+    abstracts, impls = discover_wireup_registrations([services], manifest_dir=tmp_path)
+
+    assert {abstract.obj for abstract in abstracts} == {abstract.obj for abstract in expected[0]}
+    assert {impl.obj for impl in impls} == {impl.obj for impl in expected[1]}
+
+
+@pytest.mark.usefixtures("package")
+def test_manifest_only_imports_modules_declaring_services(tmp_path: Path) -> None:
+    _discover(importlib.import_module("manifest_pkg"), tmp_path)
+    del sys.modules["manifest_pkg.unrelated"]
+
+    assert _discover(importlib.import_module("manifest_pkg"), tmp_path) == {"First"}
+    assert "manifest_pkg.unrelated" not in sys.modules
+
+
+def test_manifest_is_invalidated_by_new_files(package: Path, tmp_path: Path) -> None:
+    module = importlib.import_module("manifest_pkg")
+    assert _discover(module, tmp_path) == {"First"}
+
+    (package / "more.py").write_text("import wireup\n\n@wireup.service\nclass Second: ...\n")
+    importlib.invalidate_caches()
+
+    assert _discover(module, tmp_path) == {"First", "Second"}
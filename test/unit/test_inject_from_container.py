@@ -1,17 +1,27 @@
+import contextlib
 import re
-from typing import Optional
+from typing import Any, Iterator, List, Optional
 
 import pytest
 import wireup
 from typing_extensions import Annotated
 from wireup import Inject, inject_from_container
 from wireup._annotations import Injected
-from wireup.errors import WireupError
+from wireup._decorators import inject_from_container_unchecked, inject_from_container_util
+from wireup.errors import UnknownServiceRequestedError, WireupError
+from wireup.ioc.container.sync_container import ScopedSyncContainer
+from wireup.ioc.util import get_inject_annotated_parameters
 
 from test.conftest import Container
 from test.unit import services
 from test.unit.services.no_annotations.random.random_service import RandomService
-from test.unit.services.with_annotations.services import Foo, FooImpl, OtherFooImpl, random_service_factory
+from test.unit.services.with_annotations.services import (
+    Foo,
+    FooImpl,
+    OtherFooImpl,
+    ScopedService,
+    random_service_factory,
+)
 
 
 async def test_injects_targets(container: Container) -> None:
@@ -223,3 +233,123 @@ def test_inject_from_container_handles_optionals() -> None:
         assert isinstance(thing, Thing)
 
     main()
+
+
+def test_sync_target_raises_on_async_service_unless_overridden() -> None:
+    class Client: ...
+
+    async def make_client() -> Client:
+        return Client()
+
+    container = wireup.create_async_container(services=[wireup.service(make_client)])
+
+    @inject_from_container(container)
+    def target(client: Injected[Client]) -> Client:
+        return client
+
+    with pytest.raises(WireupError, match="is an async dependency"):
+        target()
+
+    client = Client()
+    with container.override.service(Client, new=client):
+        assert target() is client
+
+
+def test_targets_of_same_shape_share_generated_code() -> None:
+    container = wireup.create_sync_container(service_modules=[services], parameters={"env_name": "test"})
+
+    @inject_from_container(container)
+    def first(foo: Injected[Foo], env_name: Annotated[str, Inject(param="env_name")]) -> None: ...
+
+    @inject_from_container(container)
+    def second(foo: Annotated[Foo, Inject(qualifier="other")], env_name: Annotated[str, Inject(param="env_name")]):
+        assert isinstance(foo, OtherFooImpl)
+        assert env_name == "test"
+
+    assert first.__code__ is second.__code__
+    second()
+
+
+def test_unchecked_target_raises_on_unknown_service() -> None:
+    class NotManagedByWireup: ...
+
+    container = wireup.create_sync_container(service_modules=[services], parameters={"env_name": "test"})
+
+    @inject_from_container_unchecked(container.enter_scope)
+    def target(_: Injected[NotManagedByWireup]) -> None: ...
+
+    with pytest.raises(UnknownServiceRequestedError):
+        target()
+
+
+def test_singleton_only_targets_do_not_enter_scope(monkeypatch: pytest.MonkeyPatch) -> None:
+    container = wireup.create_sync_container(service_modules=[services], parameters={"env_name": "test"})
+
+    def _fail(*_: Any) -> None:
+        pytest.fail("Targets injecting only singletons must not enter a scope.")
+
+    monkeypatch.setattr(container, "enter_scope", _fail)
+
+    @inject_from_container(container, scoped_container_supplier=_fail)
+    def target(foo: Injected[Foo], env_name: Annotated[str, Inject(param="env_name")]) -> Foo:
+        assert env_name == "test"
+        return foo
+
+    assert target() is container.get(Foo)
+
+    with container.override.service(Foo, new="overridden"):
+        assert target() == "overridden"
+
+
+def test_targets_with_scoped_services_or_middleware_enter_scope() -> None:
+    container = wireup.create_sync_container(service_modules=[services], parameters={"env_name": "test"})
+    scopes: List[Any] = []
+
+    @contextlib.contextmanager
+    def middleware(scope: Any, *_: Any) -> Iterator[None]:
+        scopes.append(scope)
+        yield
+
+    @inject_from_container(container, middleware=middleware)
+    def singletons_only(_: Injected[Foo]) -> None: ...
+
+    @inject_from_container(container)
+    def scoped(scoped_service: Injected[ScopedService]) -> ScopedService:
+        return scoped_service
+
+    singletons_only()
+    assert isinstance(scopes[0], ScopedSyncContainer)
+    assert scoped() is not scoped()
+
+
+def test_middleware_receives_keyword_arguments_without_injected_values() -> None:
+    container = wireup.create_sync_container(service_modules=[services], parameters={"env_name": "test"})
+    seen: List[Any] = []
+
+    @contextlib.contextmanager
+    def middleware(_: Any, __: Any, kwargs: Any) -> Iterator[None]:
+        yield
+        seen.append(kwargs)
+
+    @inject_from_container(container, middleware=middleware)
+    def target(extra: int, foo: Injected[Foo], env_name: Annotated[str, Inject(param="env_name")]) -> None:
+        assert extra == 1
+        assert isinstance(foo, Foo)
+        assert env_name == "test"
+
+    target(extra=1)
+
+    assert seen == [{"extra": 1}]
+
+
+def test_injects_in_order_of_parameters() -> None:
+    container = wireup.create_sync_container(service_modules=[services], parameters={"env_name": "test"})
+
+    def target(env_name: Annotated[str, Inject(param="env_name")], foo: Injected[Foo]) -> None: ...
+
+    def record(**kwargs: Any) -> List[str]:
+        return list(kwargs)
+
+    wrapper = inject_from_container_util(record, get_inject_annotated_parameters(target), container)
+
+    assert wrapper(extra=1) == ["extra", "env_name", "foo"]
@@ -50,3 +50,29 @@ def test_cache_interpolated_values():
     assert bag.get(templated_string) == "value1"
     assert templated_string.value in bag._ParameterBag__cache  # type: ignore[reportAttributeAccessIssue]
     assert bag._ParameterBag__cache[templated_string.value] == "value1"  # type: ignore[reportAttributeAccessIssue]
+
+
+def test_freeze_copies_values():
+    values = {"param1": "value1"}
+    bag = ParameterBag(values)
+    assert bag.get(TemplatedString("${param1}")) == "value1"
+
+    values["param1"] = "value2"
+    bag.freeze()
+    values["param1"] = "value3"
+
+    assert bag.constant
+    assert bag.get("param1") == "value2"
+    # Interpolated values from before freezing are discarded, as values may have changed since.
+    assert bag.get(TemplatedString("${param1}")) == "value2"
+
+
+def test_freeze_resolves_references_upfront():
+    bag = ParameterBag({"param1": "value1"})
+    templated_string = TemplatedString("${param1}-${param1}")
+    bag.freeze(["param1", templated_string])
+
+    assert bag._ParameterBag__cache == {templated_string.value: "value1-value1"}  # type: ignore[reportAttributeAccessIssue]
+
+    with pytest.raises(UnknownParameterError):
+        bag.freeze([TemplatedString("${param2}")])
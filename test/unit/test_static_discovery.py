@@ -0,0 +1,69 @@
+import importlib
+import sys
+from pathlib import Path
+from typing import Iterator, Set
+
+import pytest
+import wireup
+from wireup import StaticDiscovery
+from wireup._discovery import discover_wireup_registrations
+
+from test.unit import services
+
+
+@pytest.fixture
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    root = tmp_path / "static_pkg"
+    (root / "sub").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "sub" / "__init__.py").write_text("")
+    (root / "decorated.py").write_text("import wireup\n\n@wireup.service\nclass Decorated: ...\n")
+    (root / "aliased.py").write_text("from wireup import service as register\n\n@register\nclass Aliased: ...\n")
+    (root / "sub" / "factory.py").write_text(
+        "from wireup import service\n\nclass Made: ...\n\n"
+        "def make() -> Made:\n    return Made()\n\nservice(lifetime='scoped')(make)\n"
+    )
+    (root / "heavy.py").write_text("# Uses the user service without declaring any.\nraise RuntimeError\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    yield root
+
+    for name in [name for name in sys.modules if name.startswith("static_pkg")]:
+        del sys.modules[name]
+
+
+def _discover(static: StaticDiscovery) -> Set[str]:
+    _, impls = discover_wireup_registrations([importlib.import_module("static_pkg")], static=static)
+    return {impl.obj.__qualname__ for impl in impls}
+
+
+def test_static_discovery_finds_same_registrations() -> None:
+    abstracts, impls = discover_wireup_registrations([services])
+    static_abstracts, static_impls = discover_wireup_registrations([services], static=StaticDiscovery())
+
+    assert {abstract.obj for abstract in static_abstracts} == {abstract.obj for abstract in abstracts}
+    assert {impl.obj for impl in static_impls} == {impl.obj for impl in impls}
+
+
+@pytest.mark.usefixtures("package")
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_static_discovery_only_imports_declaring_modules(max_workers: int) -> None:
+    assert _discover(StaticDiscovery(max_workers=max_workers)) == {"Decorated", "Aliased", "make"}
+    assert "static_pkg.heavy" not in sys.modules
+
+
+@pytest.mark.usefixtures("package")
+def test_static_discovery_include_exclude() -> None:
+    assert _discover(StaticDiscovery(include=["static_pkg.sub.*"])) == {"make"}
+    assert _discover(StaticDiscovery(exclude=["static_pkg.sub.*", "*.aliased"])) == {"Decorated"}
+
+
+@pytest.mark.usefixtures("package")
+def test_container_with_static_discovery() -> None:
+    container = wireup.create_sync_container(
+        service_modules=[importlib.import_module("static_pkg")], discovery=StaticDiscovery()
+    )
+
+    from static_pkg.decorated import Decorated  # type: ignore[import-not-found]
+
+    assert isinstance(container.get(Decorated), Decorated)
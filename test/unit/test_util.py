@@ -14,6 +14,9 @@ from wireup.ioc.types import (
     ServiceQualifier,
 )
 from wireup.ioc.util import (
+    cached_by_target,
+    clear_annotation_cache,
+    get_annotated_parameters,
     get_globals,
     param_get_annotation,
 )
@@ -110,3 +113,32 @@ def test_unwraps_functools_partial(partial_func: Callable):
 
     # THEN
     assert result is _sample_function.__globals__
+
+
+def test_annotated_parameters_are_cached_until_cleared() -> None:
+    def inner(_a: str): ...
+
+    params = get_annotated_parameters(inner)
+    assert get_annotated_parameters(inner) is params
+
+    def replacement(_b: int): ...
+
+    inner.__signature__ = inspect.signature(replacement)  # type: ignore[attr-defined]
+    assert get_annotated_parameters(inner) is params
+
+    clear_annotation_cache()
+    assert get_annotated_parameters(inner) == {"_b": AnnotatedParameter(int)}
+
+
+def test_cached_by_target_calls_through_for_targets_which_cannot_be_weakly_referenced() -> None:
+    calls: list[object] = []
+
+    @cached_by_target
+    def _get(target: object) -> int:
+        calls.append(target)
+        return len(calls)
+
+    method = MyCustomClass().__init__
+    assert _get(method) == 1
+    assert _get(method) == 2
+    assert _get(_sample_function) == _get(_sample_function) == 3
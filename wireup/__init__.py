@@ -1,5 +1,6 @@
 from wireup._annotations import Inject, Injected, abstract, service
 from wireup._decorators import inject_from_container
+from wireup._discovery import StaticDiscovery
 from wireup.ioc.container import (
     create_async_container,
     create_sync_container,
@@ -16,6 +17,7 @@ __all__ = [
     "ParameterBag",
     "ParameterReference",
     "ServiceOverride",
+    "StaticDiscovery",
     "SyncContainer",
     "abstract",
     "create_async_container",
@@ -0,0 +1,154 @@
+"""Command line interface of Wireup.
+
+Usage: python -m wireup build --service-module myapp.services --parameter db_url --output .wireup_cache
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Sequence
+
+from wireup._discovery import StaticDiscovery
+from wireup.errors import WireupError
+from wireup.ioc.container import _create_container, _merge_definitions
+from wireup.ioc.container.sync_container import SyncContainer
+
+if TYPE_CHECKING:
+    from wireup.ioc.service_registry import ServiceRegistry
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m wireup", description="Wireup command line interface.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser(
+        "build",
+        help="Validate and compile services ahead of time.",
+        description="Validate and compile services ahead of time into a directory which containers created with "
+        "compile_cache_dir set to it load instead of doing this work on startup.",
+    )
+    build.add_argument(
+        "--service-module",
+        action="append",
+        required=True,
+        dest="service_modules",
+        metavar="MODULE",
+        help="Dotted name of a module to scan for services, as passed to service_modules. May be repeated.",
+    )
+    build.add_argument(
+        "--parameter",
+        action="append",
+        default=[],
+        dest="parameters",
+        metavar="NAME",
+        help="Name of a parameter the container is created with. Values are not needed. May be repeated.",
+    )
+    build.add_argument(
+        "--root",
+        action="append",
+        dest="roots",
+        metavar="MODULE:NAME",
+        help="Service the application uses, as passed to roots. May be repeated. Defaults to all services.",
+    )
+    build.add_argument(
+        "--static-discovery",
+        action="store_true",
+        help="Find services by parsing the source of modules, as with discovery=StaticDiscovery().",
+    )
+    build.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Glob of module names to search with --static-discovery, as passed to include. May be repeated.",
+    )
+    build.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Glob of module names not to search with --static-discovery, as passed to exclude. May be repeated.",
+    )
+    build.add_argument("--output", required=True, help="Directory to write the compiled services to.")
+    build.add_argument("--thread-safe", action="store_true", help="Compile services as with thread_safe=True.")
+    build.add_argument(
+        "--concurrent-dependencies",
+        action="store_true",
+        help="Compile services as with concurrent_dependencies=True.",
+    )
+    build.add_argument(
+        "--constant-parameters",
+        action="store_true",
+        help="Compile services as with constant_parameters=True.",
+    )
+    args = parser.parse_args(argv)
+
+    return _build(args)
+
+
+def _build(args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    discovery = StaticDiscovery(include=args.include, exclude=args.exclude) if args.static_discovery else None
+    try:
+        service_modules = [importlib.import_module(name) for name in args.service_modules]
+        container = _create_container(
+            SyncContainer,
+            service_modules=service_modules,
+            parameters=dict.fromkeys(args.parameters),
+            concurrent_dependencies=args.concurrent_dependencies,
+            thread_safe=args.thread_safe,
+            constant_parameters=args.constant_parameters,
+            compile_cache_dir=args.output,
+            roots=None if args.roots is None else [_import_object(root) for root in args.roots],
+            discovery=discovery,
+        )
+    except (ImportError, AttributeError, WireupError) as e:
+        print(f"error: {e}", file=sys.stderr)  # noqa: T201
+        return 1
+
+    elapsed = time.perf_counter() - start
+    stats = _get_stats(container._registry)
+    if args.roots is not None:
+        stats["unreachable"] = len(_merge_definitions(service_modules, static=discovery)[1]) - stats["services"]
+
+    for name, value in stats.items():
+        print(f"{name + ':':<20}{value}")  # noqa: T201
+    print(f"{'build time:':<20}{elapsed * 1000:.1f}ms")  # noqa: T201
+
+    return 0
+
+
+def _import_object(path: str) -> Any:
+    module_name, _, qualname = path.partition(":")
+    obj = importlib.import_module(module_name)
+
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+
+    return obj
+
+
+def _get_stats(registry: ServiceRegistry) -> dict[str, int]:
+    depths = registry.get_depths()
+    async_services = {obj_id for obj_id, factory in registry.factories.items() if factory.is_async}
+
+    return {
+        "services": len(registry.factories),
+        "singletons": len(registry.singleton_slots),
+        "scoped": len(registry.scoped_slots),
+        "max depth": max(depths.values(), default=0),
+        "async services": len(async_services),
+        "max async fan-out": max(
+            (
+                sum(dep in async_services for dep in registry.get_service_dependencies(obj_id))
+                for obj_id in registry.factories
+            ),
+            default=0,
+        ),
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
-import contextlib
 import functools
 import inspect
-from contextlib import AsyncExitStack, ExitStack
-from typing import TYPE_CHECKING, Any, Callable
+import textwrap
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
-from wireup.errors import WireupError
+from wireup.errors import UnknownServiceRequestedError, WireupError
 from wireup.ioc.container.async_container import AsyncContainer, ScopedAsyncContainer, async_container_force_sync_scope
+from wireup.ioc.container.base_container import _async_dependency_in_sync_context_error
 from wireup.ioc.container.sync_container import SyncContainer
-from wireup.ioc.types import AnnotatedParameter, ParameterWrapper
+from wireup.ioc.factory_compiler import FactoryCompiler
+from wireup.ioc.types import AnnotatedParameter, ParameterReference, ParameterWrapper
 from wireup.ioc.util import (
     get_inject_annotated_parameters,
     get_valid_injection_annotated_parameters,
 )
 
 if TYPE_CHECKING:
+    import contextlib
+    from types import CodeType
+
     from wireup.ioc.container.sync_container import ScopedSyncContainer
+    from wireup.ioc.types import Qualifier
 
 
 def inject_from_container_unchecked(
@@ -78,7 +83,7 @@ def inject_from_container(
     return _decorator
 
 
-def inject_from_container_util(  # noqa: C901
+def inject_from_container_util(
     target: Callable[..., Any],
     names_to_inject: dict[str, AnnotatedParameter],
     container: SyncContainer | AsyncContainer | None,
@@ -96,61 +101,186 @@ def inject_from_container_util(  # noqa: C901
     if not names_to_inject:
         return target
 
-    if inspect.iscoroutinefunction(target):
-
-        @functools.wraps(target)
-        async def _inject_async_target(*args: Any, **kwargs: Any) -> Any:
-            async with AsyncExitStack() as cm:
-                if scoped_container_supplier:
-                    scoped_container = scoped_container_supplier()
-                elif container:
-                    scoped_container = await cm.enter_async_context(container.enter_scope())  # type: ignore[reportArgumentType, arg-type, unused-ignore]
-                else:
-                    msg = "scoped_container_supplier or container must be provided for injection."
-                    raise ValueError(msg)
-
-                if middleware:
-                    cm.enter_context(middleware(scoped_container, args, kwargs))
-
-                injected_names = {
-                    name: scoped_container.params.get(param.annotation.param)
-                    if isinstance(param.annotation, ParameterWrapper)
-                    else await scoped_container.get(param.klass, qualifier=param.qualifier_value)
-                    for name, param in names_to_inject.items()
-                    if param.annotation
-                }
-
-                return await target(*args, **{**kwargs, **injected_names})
-
-        return _inject_async_target
-
-    @functools.wraps(target)
-    def _inject_target(*args: Any, **kwargs: Any) -> Any:
-        with ExitStack() as cm:
-            if scoped_container_supplier:
-                scoped_container = scoped_container_supplier()
-            elif container:
-                scoped_container = cm.enter_context(
-                    container.enter_scope()
-                    if isinstance(container, SyncContainer)
-                    else async_container_force_sync_scope(container)
-                )
-            else:
-                msg = "scoped_container_supplier or container must be provided for injection."
-                raise ValueError(msg)
-
-            if middleware:
-                cm.enter_context(middleware(scoped_container, args, kwargs))
-
-            get = scoped_container._synchronous_get
-
-            injected_names = {
-                name: scoped_container.params.get(param.annotation.param)
-                if isinstance(param.annotation, ParameterWrapper)
-                else get(param.klass, qualifier=param.qualifier_value)
-                for name, param in names_to_inject.items()
-                if param.annotation
-            }
-            return target(*args, **{**kwargs, **injected_names})
-
-    return _inject_target
+    is_async = inspect.iscoroutinefunction(target)
+    services: list[tuple[str, type, Qualifier | None]] = []
+    parameters: list[tuple[str, ParameterReference]] = []
+    names: list[str] = []
+
+    for name, param in names_to_inject.items():
+        if isinstance(param.annotation, ParameterWrapper):
+            parameters.append((name, param.annotation.param))
+            names.append(name)
+        elif param.annotation:
+            services.append((name, param.klass, param.qualifier_value))
+            names.append(name)
+
+    enter_scope: Callable[[], Any] | None = None
+    scope_source: Literal["enter", "supplier", "container"] = "supplier"
+    # Targets injecting only singletons and parameters are resolved from the container itself, as creating them
+    # needs no scope. Middleware is always given a scope, as it may use it for more than what the target injects.
+    if container is not None and middleware is None and _injects_singletons_only(container, services):
+        scope_source = "container"
+    elif scoped_container_supplier is None and isinstance(container, SyncContainer):
+        scope_source = "enter"
+        enter_scope = container.enter_scope
+    elif scoped_container_supplier is None and isinstance(container, AsyncContainer):
+        scope_source = "enter"
+        enter_scope = (
+            container.enter_scope if is_async else functools.partial(async_container_force_sync_scope, container)
+        )
+
+    source = _get_wrapper_code(
+        is_async=is_async,
+        names=names,
+        services=[(name, _get_service_kind(container, klass, qualifier)) for name, klass, qualifier in services],
+        parameter_names=[name for name, _ in parameters],
+        scope_source=scope_source,
+        has_middleware=middleware is not None,
+        # Parameters of the container are known upfront. Scopes from a supplier could belong to any container.
+        parameters_source="scope" if container is None else "constant" if container.params.constant else "container",
+    )
+
+    if (code := _wrapper_code_cache.get(source)) is None:
+        code = _wrapper_code_cache[source] = compile(source, f"<{_WIREUP_GENERATED_WRAPPER_NAME}>", "exec")
+
+    namespace: dict[str, Any] = {
+        "UnknownServiceRequestedError": UnknownServiceRequestedError,
+        "async_dependency_error": _async_dependency_in_sync_context_error,
+    }
+    exec(code, namespace)  # noqa: S102
+    wrapper = namespace["_wireup_make_wrapper"](
+        target,
+        container,
+        enter_scope,
+        scoped_container_supplier,
+        middleware,
+        None if container is None else container.params.get,
+        tuple(FactoryCompiler.get_object_id(klass, qualifier) for _, klass, qualifier in services),
+        tuple((klass, qualifier) for _, klass, qualifier in services),
+        tuple(
+            container.params.get(ref) if container is not None and container.params.constant else ref
+            for _, ref in parameters
+        ),
+    )
+
+    return functools.wraps(target)(wrapper)
+
+
+_WIREUP_GENERATED_WRAPPER_NAME = "_wireup_inject_target"
+# Generated code only depends on the shape of the target rather than on the services it injects,
+# so targets of the same shape share the compiled code.
+_wrapper_code_cache: dict[str, CodeType] = {}
+
+
+def _injects_singletons_only(
+    container: SyncContainer | AsyncContainer, services: list[tuple[str, type, Qualifier | None]]
+) -> bool:
+    """Return whether all services to inject are singletons, which the container can create without a scope.
+
+    Singletons can only depend on other singletons, so this also holds for all of their dependencies.
+    """
+    registry = container._registry
+
+    return all(
+        registry.lifetime[registry.resolve_obj_id(klass, qualifier)] == "singleton" for _, klass, qualifier in services
+    )
+
+
+def _get_service_kind(
+    container: SyncContainer | AsyncContainer | None, klass: type, qualifier: Qualifier | None
+) -> Literal["sync", "async", "unknown"]:
+    """Return whether the service is created by a sync or an async factory, or "unknown" if there is no container."""
+    if container is None:
+        return "unknown"
+
+    # Services created by sync factories stay sync, as overrides are always sync.
+    return (
+        "async"
+        if container._registry.factories[container._registry.resolve_obj_id(klass, qualifier)].is_async
+        else "sync"
+    )
+
+
+def _get_wrapper_code(  # noqa: PLR0913
+    *,
+    is_async: bool,
+    names: list[str],
+    services: list[tuple[str, Literal["sync", "async", "unknown"]]],
+    parameter_names: list[str],
+    scope_source: Literal["enter", "supplier", "container"],
+    has_middleware: bool,
+    parameters_source: Literal["scope", "container", "constant"],
+) -> str:
+    """Generate the source of a function which injects services and parameters into the target and calls it.
+
+    Services are created by calling the factories of the scope directly, so that no intermediate collections
+    are built on each call. Services and parameters are injected in the order of names, into a copy of the
+    keyword arguments the wrapper was called with.
+    """
+    maybe_async = "async " if is_async else ""
+    maybe_await = "await " if is_async else ""
+
+    code = (
+        "def _wireup_make_wrapper(TARGET, CONTAINER, ENTER_SCOPE, SCOPE_SUPPLIER, MIDDLEWARE, "
+        "PARAMETERS_GET, OBJ_IDS, SERVICES, PARAMETERS):\n"
+    )
+    for i in range(len(services)):
+        code += f"    OBJ_ID_{i} = OBJ_IDS[{i}]\n"
+    for i in range(len(parameter_names)):
+        code += f"    PARAMETER_{i} = PARAMETERS[{i}]\n"
+
+    code += f"    {maybe_async}def {_WIREUP_GENERATED_WRAPPER_NAME}(*args, **kwargs):\n"
+
+    # Code creating the value of each injected name, and the expression holding it.
+    injections: dict[str, tuple[str, str]] = {}
+    for i, (name, kind) in enumerate(services):
+        injections[name] = _get_service_code(i, kind, is_async=is_async), f"service_{i}"
+
+    for i, name in enumerate(parameter_names):
+        if parameters_source == "constant":
+            # Values of constant parameters are resolved upfront and passed instead of their references.
+            injections[name] = "", f"PARAMETER_{i}"
+        else:
+            parameters_get = "scope.params.get" if parameters_source == "scope" else "PARAMETERS_GET"
+            injections[name] = f"parameter_{i} = {parameters_get}(PARAMETER_{i})\n", f"parameter_{i}"
+
+    body = "factories = scope._factories\n"
+    body += "".join(injections[name][0] for name in names)
+    # Middleware is given the keyword arguments the wrapper was called with, so injected values go into a copy.
+    injected = ", ".join(f"{name!r}: {injections[name][1]}" for name in names)
+    body += f"return {maybe_await}TARGET(*args, **{{**kwargs, {injected}}})\n"
+
+    # Scopes are entered before the middleware is, and exited after it, as with nested context managers.
+    if has_middleware:
+        body = "with MIDDLEWARE(scope, args, kwargs):\n" + textwrap.indent(body, "    ")
+
+    if scope_source == "enter":
+        body = f"{maybe_async}with ENTER_SCOPE() as scope:\n" + textwrap.indent(body, "    ")
+    elif scope_source == "supplier":
+        body = "scope = SCOPE_SUPPLIER()\n" + body
+    else:
+        body = "scope = CONTAINER\n" + body
+
+    code += textwrap.indent(body, "        ")
+    code += f"    return {_WIREUP_GENERATED_WRAPPER_NAME}\n"
+
+    return code
+
+
+def _get_service_code(i: int, kind: Literal["sync", "async", "unknown"], *, is_async: bool) -> str:
+    if kind == "sync":
+        return f"service_{i} = factories[OBJ_ID_{i}].factory(scope)\n"
+
+    if kind == "unknown":
+        code = f"if (factory := factories.get(OBJ_ID_{i})) is None:\n"
+        code += f"    raise UnknownServiceRequestedError(*SERVICES[{i}])\n"
+    else:
+        code = f"factory = factories[OBJ_ID_{i}]\n"
+
+    if is_async:
+        return code + f"service_{i} = await factory.factory(scope) if factory.is_async else factory.factory(scope)\n"
+
+    # Async services may be overridden with sync factories, which sync targets can use.
+    code += "if factory.is_async:\n"
+    code += f"    raise async_dependency_error(SERVICES[{i}][0])\n"
+    return code + f"service_{i} = factory.factory(scope)\n"
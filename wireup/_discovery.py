@@ -1,17 +1,63 @@
 from __future__ import annotations
 
+import ast
+import fnmatch
+import hashlib
 import importlib
+import importlib.machinery
+import importlib.util
 import inspect
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from types import FunctionType, ModuleType
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 from wireup._annotations import AbstractDeclaration, ServiceDeclaration
 
+_REGISTRATION_DECORATORS = frozenset(("service", "abstract"))
+
+
+@dataclass(frozen=True)
+class StaticDiscovery:
+    """Discover services by parsing the source of modules instead of importing all of them.
+
+    Only modules whose source uses `@service` or `@abstract` are imported, so that modules which register nothing
+    do not pay for their imports. Registrations must use these decorators, or aliases of them imported from wireup.
+
+    :param include: Glob patterns of dotted module names to search, such as `"myapp.*.services"`.
+    All modules of the given packages are searched when empty.
+    :param exclude: Glob patterns of dotted module names not to search, even when matching `include`.
+    :param max_workers: Number of threads parsing the source of modules and compiling the bytecode of matching
+    modules ahead of importing them. Modules are parsed on the calling thread when set to 1.
+    """
+
+    include: Sequence[str] = ()
+    exclude: Sequence[str] = ()
+    max_workers: int = 1
+
+    def matches(self, module_name: str) -> bool:
+        """Return whether the module with the given dotted name is searched for registrations."""
+        return (not self.include or any(fnmatch.fnmatchcase(module_name, p) for p in self.include)) and not any(
+            fnmatch.fnmatchcase(module_name, p) for p in self.exclude
+        )
+
 
 def discover_wireup_registrations(
     service_modules: Iterable[ModuleType],
+    manifest_dir: str | os.PathLike[str] | None = None,
+    static: StaticDiscovery | None = None,
 ) -> tuple[list[AbstractDeclaration], list[ServiceDeclaration]]:
+    """Find registrations in the given modules and, for packages, in all of their submodules.
+
+    :param manifest_dir: Directory in which to keep a manifest of where registrations are declared. While no source
+    file of the modules changes, later calls import only the modules declaring registrations instead of all of them.
+    :param static: When set, find the modules declaring registrations by parsing their source and import only these.
+    """
     abstract_registrations: list[AbstractDeclaration] = []
     service_registrations: list[ServiceDeclaration] = []
 
@@ -21,9 +67,23 @@ def discover_wireup_registrations(
         # "from flask import g" would cause a hasattr call to g outside of app context.
         return (isinstance(obj, FunctionType) or inspect.isclass(obj)) and hasattr(obj, "__wireup_registration__")
 
-    all_targets = {
-        m for module in service_modules for m in _find_objects_in_module(module, predicate=_is_valid_wireup_target)
-    }
+    service_modules = list(service_modules)
+    manifest = _DiscoveryManifest(manifest_dir, service_modules, static) if manifest_dir is not None else None
+    all_targets = manifest.load() if manifest else None
+
+    if all_targets is None:
+        all_targets = {
+            m
+            for module in service_modules
+            for m in (
+                _find_objects_in_module(module, predicate=_is_valid_wireup_target)
+                if static is None
+                else _find_objects_statically(module, predicate=_is_valid_wireup_target, options=static)
+            )
+        }
+
+        if manifest:
+            manifest.save(all_targets)
 
     for cls in all_targets:
         reg = getattr(cls, "__wireup_registration__", None)
@@ -39,30 +99,185 @@ def discover_wireup_registrations(
 def _find_objects_in_module(module: ModuleType, predicate: Callable[[Any], bool]) -> set[type]:
     classes: set[type[Any]] = set()
 
-    def _module_get_objects(m: ModuleType) -> set[type]:
-        return {obj for _, obj in inspect.getmembers(m) if predicate(obj)}
+    for module_name, _ in _iter_module_files(module):
+        classes.update(_module_get_objects(importlib.import_module(module_name), predicate))
 
-    def _find_in_path(path: Path, parent_module_name: str) -> None:
-        for file in path.iterdir():
-            if file.name == "__pycache__":
-                continue
+    return classes
 
-            full_path = path / file
 
-            if Path.is_dir(full_path):
-                sub_module_name = f"{parent_module_name}.{file.name}"
-                _find_in_path(full_path, sub_module_name)
-            elif file.name.endswith(".py"):
-                full_module_name = (
-                    parent_module_name if file.name == "__init__.py" else f"{parent_module_name}.{file.name[:-3]}"
-                )
-                sub_module = importlib.import_module(full_module_name)
-                classes.update(_module_get_objects(sub_module))
+def _find_objects_statically(
+    module: ModuleType,
+    predicate: Callable[[Any], bool],
+    options: StaticDiscovery,
+) -> set[type]:
+    candidates = [(name, path) for name, path in _iter_module_files(module) if options.matches(name)]
+    classes: set[type[Any]] = set()
 
-    if f := module.__file__:
-        if f.endswith("__init__.py"):
-            _find_in_path(Path(f).parent, module.__name__)
-        else:
-            classes.update(_module_get_objects(module))
+    if options.max_workers > 1:
+        with ThreadPoolExecutor(max_workers=options.max_workers) as pool:
+            matches = list(pool.map(lambda candidate: _prefetch_module(*candidate), candidates))
+    else:
+        matches = [_declares_registrations(path) for _, path in candidates]
+
+    for (module_name, _), matched in zip(candidates, matches):
+        if matched:
+            classes.update(_module_get_objects(importlib.import_module(module_name), predicate))
 
     return classes
+
+
+def _module_get_objects(m: ModuleType, predicate: Callable[[Any], bool]) -> set[type]:
+    return {obj for _, obj in inspect.getmembers(m) if predicate(obj)}
+
+
+def _iter_module_files(module: ModuleType) -> Iterator[tuple[str, Path]]:
+    """Yield the dotted name and source file of the module and, for packages, of all of their submodules."""
+    if not (f := module.__file__):
+        return
+
+    if not f.endswith("__init__.py"):
+        yield module.__name__, Path(f)
+        return
+
+    stack = [(module.__name__, Path(f).parent)]
+    while stack:
+        package_name, path = stack.pop()
+
+        for entry in os.scandir(path):
+            if entry.is_dir():
+                if entry.name != "__pycache__":
+                    stack.append((f"{package_name}.{entry.name}", Path(entry.path)))
+            elif entry.name.endswith(".py"):
+                module_name = package_name if entry.name == "__init__.py" else f"{package_name}.{entry.name[:-3]}"
+                yield module_name, Path(entry.path)
+
+
+def _declares_registrations(path: Path) -> bool:
+    """Return whether the source file applies `@service` or `@abstract` to anything, judging by its syntax tree."""
+    source = path.read_bytes()
+
+    # Most modules never mention either name, which is much cheaper to check than parsing them.
+    if not any(name.encode() in source for name in _REGISTRATION_DECORATORS):
+        return False
+
+    names = set(_REGISTRATION_DECORATORS)
+    used: set[str | None] = set()
+
+    for node in ast.walk(ast.parse(source, filename=str(path))):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            used.update(_get_called_name(decorator) for decorator in node.decorator_list)
+        elif isinstance(node, ast.Call):
+            used.add(_get_called_name(node.func))
+        elif isinstance(node, ast.ImportFrom) and (node.module or "").split(".")[0] == "wireup":
+            names.update(alias.asname for alias in node.names if alias.asname and alias.name in names)
+
+    return not names.isdisjoint(used)
+
+
+def _get_called_name(node: ast.expr) -> str | None:
+    if isinstance(node, ast.Call):
+        node = node.func
+
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Attribute):
+        return node.attr
+
+    return None
+
+
+def _prefetch_module(module_name: str, path: Path) -> bool:
+    """Parse the source file and, if it declares registrations, write its bytecode cache for the upcoming import."""
+    if not _declares_registrations(path):
+        return False
+
+    if not sys.dont_write_bytecode:
+        cache = Path(importlib.util.cache_from_source(str(path)))
+
+        if not cache.exists() or cache.stat().st_mtime < path.stat().st_mtime:
+            importlib.machinery.SourceFileLoader(module_name, str(path)).get_code(module_name)
+
+    return True
+
+
+class _DiscoveryManifest:
+    """Record the module and qualified name of discovered objects along with the state of the files they came from.
+
+    The manifest is valid as long as no source file in the scanned packages is added, removed or modified,
+    and neither are the files defining the discovered objects.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        service_modules: list[ModuleType],
+        static: StaticDiscovery | None = None,
+    ) -> None:
+        key = repr(
+            (
+                sys.version,
+                sorted(module.__name__ for module in service_modules),
+                static and (tuple(static.include), tuple(static.exclude)),
+            )
+        )
+        self._directory = Path(directory)
+        self._path = self._directory / f"discovery-{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.json"
+        self._files = {str(file): _stat(file) for module in service_modules for _, file in _iter_module_files(module)}
+
+    def load(self) -> set[Any] | None:
+        """Return the discovered objects, or None if the manifest is missing or outdated."""
+        try:
+            data = json.loads(self._path.read_text())
+            files = {**self._files, **{file: _stat(Path(file)) for file in data["files"] if file not in self._files}}
+
+            if files != {file: tuple(stat) for file, stat in data["files"].items()}:
+                return None
+
+            res = {_import_object(module_name, qualname) for module_name, qualname in data["objects"]}
+        # Objects may have been renamed or removed in a way which does not change the files above,
+        # such as when they are declared in installed packages. Fall back to discovering them again.
+        except (OSError, ValueError, KeyError, TypeError, ImportError, AttributeError):
+            return None
+
+        if not all(hasattr(obj, "__wireup_registration__") for obj in res):
+            return None
+
+        return res
+
+    def save(self, objects: set[Any]) -> None:
+        files = dict(self._files)
+        entries: list[tuple[str, str]] = []
+
+        for obj in objects:
+            # Objects which cannot be imported by name, such as ones created in functions, cannot be recorded.
+            try:
+                if _import_object(obj.__module__, obj.__qualname__) is not obj:
+                    return
+            except (ImportError, AttributeError):
+                return
+
+            if (file := getattr(sys.modules[obj.__module__], "__file__", None)) is not None:
+                files.setdefault(file, _stat(Path(file)))
+
+            entries.append((obj.__module__, obj.__qualname__))
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=self._directory, delete=False) as f:
+            json.dump({"files": files, "objects": sorted(entries)}, f)
+
+        Path(f.name).replace(self._path)
+
+
+def _stat(file: Path) -> tuple[int, int]:
+    stat = file.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _import_object(module_name: str, qualname: str) -> Any:
+    obj: Any = importlib.import_module(module_name)
+
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+
+    return obj
@@ -164,10 +164,7 @@ def _update_lifespan(
     @contextlib.asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncIterator[Any]:
         if class_based_routes:
-            for cbr in class_based_routes:
-                container._registry.extend(impls=[ServiceDeclaration(cbr)])
-            container._compiler.compile()
-            container._scoped_compiler.compile()
+            container._extend([ServiceDeclaration(cbr) for cbr in class_based_routes])
 
             for cbr in class_based_routes:
                 await _instantiate_class_based_route(app, container, cbr)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import io
+import marshal
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from wireup.ioc import factory_compiler, service_registry
+
+if TYPE_CHECKING:
+    import os
+    from types import CodeType
+
+    from wireup._annotations import AbstractDeclaration, ServiceDeclaration
+    from wireup.ioc.parameter import ParameterBag
+    from wireup.ioc.service_registry import ServiceRegistry
+    from wireup.ioc.types import Qualifier
+
+
+class CompileCache:
+    """Persist a validated registry along with the code compiled for it, keyed by a fingerprint of the registrations.
+
+    Processes creating a container from the same registrations load both instead of inspecting, validating
+    and compiling everything again. Files are named after the fingerprint, so changed registrations use a new file.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        directory: str | os.PathLike[str],
+        abstracts: list[AbstractDeclaration],
+        impls: list[ServiceDeclaration],
+        parameter_names: Iterable[str],
+        roots: list[tuple[type, Qualifier | None]] | None = None,
+        options: dict[str, bool] | None = None,
+    ) -> None:
+        """Create a cache for the given registrations.
+
+        :param options: Container options changing the generated code, such as thread safety.
+        """
+        self._directory = Path(directory)
+        self._path = self._directory / f"{_fingerprint(abstracts, impls, parameter_names, roots, options)}.wireup"
+        self._is_hit = False
+        self.code: dict[str, CodeType] = {}
+
+    def load(self, parameters: ParameterBag) -> ServiceRegistry | None:
+        """Return the cached registry, or None on a cache miss. Cached code is then available in `code`."""
+        try:
+            registry_data, code = marshal.loads(self._path.read_bytes())  # noqa: S302
+            registry: ServiceRegistry = pickle.loads(registry_data)  # noqa: S301
+        # An unreadable or outdated file is treated as a miss and overwritten.
+        except (OSError, EOFError, ValueError, TypeError, AttributeError, ImportError, pickle.UnpicklingError):
+            return None
+
+        registry.parameters = parameters
+        self.code = code
+        self._is_hit = True
+
+        return registry
+
+    def save(self, registry: ServiceRegistry) -> None:
+        """Write the registry and code compiled so far, unless they were loaded from the cache."""
+        if self._is_hit:
+            return
+
+        buffer = io.BytesIO()
+        try:
+            _RegistryPickler(buffer).dump(registry)
+        # Registrations which are not importable by name, such as classes defined in functions, cannot be cached.
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        # Workers starting at the same time may all write the file. Replacing it atomically means that
+        # readers never observe a partially written file.
+        with tempfile.NamedTemporaryFile(dir=self._directory, delete=False) as f:
+            f.write(marshal.dumps((buffer.getvalue(), self.code)))
+
+        Path(f.name).replace(self._path)
+
+
+class _RegistryPickler(pickle.Pickler):
+    def reducer_override(self, obj: Any) -> Any:
+        # Frozen dataclasses are restored by calling their constructor, as pickle cannot assign to their fields.
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type) and obj.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+            return type(obj), tuple(getattr(obj, field.name) for field in dataclasses.fields(obj))
+
+        return NotImplemented
+
+
+def _fingerprint(
+    abstracts: list[AbstractDeclaration],
+    impls: list[ServiceDeclaration],
+    parameter_names: Iterable[str],
+    roots: list[tuple[type, Qualifier | None]] | None,
+    options: dict[str, bool] | None,
+) -> str:
+    """Return a digest of everything registrations and the code generated for them are derived from.
+
+    This covers the registered objects, their annotations, the files defining them and the options the code is
+    generated with. Parameter values are not part of it as registrations only reference parameters by name.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    # Cached code is looked up without generating its source, so it must be discarded when generation changes.
+    files: set[str | None] = {service_registry.__file__, factory_compiler.__file__}
+
+    def _update(*parts: Any) -> None:
+        digest.update(repr(parts).encode())
+
+    _update(sys.version, sorted(parameter_names), sorted((options or {}).items()))
+    _update(None if roots is None else sorted(f"{klass.__module__}.{klass.__qualname__}:{q!r}" for klass, q in roots))
+
+    # Discovery does not return registrations in a stable order, so they are sorted to get the same digest every time.
+    _update(sorted((abstract.obj.__module__, abstract.obj.__qualname__) for abstract in abstracts))
+    _update(
+        sorted(
+            repr(
+                (impl.obj.__module__, impl.obj.__qualname__, impl.qualifier, impl.lifetime, _get_annotations(impl.obj))
+            )
+            for impl in impls
+        )
+    )
+    files.update(_get_file(abstract.obj) for abstract in abstracts)
+    files.update(_get_file(impl.obj) for impl in impls)
+
+    for file in sorted(file for file in files if file is not None):
+        stat = Path(file).stat()
+        _update(file, stat.st_mtime_ns, stat.st_size)
+
+    return digest.hexdigest()
+
+
+def _get_file(obj: Any) -> str | None:
+    return getattr(sys.modules.get(obj.__module__), "__file__", None)
+
+
+def _get_annotations(obj: Any) -> Any:
+    # Types in annotations may be defined in files other than the one of the registered object.
+    return getattr(getattr(obj, "__init__", None) if isinstance(obj, type) else obj, "__annotations__", None)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+if TYPE_CHECKING:
+    from wireup.ioc.container.base_container import BaseContainer
+
+
+async def gather_or_cancel(*aws: Awaitable[Any]) -> list[Any]:
+    """Await the given awaitables concurrently and return their results in order.
+
+    If any of them fails the remaining ones are cancelled and awaited before the error is re-raised.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def fail_in_flight(future: asyncio.Future[Any], exc: BaseException) -> None:
+    """Propagate the error creating a service to callers waiting on its in-flight creation."""
+    future.set_exception(exc)
+    # Mark the exception as retrieved. The creator re-raises it, so it is never lost even without waiters.
+    future.exception()
+
+
+async def gather_dependencies(
+    container: BaseContainer, *factories: Callable[[BaseContainer], Awaitable[Any]]
+) -> list[Any]:
+    """Create dependencies concurrently using the given generated factories.
+
+    Each factory runs against a container with its own exit stacks. Once done, these are merged into the
+    container's exit stacks in the order the factories were given, so that cleanup order stays deterministic.
+    """
+    branches = [container._fork_exit_stacks() for _ in factories]
+
+    try:
+        return await gather_or_cancel(*(factory(branch) for factory, branch in zip(factories, branches)))
+    finally:
+        for branch in branches:
+            container._global_scope_exit_stack.extend(branch._global_scope_exit_stack)
+
+            if container._current_scope_exit_stack is not None and branch._current_scope_exit_stack:
+                container._current_scope_exit_stack.extend(branch._current_scope_exit_stack)
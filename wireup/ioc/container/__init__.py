@@ -1,30 +1,46 @@
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING, Any, Iterable, TypeVar
 
 from wireup._annotations import AbstractDeclaration, ServiceDeclaration
-from wireup._discovery import discover_wireup_registrations
-from wireup.errors import WireupError
+from wireup._discovery import StaticDiscovery, discover_wireup_registrations
+from wireup.errors import UnknownServiceRequestedError, WireupError
+from wireup.ioc._compile_cache import CompileCache
 from wireup.ioc.container.async_container import AsyncContainer
 from wireup.ioc.container.base_container import BaseContainer
 from wireup.ioc.container.sync_container import SyncContainer
-from wireup.ioc.factory_compiler import FactoryCompiler
+from wireup.ioc.factory_compiler import EMPTY_SLOT, FactoryCompiler
 from wireup.ioc.override_manager import OverrideManager
 from wireup.ioc.parameter import ParameterBag
 from wireup.ioc.service_registry import ServiceRegistry
+from wireup.ioc.util import stringify_type
 
 if TYPE_CHECKING:
-    from types import ModuleType
+    import asyncio
+    import os
+    import threading
+    from types import CodeType, ModuleType
+
+    from wireup.ioc.types import ContainerObjectIdentifier, Qualifier
 
 _ContainerT = TypeVar("_ContainerT", bound=BaseContainer)
+_logger = logging.getLogger(__name__)
 
 
-def _create_container(
+def _create_container(  # noqa: PLR0913
     klass: type[_ContainerT],
     *,
     service_modules: Iterable[ModuleType] | None = None,
     services: Iterable[Any] | None = None,
     parameters: dict[str, Any] | None = None,
+    concurrent_dependencies: bool = False,
+    thread_safe: bool = False,
+    lazy_compilation: bool = False,
+    compile_cache_dir: str | os.PathLike[str] | None = None,
+    roots: Iterable[type | tuple[type, Qualifier]] | None = None,
+    discovery: StaticDiscovery | None = None,
+    constant_parameters: bool = False,
 ) -> _ContainerT:
     """Create a Wireup container.
 
@@ -34,9 +50,49 @@ def _create_container(
     container instance. Use this when you want to explicitly list services.
     :param parameters: Dict containing parameters you want to expose to the container. Services or factories can
     request parameters via the `Inject(param="name")` syntax.
+    :param concurrent_dependencies: When enabled, async dependencies of an async factory which do not depend on each
+    other are created concurrently.
+    :param thread_safe: When enabled, singletons are created under a per-service lock so that concurrent threads
+    never create the same singleton twice.
+    :param lazy_compilation: When enabled, the factory of each service is generated when it is first requested
+    instead of when the container is created.
+    :param compile_cache_dir: Directory where the validated registrations and the code compiled for them are stored,
+    so that containers created from the same registrations in later processes can load them instead.
+    :param roots: When set, only these services and the services they depend on are registered.
+    :param discovery: When set, service_modules are searched by parsing their source, importing only the modules
+    declaring services.
+    :param constant_parameters: When enabled, parameters are copied when the container is created and injected
+    as constants instead of being looked up on each injection.
     """
-    abstracts, impls = _merge_definitions(service_modules, services)
-    registry = ServiceRegistry(parameters=ParameterBag(parameters), abstracts=abstracts, impls=impls)
+    abstracts, impls = _merge_definitions(service_modules, services, manifest_dir=compile_cache_dir, static=discovery)
+    root_ids = None if roots is None else [root if isinstance(root, tuple) else (root, None) for root in roots]
+    compile_cache = (
+        CompileCache(
+            compile_cache_dir,
+            abstracts,
+            impls,
+            parameter_names=(parameters or {}).keys(),
+            roots=root_ids,
+            options={
+                "concurrent_dependencies": concurrent_dependencies,
+                "thread_safe": thread_safe,
+                "constant_parameters": constant_parameters,
+            },
+        )
+        if compile_cache_dir is not None
+        else None
+    )
+    parameter_bag = ParameterBag(parameters, constant=constant_parameters)
+    registry = compile_cache.load(parameter_bag) if compile_cache else None
+
+    if registry is None:
+        registry = ServiceRegistry(parameters=parameter_bag, abstracts=abstracts, impls=impls)
+
+        if root_ids is not None:
+            registry = _prune_registry(registry, root_ids)
+
+    if constant_parameters:
+        parameter_bag.freeze(registry.get_parameter_references())
 
     # The container uses a dual-compiler optimization strategy:
     # 1. The singleton compiler generates optimized factories for singleton dependencies
@@ -45,25 +101,74 @@ def _create_container(
     #
     # When entering/exiting scopes, the container switches between these compilers.
     # This eliminates the need to check lifetime rules at runtime.
-    singleton_compiler = FactoryCompiler(registry, is_scoped_container=False)
-    scoped_compiler = FactoryCompiler(registry, is_scoped_container=True)
+    # Both compilers generate singleton factories, so they must share the state used to coordinate their creation.
+    # They also share compiled code, as code generated for singletons is the same in both.
+    singleton_locks: dict[ContainerObjectIdentifier, threading.Lock] | None = {} if thread_safe else None
+    in_flight: dict[Any, asyncio.Future[Any]] = {}
+    code_cache: dict[str, CodeType] = compile_cache.code if compile_cache else {}
+    singleton_compiler = FactoryCompiler(
+        registry,
+        is_scoped_container=False,
+        concurrent_dependencies=concurrent_dependencies,
+        singleton_locks=singleton_locks,
+        in_flight=in_flight,
+        code_cache=code_cache,
+        lazy=lazy_compilation,
+    )
+    scoped_compiler = FactoryCompiler(
+        registry,
+        is_scoped_container=True,
+        concurrent_dependencies=concurrent_dependencies,
+        singleton_locks=singleton_locks,
+        in_flight=in_flight,
+        code_cache=code_cache,
+        lazy=lazy_compilation,
+    )
     singleton_compiler.compile()
     scoped_compiler.compile()
 
+    if compile_cache:
+        compile_cache.save(registry)
+
+    # Once everything is compiled, code is only needed again to compile factories on demand.
+    if not lazy_compilation:
+        code_cache.clear()
+
     override_manager = OverrideManager(registry.is_type_with_qualifier_known, singleton_compiler, scoped_compiler)
     return klass(
         registry=registry,
         factory_compiler=singleton_compiler,
         scoped_compiler=scoped_compiler,
-        global_scope_objects={},
+        global_scope_objects=[EMPTY_SLOT] * len(registry.singleton_slots),
         global_scope_exit_stack=[],
         override_manager=override_manager,
     )
 
 
+def _prune_registry(registry: ServiceRegistry, roots: list[tuple[type, Qualifier | None]]) -> ServiceRegistry:
+    """Return a registry of only the services reachable from roots."""
+    for klass, qualifier in roots:
+        if not registry.is_type_with_qualifier_known(klass, qualifier):
+            raise UnknownServiceRequestedError(klass, qualifier)
+
+    reachable = registry.get_reachable(roots)
+
+    if _logger.isEnabledFor(logging.INFO):
+        unreachable = [obj_id for obj_id in registry.factories if obj_id not in reachable]
+        _logger.info(
+            "Skipped %d services not reachable from roots: %s",
+            len(unreachable),
+            ", ".join(stringify_type(registry.factories[obj_id].factory) for obj_id in unreachable),
+        )
+
+    return registry.restrict(reachable)
+
+
 def _merge_definitions(
     service_modules: Iterable[ModuleType] | None = None,
     services: Iterable[Any] | None = None,
+    manifest_dir: str | os.PathLike[str] | None = None,
+    static: StaticDiscovery | None = None,
 ) -> tuple[list[AbstractDeclaration], list[ServiceDeclaration]]:
     abstracts: list[AbstractDeclaration] = []
     impls: list[ServiceDeclaration] = []
@@ -82,17 +187,26 @@ def _merge_definitions(
                 impls.append(reg)
 
     if service_modules:
-        discovered_abstracts, discovered_services = discover_wireup_registrations(service_modules)
+        discovered_abstracts, discovered_services = discover_wireup_registrations(
+            service_modules, manifest_dir=manifest_dir, static=static
+        )
         abstracts.extend(discovered_abstracts)
         impls.extend(discovered_services)
 
     return abstracts, impls
 
 
-def create_sync_container(
+def create_sync_container(  # noqa: PLR0913
     service_modules: list[ModuleType] | None = None,
     services: list[Any] | None = None,
     parameters: dict[str, Any] | None = None,
+    *,
+    thread_safe: bool = False,
+    lazy_compilation: bool = False,
+    compile_cache_dir: str | os.PathLike[str] | None = None,
+    roots: list[type | tuple[type, Qualifier]] | None = None,
+    discovery: StaticDiscovery | None = None,
+    constant_parameters: bool = False,
 ) -> SyncContainer:
     """Create a Wireup container.
 
@@ -102,15 +216,52 @@ def create_sync_container(
     container instance. Use this when you want to explicitly list services.
     :param parameters: Dict containing parameters you want to expose to the container. Services or factories can
     request parameters via the `Inject(param="name")` syntax.
+    :param thread_safe: Set this when the container is shared between threads. Singletons are then created under
+    a per-service lock so that they are never created twice. Retrieving existing singletons remains lock-free.
+    :param lazy_compilation: Generate the code creating each service when it is first requested instead of upfront.
+    This reduces startup time when only a few of the registered services are used, such as in CLI tools or serverless
+    functions. Registrations are still validated when the container is created.
+    :param compile_cache_dir: Directory in which to cache the validated registrations and the code generated for
+    them. Later processes creating a container from unchanged registrations load these instead of inspecting,
+    validating and compiling them again, which reduces startup time of e.g. web server workers.
+    Only point this to a directory that is not writable by untrusted users.
+    :param roots: Services the process uses, as types or tuples of type and qualifier. When set, only these and
+    the services they depend on are part of the container, so that processes using a few entry points
+    do not pay for compiling all discovered services. Registrations are still validated in full.
+    :param discovery: Set to `StaticDiscovery()` to find services in service_modules by parsing their source
+    instead of importing every module. Only modules declaring services are then imported, so that modules
+    with heavy imports that register nothing do not slow down startup.
+    :param constant_parameters: Resolve each parameter and expression once and inject the result as a constant,
+    instead of looking it up whenever a service or function injecting it is created or called. Parameters are then
+    copied when the container is created, so later changes to the parameters dict are not seen by the container.
     :raises WireupError: Raised if the dependencies cannot be fully resolved.
     """
-    return _create_container(SyncContainer, service_modules=service_modules, services=services, parameters=parameters)
+    return _create_container(
+        SyncContainer,
+        service_modules=service_modules,
+        services=services,
+        parameters=parameters,
+        thread_safe=thread_safe,
+        lazy_compilation=lazy_compilation,
+        compile_cache_dir=compile_cache_dir,
+        roots=roots,
+        discovery=discovery,
+        constant_parameters=constant_parameters,
+    )
 
 
-def create_async_container(
+def create_async_container(  # noqa: PLR0913
     service_modules: list[ModuleType] | None = None,
     services: list[Any] | None = None,
     parameters: dict[str, Any] | None = None,
+    *,
+    concurrent_dependencies: bool = False,
+    thread_safe: bool = False,
+    lazy_compilation: bool = False,
+    compile_cache_dir: str | os.PathLike[str] | None = None,
+    roots: list[type | tuple[type, Qualifier]] | None = None,
+    discovery: StaticDiscovery | None = None,
+    constant_parameters: bool = False,
 ) -> AsyncContainer:
     """Create a Wireup container.
 
@@ -120,6 +271,38 @@ def create_async_container(
     container instance. Use this when you want to explicitly list services.
     :param parameters: Dict containing parameters you want to expose to the container. Services or factories can
     request parameters via the `Inject(param="name")` syntax.
+    :param concurrent_dependencies: When enabled, async dependencies of an async factory which do not depend on each
+    other are created concurrently instead of one after the other. Useful when several of them perform I/O.
+    :param thread_safe: Set this when synchronous singletons may be created from multiple threads. They are then
+    created under a per-service lock so that they are never created twice.
+    :param lazy_compilation: Generate the code creating each service when it is first requested instead of upfront.
+    This reduces startup time when only a few of the registered services are used, such as in CLI tools or serverless
+    functions. Registrations are still validated when the container is created.
+    :param compile_cache_dir: Directory in which to cache the validated registrations and the code generated for
+    them. Later processes creating a container from unchanged registrations load these instead of inspecting,
+    validating and compiling them again, which reduces startup time of e.g. web server workers.
+    Only point this to a directory that is not writable by untrusted users.
+    :param roots: Services the process uses, as types or tuples of type and qualifier. When set, only these and
+    the services they depend on are part of the container, so that processes using a few entry points
+    do not pay for compiling all discovered services. Registrations are still validated in full.
+    :param discovery: Set to `StaticDiscovery()` to find services in service_modules by parsing their source
+    instead of importing every module. Only modules declaring services are then imported, so that modules
+    with heavy imports that register nothing do not slow down startup.
+    :param constant_parameters: Resolve each parameter and expression once and inject the result as a constant,
+    instead of looking it up whenever a service or function injecting it is created or called. Parameters are then
+    copied when the container is created, so later changes to the parameters dict are not seen by the container.
     :raises WireupError: Raised if the dependencies cannot be fully resolved.
     """
-    return _create_container(AsyncContainer, service_modules=service_modules, services=services, parameters=parameters)
+    return _create_container(
+        AsyncContainer,
+        service_modules=service_modules,
+        services=services,
+        parameters=parameters,
+        concurrent_dependencies=concurrent_dependencies,
+        thread_safe=thread_safe,
+        lazy_compilation=lazy_compilation,
+        compile_cache_dir=compile_cache_dir,
+        roots=roots,
+        discovery=discovery,
+        constant_parameters=constant_parameters,
+    )
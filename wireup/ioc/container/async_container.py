@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Iterable, TypeVar
 
 from typing_extensions import Self
 
 from wireup.errors import UnknownServiceRequestedError
+from wireup.ioc._concurrency import gather_or_cancel
 from wireup.ioc._exit_stack import async_clean_exit_stack
-from wireup.ioc.container.base_container import BaseContainer
+from wireup.ioc.container.base_container import BaseContainer, ContainerCheckpoint, ServiceRequest
 from wireup.ioc.container.sync_container import ScopedSyncContainer
+from wireup.ioc.factory_compiler import EMPTY_SLOT
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -28,12 +30,58 @@ class BareAsyncContainer(BaseContainer):
         obj_id = hash(klass if qualifier is None else (klass, qualifier))
 
         if compiled_factory := self._factories.get(obj_id):
-            res = compiled_factory.factory(self)
+            if not compiled_factory.is_async:
+                return compiled_factory.factory(self)  # type:ignore[no-any-return]
 
-            return await res if compiled_factory.is_async else res  # type:ignore[no-any-return]
+            # Once created, return singletons without going through their async factory.
+            if (slot := compiled_factory.singleton_slot) is not None and (
+                instance := self._global_scope_objects[slot]
+            ) is not EMPTY_SLOT:
+                return instance  # type:ignore[no-any-return]
+
+            return await compiled_factory.factory(self)  # type:ignore[no-any-return]
 
         raise UnknownServiceRequestedError(klass, qualifier)
 
+    async def get_many(self, services: Iterable[ServiceRequest]) -> tuple[Any, ...]:
+        """Get instances of all the requested types.
+
+        :param services: Services to get. Each item is either a type or a tuple of type and qualifier.
+        :return: A tuple with an instance for each of the requested services, in the same order.
+        """
+        res = []
+
+        for service in services:
+            klass, qualifier = service if isinstance(service, tuple) else (service, None)
+            compiled_factory = self._factories.get(hash(klass if qualifier is None else (klass, qualifier)))
+
+            if not compiled_factory:
+                raise UnknownServiceRequestedError(klass, qualifier)
+
+            if not compiled_factory.is_async:
+                res.append(compiled_factory.factory(self))
+            # Once created, return singletons without going through their async factory.
+            elif (slot := compiled_factory.singleton_slot) is not None and (
+                instance := self._global_scope_objects[slot]
+            ) is not EMPTY_SLOT:
+                res.append(instance)
+            else:
+                res.append(await compiled_factory.factory(self))
+
+        return tuple(res)
+
+    def resolver(self, klass: type[T], qualifier: Qualifier | None = None) -> Callable[[BaseContainer], Any]:
+        """Return a handle which creates instances of the requested type.
+
+        The handle accepts the container to resolve from, which can be this one or any scope entered from it,
+        and is faster than `get` as it skips looking up the service on every call.
+        For async services the handle returns an awaitable, otherwise it returns the instance directly.
+
+        :param klass: Class of the dependency already registered in the container.
+        :param qualifier: Qualifier for the class if it was registered with one.
+        """
+        return self._resolver(klass, qualifier)
+
     async def close(self) -> None:
         await async_clean_exit_stack(self._global_scope_exit_stack)
 
@@ -53,13 +101,51 @@ class ScopedAsyncContainer(BareAsyncContainer):
 
 
 class AsyncContainer(BareAsyncContainer):
+    def clone(self) -> AsyncContainer:
+        """Return a new container with the same services, reusing the code compiled for this one.
+
+        The clone starts without any singletons, scopes or overrides and is otherwise independent from this container.
+        This is much cheaper than creating a container from scratch, such as to get a fresh container for every test.
+        """
+        return self._clone()
+
+    def checkpoint(self) -> ContainerCheckpoint:
+        """Capture the singletons which exist at this point, so that `restore` can roll back to them."""
+        return self._checkpoint()
+
+    async def restore(self, checkpoint: ContainerCheckpoint) -> None:
+        """Discard singletons created since the checkpoint was captured and clean up those created by generators.
+
+        Singletons which existed when the checkpoint was captured are kept. Do not call this while services
+        are being created.
+        """
+        await async_clean_exit_stack(self._restore(checkpoint))
+
+    async def warmup(self, roots: Iterable[type | tuple[type, Qualifier]] | None = None) -> None:
+        """Create singletons ahead of time instead of on first use.
+
+        Singletons are created in dependency order one level at a time. Factories within a level do not depend
+        on each other, so async ones are awaited concurrently.
+
+        :param roots: Services to warm up. Singletons among these and their dependencies will be created.
+        If not set, all registered singletons are created.
+        """
+        root_ids = None if roots is None else [root if isinstance(root, tuple) else (root, None) for root in roots]
+
+        for klass, qualifier in root_ids or []:
+            if not self._registry.is_type_with_qualifier_known(klass, qualifier):
+                raise UnknownServiceRequestedError(klass, qualifier)
+
+        for level in self._registry.get_singleton_levels(root_ids):
+            await gather_or_cancel(*(self.get(klass, qualifier) for klass, qualifier in level))
+
     def enter_scope(self) -> ScopedAsyncContainer:
         return ScopedAsyncContainer(
             registry=self._registry,
             override_manager=self._override_mgr,
             global_scope_objects=self._global_scope_objects,
             global_scope_exit_stack=self._global_scope_exit_stack,
-            current_scope_objects={},
+            current_scope_objects=[EMPTY_SLOT] * len(self._registry.scoped_slots),
             current_scope_exit_stack=[],
             factory_compiler=self._scoped_compiler,
             scoped_compiler=self._scoped_compiler,
@@ -77,7 +163,7 @@ def async_container_force_sync_scope(container: AsyncContainer) -> ScopedSyncCon
         override_manager=container._override_mgr,
         global_scope_objects=container._global_scope_objects,
         global_scope_exit_stack=container._global_scope_exit_stack,
-        current_scope_objects={},
+        current_scope_objects=[EMPTY_SLOT] * len(container._registry.scoped_slots),
         current_scope_exit_stack=[],
         factory_compiler=container._scoped_compiler,
         scoped_compiler=container._scoped_compiler,
@@ -1,20 +1,29 @@
+from dataclasses import dataclass
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    Callable,
     Dict,
+    FrozenSet,
     Generator,
+    Iterable,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
 
+from typing_extensions import Self
+
+from wireup._annotations import AbstractDeclaration, ServiceDeclaration
 from wireup.errors import (
     UnknownServiceRequestedError,
     WireupError,
 )
-from wireup.ioc.factory_compiler import FactoryCompiler
+from wireup.ioc.factory_compiler import EMPTY_SLOT, FactoryCompiler
 from wireup.ioc.override_manager import OverrideManager
 from wireup.ioc.parameter import ParameterBag
 from wireup.ioc.service_registry import ServiceRegistry
@@ -23,10 +32,26 @@ from wireup.ioc.types import (
     Qualifier,
 )
 
+if TYPE_CHECKING:
+    import asyncio
+    import threading
+
 T = TypeVar("T")
+ServiceRequest = Union[Type[Any], Tuple[Type[Any], Qualifier]]
 ContainerExitStack = List[Union[Generator[Any, Any, Any], AsyncGenerator[Any, Any]]]
 
 
+@dataclass(frozen=True)
+class ContainerCheckpoint:
+    """Singletons of a container at a point in time, as captured by `checkpoint()`."""
+
+    singletons: Tuple[Any, ...]
+    exit_stack_size: int
+    specialized: Tuple[FrozenSet[int], FrozenSet[int]]
+    storage: List[Any]
+    """Singleton storage of the container the checkpoint was captured from."""
+
+
 class BaseContainer:
     __slots__ = (
         "_compiler",
@@ -46,9 +71,9 @@ class BaseContainer:
         override_manager: OverrideManager,
         factory_compiler: FactoryCompiler,
         scoped_compiler: FactoryCompiler,
-        global_scope_objects: Dict[ContainerObjectIdentifier, Any],
+        global_scope_objects: List[Any],
         global_scope_exit_stack: List[Union[Generator[Any, Any, Any], AsyncGenerator[Any, Any]]],
-        current_scope_objects: Optional[Dict[ContainerObjectIdentifier, Any]] = None,
+        current_scope_objects: Optional[List[Any]] = None,
         current_scope_exit_stack: Optional[List[Union[Generator[Any, Any, Any], AsyncGenerator[Any, Any]]]] = None,
     ) -> None:
         self._registry = registry
@@ -71,6 +96,89 @@ class BaseContainer:
         """Override registered container services with new values."""
         return self._override_mgr
 
+    def _extend(self, impls: List[ServiceDeclaration], abstracts: Optional[List[AbstractDeclaration]] = None) -> None:
+        """Register additional services with this container and any scopes entered from it.
+
+        Declarations are registered in one batch, and only the new services are validated and compiled.
+        """
+        obj_ids = self._registry.extend(abstracts=abstracts, impls=impls)
+        self._compiler.compile(obj_ids)
+        self._scoped_compiler.compile(obj_ids)
+
+        # Singleton storage is shared with existing scopes, so grow it in place to make room for new slots.
+        self._global_scope_objects.extend(
+            [EMPTY_SLOT] * (len(self._registry.singleton_slots) - len(self._global_scope_objects))
+        )
+
+    def _clone(self) -> Self:
+        """Return a container with the same registrations and compiled code as this one, but no singletons."""
+        singleton_locks: Optional[Dict[ContainerObjectIdentifier, threading.Lock]] = (
+            None if self._compiler._singleton_locks is None else {}
+        )
+        in_flight: Dict[Any, asyncio.Future[Any]] = {}
+        # Services registered with the clone, such as by integrations, must not be registered with this container.
+        registry = self._registry.copy()
+        compiler = self._compiler.clone(registry=registry, singleton_locks=singleton_locks, in_flight=in_flight)
+        scoped_compiler = self._scoped_compiler.clone(
+            registry=registry, singleton_locks=singleton_locks, in_flight=in_flight
+        )
+
+        return type(self)(
+            registry=registry,
+            override_manager=OverrideManager(registry.is_type_with_qualifier_known, compiler, scoped_compiler),
+            factory_compiler=compiler,
+            scoped_compiler=scoped_compiler,
+            global_scope_objects=[EMPTY_SLOT] * len(registry.singleton_slots),
+            global_scope_exit_stack=[],
+        )
+
+    def _checkpoint(self) -> ContainerCheckpoint:
+        return ContainerCheckpoint(
+            singletons=tuple(self._global_scope_objects),
+            exit_stack_size=len(self._global_scope_exit_stack),
+            specialized=(self._compiler.get_specialized(), self._scoped_compiler.get_specialized()),
+            storage=self._global_scope_objects,
+        )
+
+    def _restore(self, checkpoint: ContainerCheckpoint) -> ContainerExitStack:
+        """Roll singletons back to the checkpoint and return the exit stack of singletons created since."""
+        if checkpoint.storage is not self._global_scope_objects:
+            msg = "Cannot restore a checkpoint captured from a different container."
+            raise WireupError(msg)
+
+        # Storage is shared with scopes entered from this container, so update it in place.
+        storage = self._global_scope_objects
+        storage[: len(checkpoint.singletons)] = checkpoint.singletons
+        storage[len(checkpoint.singletons) :] = [EMPTY_SLOT] * (len(storage) - len(checkpoint.singletons))
+        self._compiler.restore_specialized(checkpoint.specialized[0])
+        self._scoped_compiler.restore_specialized(checkpoint.specialized[1])
+
+        exit_stack = self._global_scope_exit_stack[checkpoint.exit_stack_size :]
+        del self._global_scope_exit_stack[checkpoint.exit_stack_size :]
+
+        return exit_stack
+
+    def _fork_exit_stacks(self) -> Self:
+        """Return a container sharing the state of this one, except for exit stacks which are empty."""
+        return type(self)(
+            registry=self._registry,
+            override_manager=self._override_mgr,
+            factory_compiler=self._compiler,
+            scoped_compiler=self._scoped_compiler,
+            global_scope_objects=self._global_scope_objects,
+            global_scope_exit_stack=[],
+            current_scope_objects=self._current_scope_objects,
+            current_scope_exit_stack=None if self._current_scope_exit_stack is None else [],
+        )
+
+    def _resolver(self, klass: Type[T], qualifier: Optional[Qualifier] = None) -> Callable[["BaseContainer"], Any]:
+        if hash(klass if qualifier is None else (klass, qualifier)) not in self._factories:
+            raise UnknownServiceRequestedError(klass, qualifier)
+
+        # Handles are generated by the scoped compiler so that they work with any scope. When given the root
+        # container, handles of services which require a scope raise the same error as get does.
+        return self._scoped_compiler.create_resolver(klass, qualifier)
+
     def _synchronous_get(self, klass: Type[T], qualifier: Optional[Qualifier] = None) -> T:
         """Get an instance of the requested type.
 
@@ -82,12 +190,38 @@ class BaseContainer:
 
         if compiled_factory := self._factories.get(obj_id):
             if compiled_factory.is_async:
-                msg = (
-                    f"{klass} is an async dependency and it cannot be created in a synchronous context. "
-                    "Create and use an async container via wireup.create_async_container."
-                )
-                raise WireupError(msg)
+                raise _async_dependency_in_sync_context_error(klass)
 
             return compiled_factory.factory(self)  # type:ignore[no-any-return]
 
         raise UnknownServiceRequestedError(klass, qualifier)
+
+    def _synchronous_get_many(self, services: Iterable[ServiceRequest]) -> Tuple[Any, ...]:
+        """Get instances of all the requested types.
+
+        :param services: Services to get. Each item is either a type or a tuple of type and qualifier.
+        :return: A tuple with an instance for each of the requested services, in the same order.
+        """
+        res = []
+
+        for service in services:
+            klass, qualifier = service if isinstance(service, tuple) else (service, None)
+            compiled_factory = self._factories.get(hash(klass if qualifier is None else (klass, qualifier)))
+
+            if not compiled_factory:
+                raise UnknownServiceRequestedError(klass, qualifier)
+
+            if compiled_factory.is_async:
+                raise _async_dependency_in_sync_context_error(klass)
+
+            res.append(compiled_factory.factory(self))
+
+        return tuple(res)
+
+
+def _async_dependency_in_sync_context_error(klass: Type[Any]) -> WireupError:
+    msg = (
+        f"{klass} is an async dependency and it cannot be created in a synchronous context. "
+        "Create and use an async container via wireup.create_async_container."
+    )
+    return WireupError(msg)
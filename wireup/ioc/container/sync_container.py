@@ -1,18 +1,44 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, TypeVar
 
 from typing_extensions import Self
 
 from wireup.ioc._exit_stack import clean_exit_stack
-from wireup.ioc.container.base_container import BaseContainer
+from wireup.ioc.container.base_container import (
+    BaseContainer,
+    ContainerCheckpoint,
+    _async_dependency_in_sync_context_error,
+)
+from wireup.ioc.factory_compiler import EMPTY_SLOT
 
 if TYPE_CHECKING:
     from types import TracebackType
 
+    from wireup.ioc.types import Qualifier
+
+T = TypeVar("T")
+
 
 class BareSyncContainer(BaseContainer):
     get = BaseContainer._synchronous_get
+    get_many = BaseContainer._synchronous_get_many
+
+    def resolver(self, klass: type[T], qualifier: Qualifier | None = None) -> Callable[[BaseContainer], T]:
+        """Return a handle which creates instances of the requested type.
+
+        The handle accepts the container to resolve from, which can be this one or any scope entered from it,
+        and is faster than `get` as it skips looking up the service on every call.
+
+        :param klass: Class of the dependency already registered in the container.
+        :param qualifier: Qualifier for the class if it was registered with one.
+        """
+        compiled_factory = self._factories.get(hash(klass if qualifier is None else (klass, qualifier)))
+
+        if compiled_factory and compiled_factory.is_async:
+            raise _async_dependency_in_sync_context_error(klass)
+
+        return self._resolver(klass, qualifier)
 
     def close(self) -> None:
         clean_exit_stack(self._global_scope_exit_stack)
@@ -33,13 +59,33 @@ class ScopedSyncContainer(BareSyncContainer):
 
 
 class SyncContainer(BareSyncContainer):
+    def clone(self) -> SyncContainer:
+        """Return a new container with the same services, reusing the code compiled for this one.
+
+        The clone starts without any singletons, scopes or overrides and is otherwise independent from this container.
+        This is much cheaper than creating a container from scratch, such as to get a fresh container for every test.
+        """
+        return self._clone()
+
+    def checkpoint(self) -> ContainerCheckpoint:
+        """Capture the singletons which exist at this point, so that `restore` can roll back to them."""
+        return self._checkpoint()
+
+    def restore(self, checkpoint: ContainerCheckpoint) -> None:
+        """Discard singletons created since the checkpoint was captured and clean up those created by generators.
+
+        Singletons which existed when the checkpoint was captured are kept. Do not call this while services
+        are being created from other threads.
+        """
+        clean_exit_stack(self._restore(checkpoint))
+
     def enter_scope(self) -> ScopedSyncContainer:
         return ScopedSyncContainer(
             registry=self._registry,
             override_manager=self._override_mgr,
             global_scope_objects=self._global_scope_objects,
             global_scope_exit_stack=self._global_scope_exit_stack,
-            current_scope_objects={},
+            current_scope_objects=[EMPTY_SLOT] * len(self._registry.scoped_slots),
             current_scope_exit_stack=[],
             factory_compiler=self._scoped_compiler,
             scoped_compiler=self._scoped_compiler,
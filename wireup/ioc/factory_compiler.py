@@ -1,13 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import textwrap
+import threading
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, Hashable
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, NoReturn
 
 from wireup.errors import WireupError
+from wireup.ioc._concurrency import fail_in_flight, gather_dependencies
 from wireup.ioc.service_registry import GENERATOR_FACTORY_TYPES, FactoryType, ServiceRegistry
-from wireup.ioc.types import ParameterWrapper, TemplatedString
+from wireup.ioc.types import (
+    ContainerObjectIdentifier,
+    ParameterReference,
+    ParameterWrapper,
+    ServiceLifetime,
+    TemplatedString,
+)
 
 if TYPE_CHECKING:
+    from types import CodeType
+
     from wireup.ioc.container.base_container import BaseContainer
     from wireup.ioc.service_registry import ServiceFactory
 
@@ -16,6 +30,10 @@ if TYPE_CHECKING:
 class CompiledFactory:
     factory: Callable[[BaseContainer], Any]
     is_async: bool
+    singleton_slot: int | None = None
+    """Slot holding the instance in the singleton storage when the factory creates a singleton."""
+    specialized_from: CompiledFactory | None = None
+    """Generated factory of a singleton which this factory replaced by returning its instance directly."""
 
 
 _CONTAINER_SCOPE_ERROR_MSG = (
@@ -25,109 +43,462 @@ _CONTAINER_SCOPE_ERROR_MSG = (
 )
 _WIREUP_GENERATED_FACTORY_NAME = "_wireup_factory"
 
+EMPTY_SLOT: Any = object()
+"""Value of storage slots whose service has not been created yet. Services themselves may be None or falsy."""
+
 
 class FactoryCompiler:
-    def __init__(self, registry: ServiceRegistry, *, is_scoped_container: bool) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        registry: ServiceRegistry,
+        *,
+        is_scoped_container: bool,
+        concurrent_dependencies: bool = False,
+        singleton_locks: dict[ContainerObjectIdentifier, threading.Lock] | None = None,
+        in_flight: dict[Any, asyncio.Future[Any]] | None = None,
+        code_cache: dict[str, CodeType] | None = None,
+        lazy: bool = False,
+    ) -> None:
+        """Create a new FactoryCompiler.
+
+        :param is_scoped_container: Whether the generated factories are used by scoped containers.
+        Base containers can only create singletons.
+        :param concurrent_dependencies: Create independent async dependencies of async factories concurrently.
+        :param singleton_locks: When set, singleton factories hold a per-service lock, stored here, while creating
+        the instance so that concurrent threads never create it twice. Compilers of the same container must share it.
+        :param in_flight: Holds futures for async singleton and scoped services being created, which concurrent
+        callers await rather than creating the service again. Compilers of the same container must share it.
+        :param code_cache: Compiled code of generated factories by the symbol they are bound to. Factories of singletons
+        are generated identically by both compilers of a container, so sharing this between them compiles each only
+        once. It may also be populated upfront with code compiled by an earlier process for the same registrations
+        and options, in which case the source of these factories is not generated at all.
+        :param lazy: Defer generating the factory of each service until it is first called.
+        """
         self._registry = registry
         self._is_scoped_container = is_scoped_container
+        self._concurrent_dependencies = concurrent_dependencies
+        self._singleton_locks = singleton_locks
+        self._code_cache = code_cache
+        self._lazy = lazy
+        # Scopes are entered with storage for the scoped services registered at the time. Services added later
+        # have slots past this count, which scopes entered before they were added do not have yet.
+        self._scoped_slot_count = len(registry.scoped_slots)
         self.factories: dict[int, CompiledFactory] = {}
+        # Generated factories share a single namespace and call their dependencies directly by name
+        # instead of going through the factories table. Each object id is bound to a symbol in this namespace,
+        # which is also what allows factories to be swapped (e.g.: by overrides) by relinking the symbol.
+        self._namespace: dict[str, Any] = {
+            "TemplatedString": TemplatedString,
+            "EMPTY_SLOT": EMPTY_SLOT,
+            "IN_FLIGHT": {} if in_flight is None else in_flight,
+            "asyncio": asyncio,
+            "fail_in_flight": fail_in_flight,
+            "gather_dependencies": gather_dependencies,
+            "parameters": self._registry.parameters,
+            "scope_error_factory": _scope_error_factory,
+        }
+        self._symbols: dict[int, str] = {}
+        self._taken_symbols: set[str] = set()
+        self._async_symbols: set[int] = set()
+        # Code of the factory generated for each object id. Compilers cloned from this one reuse it.
+        self._compiled_code: dict[int, CodeType] = {}
+        # Specialized singleton factories by object id, so that they can be undone when rolling back singletons.
+        self._specialized: dict[int, CompiledFactory] = {}
+        # Guards replacing factories so that a singleton specializing itself never undoes a concurrent override.
+        # Also serializes lazily compiling factories, which may happen from any thread.
+        self._lock = threading.Lock()
 
     @classmethod
     def get_object_id(cls, impl: type, qualifier: Hashable) -> int:
         return hash(impl if qualifier is None else (impl, qualifier))
 
-    def compile(self) -> None:
-        for impl, qualifiers in self._registry.impls.items():
-            for qualifier in qualifiers:
-                obj_id = FactoryCompiler.get_object_id(impl, qualifier)
-
-                if obj_id not in self.factories:
-                    self.factories[obj_id] = self._compile_and_create_function(
-                        self._registry.factories[impl, qualifier],
-                        impl,
-                        qualifier,
-                    )
-
-        for interface, impls in self._registry.interfaces.items():
-            for qualifier, impl in impls.items():
-                obj_id = FactoryCompiler.get_object_id(interface, qualifier)
-
-                if obj_id not in self.factories:
-                    self.factories[obj_id] = self._compile_and_create_function(
-                        self._registry.factories[impl, qualifier],
-                        interface,
-                        qualifier,
-                    )
-
-    def _get_factory_code(self, factory: ServiceFactory, impl: type, qualifier: Hashable) -> tuple[str, bool]:  # noqa: C901, PLR0912
-        is_interface = self._registry.is_interface_known(impl)
-        if is_interface:
-            lifetime = self._registry.lifetime[self._registry.interface_resolve_impl(impl, qualifier), qualifier]
-        else:
-            lifetime = self._registry.lifetime[impl, qualifier]
+    def clone(
+        self,
+        *,
+        registry: ServiceRegistry,
+        singleton_locks: dict[ContainerObjectIdentifier, threading.Lock] | None,
+        in_flight: dict[Any, asyncio.Future[Any]],
+    ) -> FactoryCompiler:
+        """Return a compiler creating the same factories from the code generated by this one.
+
+        Factories of the new compiler are not linked to singletons created through this one, nor to overrides.
+
+        :param registry: Registry of the new compiler. A copy of this compiler's registry, so that either can be
+        extended without affecting the other.
+        :param singleton_locks: Locks of the new compiler, as with the constructor argument of the same name.
+        :param in_flight: In-flight creations of the new compiler, as with the constructor argument of the same name.
+        """
+        res = FactoryCompiler(
+            registry,
+            is_scoped_container=self._is_scoped_container,
+            concurrent_dependencies=self._concurrent_dependencies,
+            singleton_locks=singleton_locks,
+            in_flight=in_flight,
+            code_cache=self._code_cache,
+            lazy=self._lazy,
+        )
+        res._symbols = dict(self._symbols)
+        res._taken_symbols = set(self._taken_symbols)
+        res._compiled_code = dict(self._compiled_code)
+        res.compile()
+
+        return res
+
+    def compile(self, obj_ids: Iterable[ContainerObjectIdentifier] | None = None) -> None:
+        """Create factories for the given services and interfaces, or for all registered ones without a factory."""
+        for klass, qualifier in self._registry.ctors if obj_ids is None else obj_ids:
+            obj_id = FactoryCompiler.get_object_id(klass, qualifier)
+
+            if obj_id not in self.factories:
+                impl_obj_id = self._registry.ctors[klass, qualifier][1]
+                self.set_factory(obj_id, self._create_factory(self._registry.factories[impl_obj_id], klass, qualifier))
+
+    def _create_factory(self, factory: ServiceFactory, impl: type, qualifier: Hashable) -> CompiledFactory:
+        self._get_symbol(impl, qualifier)
+
+        if (
+            not self._is_scoped_container
+            and self._registry.lifetime[self._registry.resolve_obj_id(impl, qualifier)] != "singleton"
+        ):
+            return CompiledFactory(factory=_scope_error_factory, is_async=False)
+
+        if self._lazy:
+            return self._create_lazy_factory(factory, impl, qualifier)
+
+        return self._compile_and_create_function(factory, impl, qualifier)
+
+    def _create_lazy_factory(self, factory: ServiceFactory, impl: type, qualifier: Hashable) -> CompiledFactory:
+        """Create a stub which compiles the factory on first call, replaces itself with it and then calls it."""
+        obj_id = FactoryCompiler.get_object_id(impl, qualifier)
+        resolved_obj_id = self._registry.resolve_obj_id(impl, qualifier)
+        is_async = factory.is_async
+
+        def _link() -> CompiledFactory:
+            with self._lock:
+                # Another caller may have compiled this already, or the stub may have been overridden meanwhile.
+                if self.factories[obj_id].factory in (_stub, _async_stub):
+                    self._set_factory(obj_id, self._compile_and_create_function(factory, impl, qualifier))
+
+                return self.factories[obj_id]
+
+        def _stub(container: BaseContainer) -> Any:
+            return _link().factory(container)
+
+        async def _async_stub(container: BaseContainer) -> Any:
+            compiled_factory = _link()
+            res = compiled_factory.factory(container)
+
+            return await res if compiled_factory.is_async else res
+
+        if is_async:
+            self._async_symbols.add(obj_id)
+
+        return CompiledFactory(
+            factory=_async_stub if is_async else _stub,
+            is_async=is_async,
+            singleton_slot=self._registry.singleton_slots.get(resolved_obj_id),
+        )
+
+    def set_factory(self, obj_id: int, compiled_factory: CompiledFactory) -> None:
+        """Set the factory for the given object id and relink any generated code calling it."""
+        with self._lock:
+            # Overrides put back the factory they replaced when removed. If that is a specialized singleton
+            # which has since been rolled back, then use the generated factory it replaced instead.
+            if compiled_factory.specialized_from is not None and self._specialized.get(obj_id) is not compiled_factory:
+                compiled_factory = compiled_factory.specialized_from
+
+            self._set_factory(obj_id, compiled_factory)
+
+    def _set_factory(self, obj_id: int, compiled_factory: CompiledFactory) -> None:
+        self.factories[obj_id] = compiled_factory
+        factory = compiled_factory.factory
+
+        # Generated code awaits async dependencies. If a sync factory replaces an async one (e.g.: overrides),
+        # then dependents must be linked against an awaitable version of it.
+        if obj_id in self._async_symbols and not compiled_factory.is_async:
+            factory = _to_async_factory(factory)
+
+        self._namespace[self._symbols[obj_id]] = factory
+
+    def _specialize_singleton(self, obj_id: int, instance: Any) -> None:
+        """Replace the generated factory of a created singleton with one which returns the instance directly.
+
+        Called by generated singleton factories once the instance exists, after which dependents
+        no longer go through singleton storage to get it.
+        """
+        with self._lock:
+            compiled_factory = self.factories[obj_id]
+
+            # Only generated factories are specialized. Anything else, such as an override, is left in place.
+            if compiled_factory.singleton_slot is not None and compiled_factory.specialized_from is None:
+                # The slot is kept so that async containers keep returning the instance from storage
+                # without creating a coroutine. Async singletons remain async, as sync callers must not use them.
+                self._specialized[obj_id] = CompiledFactory(
+                    factory=_constant_factory(instance, is_async=compiled_factory.is_async),
+                    is_async=compiled_factory.is_async,
+                    singleton_slot=compiled_factory.singleton_slot,
+                    specialized_from=compiled_factory,
+                )
+                self._set_factory(obj_id, self._specialized[obj_id])
+
+    def get_specialized(self) -> frozenset[int]:
+        """Return the object ids of singletons whose factories are currently specialized."""
+        with self._lock:
+            return frozenset(self._specialized)
+
+    def restore_specialized(self, keep: frozenset[int]) -> None:
+        """Restore the generated factories of specialized singletons, except for the ones in keep."""
+        with self._lock:
+            for obj_id in [obj_id for obj_id in self._specialized if obj_id not in keep]:
+                specialized = self._specialized.pop(obj_id)
+
+                # Entries replaced since, such as by an active override, are left in place.
+                if self.factories[obj_id] is specialized and specialized.specialized_from is not None:
+                    self._set_factory(obj_id, specialized.specialized_from)
+
+    def create_resolver(self, klass: type, qualifier: Hashable) -> Callable[[BaseContainer], Any]:
+        """Return a function calling the factory of the given service directly.
 
-        if lifetime != "singleton" and not self._is_scoped_container:
-            code = f"def {_WIREUP_GENERATED_FACTORY_NAME}(container):\n"
-            code += "    raise WireupError(_CONTAINER_SCOPE_ERROR_MSG)\n"
+        The function reads the symbol the factory is linked to, so it follows replacements of the factory
+        such as overrides without looking it up on each call. Async services always return an awaitable.
+        """
+        code = "def _wireup_resolver(container):\n"
 
-            return code, False
+        if self._registry.lifetime[self._registry.resolve_obj_id(klass, qualifier)] != "singleton":
+            # Factories of scoped compilers expect a scope. Singletons are created the same way from any container.
+            code += "    if container._current_scope_objects is None:\n"
+            code += "        return scope_error_factory(container)\n"
+
+        code += f"    return {self._symbols[FactoryCompiler.get_object_id(klass, qualifier)]}(container)\n"
+        # Defined in a namespace of its own, so that concurrent compilations never pick up each other's functions.
+        # The function still reads symbols from the shared namespace, which is its globals.
+        local_namespace: dict[str, Any] = {}
+        exec(compile(code, "<_wireup_resolver>", "exec"), self._namespace, local_namespace)  # noqa: S102
+
+        return local_namespace["_wireup_resolver"]  # type: ignore[no-any-return]
+
+    def _get_symbol(self, klass: type, qualifier: Hashable) -> str:
+        obj_id = FactoryCompiler.get_object_id(klass, qualifier)
+
+        if (symbol := self._symbols.get(obj_id)) is None:
+            # Derived from the service rather than from hash() or the compilation order, so that both compilers
+            # of a container and later processes generate the same code for it, which lets them reuse compiled code.
+            key = f"{klass.__module__}.{klass.__qualname__}:{qualifier!r}"
+            symbol = f"{_WIREUP_GENERATED_FACTORY_NAME}_{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"
+            while symbol in self._taken_symbols:
+                symbol += "_"
+
+            self._symbols[obj_id] = symbol
+            self._taken_symbols.add(symbol)
+
+        return symbol
+
+    def _get_factory_code(self, factory: ServiceFactory, impl: type, qualifier: Hashable) -> tuple[str, bool]:
+        lifetime = self._registry.lifetime[self._registry.resolve_obj_id(impl, qualifier)]
+
+        symbol = self._get_symbol(impl, qualifier)
+        code = "def _wireup_make_factory(SLOT, ORIGINAL_FACTORY, LOCK, SPECIALIZE):\n"
 
         maybe_async = "async " if factory.is_async else ""
-        code = f"{maybe_async}def {_WIREUP_GENERATED_FACTORY_NAME}(container):\n"
+        code += f"    {maybe_async}def {symbol}(container):\n"
         cache_created_instance = lifetime != "transient"
+        # Cached instances live in a list with a slot per service.
+        cache_hit_code = "        if (res := storage[SLOT]) is not EMPTY_SLOT:\n"
+        if lifetime == "singleton":
+            # Singletons created through the other compiler of the container are first seen here.
+            cache_hit_code += "            SPECIALIZE(res)\n"
+        cache_hit_code += "            return res\n"
 
         if cache_created_instance:
             if lifetime == "singleton":
-                code += "    storage = container._global_scope_objects\n"
+                code += "        storage = container._global_scope_objects\n"
+            else:
+                code += "        storage = container._current_scope_objects\n"
+
+                if self._grows_scoped_storage(impl, qualifier):
+                    code += "        if len(storage) <= SLOT:\n"
+                    code += "            storage.extend([EMPTY_SLOT] * (SLOT + 1 - len(storage)))\n"
+
+            code += cache_hit_code
+
+        creation_code = self._get_creation_code(factory, lifetime)
+
+        if self._uses_singleton_lock(factory, lifetime):
+            # Double-checked locking: The lock is only acquired when the instance does not exist yet.
+            code += "        with LOCK:\n"
+            code += textwrap.indent(cache_hit_code + creation_code, "    ")
+        elif cache_created_instance and factory.is_async:
+            # Callers arriving while the instance is being created await the same creation instead of starting
+            # another one. In-flight creations are keyed by storage so that each scope creates its own instance.
+            code += "        in_flight_key = (id(storage), SLOT)\n"
+            code += "        while in_flight := IN_FLIGHT.get(in_flight_key):\n"
+            # A cancelled creation resolves to an empty slot, upon which one of the waiters starts it again.
+            code += "            if (res := await asyncio.shield(in_flight)) is not EMPTY_SLOT:\n"
+            code += "                return res\n"
+            code += "        IN_FLIGHT[in_flight_key] = in_flight = asyncio.get_running_loop().create_future()\n"
+            code += "        try:\n"
+            code += textwrap.indent(creation_code, "    ")
+            code += "        except asyncio.CancelledError:\n"
+            code += "            in_flight.set_result(EMPTY_SLOT)\n"
+            code += "            raise\n"
+            code += "        except BaseException as e:\n"
+            code += "            fail_in_flight(in_flight, e)\n"
+            code += "            raise\n"
+            code += "        finally:\n"
+            code += "            del IN_FLIGHT[in_flight_key]\n"
+            code += "        in_flight.set_result(instance)\n"
+        else:
+            code += creation_code
+
+        code += "        return instance\n"
+        code += f"    return {symbol}\n"
+
+        return code, factory.is_async
+
+    def _get_creation_code(self, factory: ServiceFactory, lifetime: ServiceLifetime) -> str:
+        code, kwargs = self._get_dependencies_code(factory, lifetime)
+
+        maybe_await = "await " if factory.factory_type == FactoryType.COROUTINE_FN else ""
+
+        code += f"        instance = {maybe_await}ORIGINAL_FACTORY({kwargs})\n"
+
+        if factory.factory_type in GENERATOR_FACTORY_TYPES:
+            if lifetime == "singleton":
+                code += "        container._global_scope_exit_stack.append(instance)\n"
             else:
-                code += "    storage = container._current_scope_objects\n"
+                code += "        container._current_scope_exit_stack.append(instance)\n"
+
+            if factory.factory_type == FactoryType.GENERATOR:
+                code += "        instance = next(instance)\n"
+            else:
+                code += "        instance = await instance.__anext__()\n"
+
+        if lifetime != "transient":
+            code += "        storage[SLOT] = instance\n"
+
+        if lifetime == "singleton":
+            code += "        SPECIALIZE(instance)\n"
+
+        return code
 
-            code += "    if res := storage.get(OBJ_ID):\n"
-            code += "        return res\n"
+    def _get_slot(self, obj_id: ContainerObjectIdentifier) -> int | None:
+        if self._registry.lifetime[obj_id] == "singleton":
+            return self._registry.singleton_slots[obj_id]
 
+        return self._registry.scoped_slots.get(obj_id)
+
+    def _uses_singleton_lock(self, factory: ServiceFactory, lifetime: ServiceLifetime) -> bool:
+        # Async factories run on the event loop where blocking on a thread lock is not an option.
+        return self._singleton_locks is not None and lifetime == "singleton" and not factory.is_async
+
+    def _get_dependencies_code(self, factory: ServiceFactory, lifetime: ServiceLifetime) -> tuple[str, str]:
+        code = ""
         kwargs = ""
+        concurrent_groups = {
+            name: group for group in self._get_concurrent_dependency_groups(factory, lifetime) for name in group
+        }
+
         for name, dep in self._registry.dependencies[factory.factory].items():
-            if isinstance(dep.annotation, ParameterWrapper):
+            kwargs += f"{name}=_obj_dep_{name}, "
+
+            if isinstance(dep.annotation, ParameterWrapper) and self._registry.parameters.constant:
+                code += f"        _obj_dep_{name} = {_get_parameter_symbol(dep.annotation.param)}\n"
+            elif isinstance(dep.annotation, ParameterWrapper):
                 param_value = (
                     str(dep.annotation.param)
                     if isinstance(dep.annotation.param, TemplatedString)
                     else f'"{dep.annotation.param}"'
                 )
-                code += f"    _obj_dep_{name} = parameters.get({param_value})\n"
+                code += f"        _obj_dep_{name} = parameters.get({param_value})\n"
+            elif group := concurrent_groups.get(name):
+                # Dependencies of a group are awaited together in place of the first one.
+                if name == group[0]:
+                    targets = ", ".join(f"_obj_dep_{n}" for n in group)
+                    symbols = ", ".join(self._get_dependency_symbol(n, factory) for n in group)
+                    code += f"        {targets} = await gather_dependencies(container, {symbols})\n"
             else:
-                if self._registry.is_interface_known(dep.klass):
-                    dep_class = self._registry.interface_resolve_impl(dep.klass, dep.qualifier_value)
-                else:
-                    dep_class = dep.klass
-
-                maybe_await = "await " if self._registry.factories[dep_class, dep.qualifier_value].is_async else ""
-                dep_hash = FactoryCompiler.get_object_id(dep_class, dep.qualifier_value)
-                code += f"    _obj_dep_{name} = {maybe_await}factories[{dep_hash}].factory(container)\n"
-            kwargs += f"{name}=_obj_dep_{name}, "
+                dep_obj_id = self._registry.resolve_obj_id(dep.klass, dep.qualifier_value)
+                maybe_await = "await " if self._registry.factories[dep_obj_id].is_async else ""
+                code += (
+                    f"        _obj_dep_{name} = {maybe_await}{self._get_dependency_symbol(name, factory)}(container)\n"
+                )
 
-        maybe_await = "await " if factory.factory_type == FactoryType.COROUTINE_FN else ""
+        return code, kwargs.strip()
 
-        code += f"    instance = {maybe_await}ORIGINAL_FACTORY({kwargs.strip()})\n"
+    def _get_dependency_symbol(self, name: str, factory: ServiceFactory) -> str:
+        dep = self._registry.dependencies[factory.factory][name]
+        dep_class, dep_qualifier = self._registry.resolve_obj_id(dep.klass, dep.qualifier_value)
 
-        if factory.factory_type in GENERATOR_FACTORY_TYPES:
-            if lifetime == "singleton":
-                code += "    container._global_scope_exit_stack.append(instance)\n"
-            else:
-                code += "    container._current_scope_exit_stack.append(instance)\n"
+        return self._get_symbol(dep_class, dep_qualifier)
 
-            if factory.factory_type == FactoryType.GENERATOR:
-                code += "    instance = next(instance)\n"
-            else:
-                code += "    instance = await instance.__anext__()\n"
+    def _get_concurrent_dependency_groups(self, factory: ServiceFactory, lifetime: ServiceLifetime) -> list[list[str]]:
+        """Return groups of names of async dependencies of the factory which can be created concurrently.
 
-        if cache_created_instance:
-            code += "    storage[OBJ_ID] = instance\n"
-            if is_interface:
-                code += "    storage[ORIGINAL_OBJ_ID] = instance\n"
+        Groups are runs of consecutive dependencies, so that each dependency is still created after the ones
+        declared before it, as without concurrent creation. Dependencies are only grouped when they share
+        no cached (singleton or scoped) services, directly or transitively, so that concurrent creation never
+        races on the same cached instance.
+        """
+        if not (self._concurrent_dependencies and factory.is_async):
+            return []
 
-        code += "    return instance\n"
+        groups: list[list[str]] = [[]]
+        claimed: set[ContainerObjectIdentifier] = set()
 
-        return code, factory.is_async
+        for name, dep in self._registry.dependencies[factory.factory].items():
+            if dep.is_parameter:
+                continue
+
+            dep_obj_id = self._registry.resolve_obj_id(dep.klass, dep.qualifier_value)
+
+            # Unless the factory itself is a singleton, its singleton dependencies will usually have already been
+            # created and awaiting them concurrently would only add overhead.
+            if not self._registry.factories[dep_obj_id].is_async or (
+                lifetime != "singleton" and self._registry.lifetime[dep_obj_id] == "singleton"
+            ):
+                groups.append([])
+                claimed = set()
+                continue
+
+            cached = {
+                obj_id
+                for obj_id in {dep_obj_id, *self._registry.get_transitive_dependencies(dep_obj_id)}
+                if self._registry.lifetime[obj_id] != "transient"
+            }
+
+            # Dependencies sharing cached services with the current group start the next one.
+            if not cached.isdisjoint(claimed):
+                groups.append([])
+                claimed = set()
+
+            groups[-1].append(name)
+            claimed.update(cached)
+
+        return [group for group in groups if len(group) > 1]
+
+    def _grows_scoped_storage(self, impl: type, qualifier: Hashable) -> bool:
+        """Return whether scopes entered before the service was registered may not have a storage slot for it."""
+        slot = self._registry.scoped_slots.get(self._registry.resolve_obj_id(impl, qualifier))
+
+        return slot is not None and slot >= self._scoped_slot_count
+
+    def _get_code(self, factory: ServiceFactory, impl: type, qualifier: Hashable) -> CodeType:
+        """Return the compiled code of the factory, generating its source only when it is not cached."""
+        # Symbols are the same in every process, so they identify the code of a factory without generating it.
+        key = self._get_symbol(impl, qualifier)
+        if self._grows_scoped_storage(impl, qualifier):
+            key += ":grows_scoped_storage"
+
+        if self._code_cache is not None and (code := self._code_cache.get(key)) is not None:
+            return code
+
+        source, _ = self._get_factory_code(factory, impl, qualifier)
+        code = compile(source, f"<{_WIREUP_GENERATED_FACTORY_NAME}_{(impl, qualifier)}>", "exec")
+
+        if self._code_cache is not None:
+            self._code_cache[key] = code
+
+        return code
 
     def _compile_and_create_function(self, factory: ServiceFactory, impl: type, qualifier: Hashable) -> CompiledFactory:
         obj_id = impl, qualifier
@@ -137,25 +508,82 @@ class FactoryCompiler:
             else obj_id
         )
 
-        source, is_async = self._get_factory_code(factory, impl, qualifier)
+        symbol_obj_id = FactoryCompiler.get_object_id(impl, qualifier)
+        is_async = factory.is_async
+        lock = None
 
-        try:
-            namespace: dict[str, Any] = {
-                "factories": self.factories,
-                "ORIGINAL_OBJ_ID": obj_id,
-                "OBJ_ID": resolved_obj_id,
-                "ORIGINAL_FACTORY": self._registry.ctors[obj_id][0],
-                "TemplatedString": TemplatedString,
-                "WireupError": WireupError,
-                "_CONTAINER_SCOPE_ERROR_MSG": _CONTAINER_SCOPE_ERROR_MSG,
-                "parameters": self._registry.parameters,
-            }
-
-            compiled_code = compile(source, f"<{_WIREUP_GENERATED_FACTORY_NAME}_{obj_id}>", "exec")
-            exec(compiled_code, namespace)  # noqa: S102
-
-            return CompiledFactory(factory=namespace[_WIREUP_GENERATED_FACTORY_NAME], is_async=is_async)
+        if self._singleton_locks is not None and self._uses_singleton_lock(
+            factory, self._registry.lifetime[resolved_obj_id]
+        ):
+            # Both compilers of a container may compile the same singleton concurrently, such as when it is lazily
+            # compiled from the root container and a scope at once. They must end up using the same lock.
+            lock = self._singleton_locks.setdefault(resolved_obj_id, threading.Lock())
 
+        try:
+            if self._registry.parameters.constant:
+                self._bind_parameters(factory)
+
+            if (code := self._compiled_code.get(symbol_obj_id)) is None:
+                code = self._compiled_code[symbol_obj_id] = self._get_code(factory, impl, qualifier)
+
+            # As with resolvers, the maker is defined in its own namespace while reading symbols from the shared one.
+            local_namespace: dict[str, Any] = {}
+            exec(code, self._namespace, local_namespace)  # noqa: S102
+            generated_factory = local_namespace["_wireup_make_factory"](
+                self._get_slot(resolved_obj_id),
+                self._registry.ctors[obj_id][0],
+                lock,
+                functools.partial(self._specialize_singleton, symbol_obj_id),
+            )
         except Exception as e:
             msg = f"Failed to compile generated factory {obj_id}: {e}"
             raise WireupError(msg) from e
+
+        if is_async:
+            self._async_symbols.add(symbol_obj_id)
+
+        return CompiledFactory(
+            factory=generated_factory,
+            is_async=is_async,
+            singleton_slot=self._registry.singleton_slots.get(resolved_obj_id),
+        )
+
+    def _bind_parameters(self, factory: ServiceFactory) -> None:
+        """Resolve the parameters the factory depends on into the symbols its generated code reads them from."""
+        for dep in self._registry.dependencies[factory.factory].values():
+            if isinstance(dep.annotation, ParameterWrapper):
+                self._namespace[_get_parameter_symbol(dep.annotation.param)] = self._registry.parameters.get(
+                    dep.annotation.param
+                )
+
+
+def _get_parameter_symbol(param: ParameterReference) -> str:
+    # Values are bound to symbols rather than written into the generated code, so that code stays the same
+    # regardless of parameter values. Compiled code can then be shared and cached without including them.
+    key = f"expr:{param.value}" if isinstance(param, TemplatedString) else f"param:{param}"
+    return f"_wireup_parameter_{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"
+
+
+def _scope_error_factory(_container: BaseContainer) -> NoReturn:
+    raise WireupError(_CONTAINER_SCOPE_ERROR_MSG)
+
+
+def _constant_factory(instance: Any, *, is_async: bool) -> Callable[[BaseContainer], Any]:
+    if is_async:
+
+        async def _async_constant_factory(_container: BaseContainer) -> Any:
+            return instance
+
+        return _async_constant_factory
+
+    def _constant_factory(_container: BaseContainer) -> Any:
+        return instance
+
+    return _constant_factory
+
+
+def _to_async_factory(factory: Callable[[BaseContainer], Any]) -> Callable[[BaseContainer], Any]:
+    async def _async_factory(container: BaseContainer) -> Any:
+        return factory(container)
+
+    return _async_factory
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Iterator
 
@@ -25,6 +26,10 @@ class OverrideManager:
         self._factory_compiler = factory_compiler
         self._scoped_factory_compiler = scoped_factory_compiler
         self._original_factories: dict[tuple[type, Qualifier], tuple[CompiledFactory, CompiledFactory]] = {}
+        # Overrides replace entries in the factory tables of both compilers and record what they replaced.
+        # Serialize these so that concurrent threads never observe or record a partially applied override.
+        # Resolving services does not need this lock as each table entry is replaced with a single assignment.
+        self._lock = threading.Lock()
 
     def _compiler_override_obj_id(
         self,
@@ -33,9 +38,9 @@ class OverrideManager:
         qualifier: Qualifier,
         new: Callable[[Any], Any],
     ) -> None:
-        compiler.factories[compiler.get_object_id(target, qualifier)] = CompiledFactory(
-            factory=new,
-            is_async=False,
+        compiler.set_factory(
+            compiler.get_object_id(target, qualifier),
+            CompiledFactory(factory=new, is_async=False),
         )
 
     def _compiler_restore_obj_id(
@@ -45,7 +50,7 @@ class OverrideManager:
         qualifier: Qualifier,
         original: CompiledFactory,
     ) -> None:
-        compiler.factories[compiler.get_object_id(target, qualifier)] = original
+        compiler.set_factory(compiler.get_object_id(target, qualifier), original)
 
     def set(self, target: type, new: Any, qualifier: Qualifier | None = None) -> None:
         """Override the `target` service with `new`.
@@ -62,32 +67,35 @@ class OverrideManager:
 
         obj_id = FactoryCompiler.get_object_id(target, qualifier)
 
-        self._original_factories[target, qualifier] = (
-            self._factory_compiler.factories[obj_id],
-            self._scoped_factory_compiler.factories[obj_id],
-        )
-
         def override_factory(_container: Any) -> Any:
             return new
 
-        self._compiler_override_obj_id(
-            target=target,
-            qualifier=qualifier,
-            compiler=self._factory_compiler,
-            new=override_factory,
-        )
-        self._compiler_override_obj_id(
-            target=target,
-            qualifier=qualifier,
-            compiler=self._scoped_factory_compiler,
-            new=override_factory,
-        )
+        with self._lock:
+            self._original_factories[target, qualifier] = (
+                self._factory_compiler.factories[obj_id],
+                self._scoped_factory_compiler.factories[obj_id],
+            )
+
+            self._compiler_override_obj_id(
+                target=target,
+                qualifier=qualifier,
+                compiler=self._factory_compiler,
+                new=override_factory,
+            )
+            self._compiler_override_obj_id(
+                target=target,
+                qualifier=qualifier,
+                compiler=self._scoped_factory_compiler,
+                new=override_factory,
+            )
 
     def _restore_factory_methods(self, target: type, qualifier: Qualifier | None) -> None:
         """Restore original factory methods after override is removed."""
-        if (target, qualifier) not in self._original_factories:
-            return
+        with self._lock:
+            if (target, qualifier) in self._original_factories:
+                self._restore_factory_methods_unlocked(target, qualifier)
 
+    def _restore_factory_methods_unlocked(self, target: type, qualifier: Qualifier | None) -> None:
         factory_func, scoped_factory_func = self._original_factories[target, qualifier]
         self._compiler_restore_obj_id(
             compiler=self._factory_compiler,
@@ -110,8 +118,9 @@ class OverrideManager:
 
     def clear(self) -> None:
         """Clear active service overrides."""
-        for key in self._original_factories:
-            self._restore_factory_methods(key[0], key[1])
+        with self._lock:
+            for key in list(self._original_factories):
+                self._restore_factory_methods_unlocked(key[0], key[1])
 
     @contextmanager
     def service(self, target: type, new: Any, qualifier: Qualifier | None = None) -> Iterator[None]:
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import re
 from re import Match
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
 
 from wireup.errors import UnknownParameterError
 from wireup.ioc.types import ParameterReference, TemplatedString
 
+_TEMPLATE_PATTERN = re.compile(r"\${(.*?)}", flags=re.DOTALL)
+
 
 class ParameterBag:
     """Parameter flat key-value store for use with a container.
@@ -16,17 +19,47 @@ class ParameterBag:
 
     """
 
-    __slots__ = ("__bag", "__cache")
+    __slots__ = ("__bag", "__cache", "__frozen")
 
-    def __init__(self, values: dict[str, Any] | None = None) -> None:
+    def __init__(self, values: dict[str, Any] | None = None, *, constant: bool = False) -> None:
         """Initialize an empty ParameterBag.
 
         ParameterBag holds a flat key-value store of parameter values.
         __bag: A dictionary to store parameter values.
         __cache: A cache for interpolated values.
+
+        :param constant: Freeze the bag upon creation, as with `freeze`, so that its values never change.
+        Parameters can then be resolved once and used as constants.
         """
-        self.__bag: dict[str, Any] = {} if values is None else values
+        self.__bag: Mapping[str, Any] = {} if values is None else values
         self.__cache: dict[str, str] = {}
+        self.__frozen = False
+
+        if constant:
+            self.freeze()
+
+    @property
+    def constant(self) -> bool:
+        """Whether values of this bag never change, in which case resolved parameters can be reused."""
+        return self.__frozen
+
+    def freeze(self, references: Iterable[ParameterReference] = ()) -> None:
+        """Copy the values into a read-only mapping, so that changes to the dict the bag was created with are not seen.
+
+        Once frozen, interpolating a template always gives the same result. The given references are resolved upfront,
+        so that unknown parameters are reported now and templates are retrieved from the cache when requested.
+
+        :param references: Parameter names and templated strings to validate and resolve ahead of time.
+        :raises UnknownParameterError: Raised if a reference depends on an unknown parameter.
+        """
+        if not self.__frozen:
+            self.__bag = MappingProxyType(dict(self.__bag))
+            # Values may have changed since these were interpolated.
+            self.__cache = {}
+            self.__frozen = True
+
+        for reference in references:
+            self.get(reference)
 
     def get(self, param: ParameterReference) -> Any:
         """Get the value of a parameter.
@@ -47,14 +80,16 @@ class ParameterBag:
         return self.__bag[name]
 
     def __interpolate(self, val: str) -> str:
-        if val in self.__cache:
-            return self.__cache[val]
+        # Look up with a single operation as the cache may be populated concurrently by other threads.
+        # Concurrent misses are benign: every thread computes and stores the same value.
+        if (res := self.__cache.get(val)) is not None:
+            return res
 
         def replace_param(match: Match[str]) -> str:
             return str(self.__get_value_from_name(match.group(1)))
 
         # Accept anything here as we don't impose any rules when adding params
-        res = re.sub(r"\${(.*?)}", replace_param, val, flags=re.DOTALL)
+        res = _TEMPLATE_PATTERN.sub(replace_param, val)
         self.__cache[val] = res
 
         return res
@@ -6,7 +6,7 @@ import warnings
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any, Callable, Tuple, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Container, Iterable, Tuple, TypeVar, Union
 
 from wireup.errors import (
     DuplicateQualifierForInterfaceError,
@@ -26,11 +26,19 @@ from wireup.ioc.types import (
     ParameterWrapper,
     ServiceLifetime,
 )
-from wireup.ioc.util import ensure_is_type, get_globals, param_get_annotation, stringify_type, unwrap_optional_type
+from wireup.ioc.util import (
+    cached_by_target,
+    ensure_is_type,
+    get_annotated_parameters,
+    get_globals,
+    stringify_type,
+    unwrap_optional_type,
+)
 
 if TYPE_CHECKING:
     from wireup._annotations import AbstractDeclaration, ServiceDeclaration
     from wireup.ioc.types import (
+        ParameterReference,
         Qualifier,
     )
 
@@ -61,6 +69,7 @@ class ServiceFactory:
 ServiceCreationDetails = Tuple[Callable[..., Any], ContainerObjectIdentifier, FactoryType, ServiceLifetime]
 
 
+@cached_by_target
 def _get_factory_type(fn: Callable[..., T]) -> FactoryType:
     """Determine the type of factory based on the function signature."""
     if inspect.iscoroutinefunction(fn):
@@ -75,6 +84,7 @@ def _get_factory_type(fn: Callable[..., T]) -> FactoryType:
     return FactoryType.REGULAR
 
 
+@cached_by_target
 def _function_get_unwrapped_return_type(fn: Callable[..., T]) -> type[T] | None:
     if isinstance(fn, type):
         return fn
@@ -98,7 +108,18 @@ def _function_get_unwrapped_return_type(fn: Callable[..., T]) -> type[T] | None:
 class ServiceRegistry:
     """Container class holding service registration info and dependencies among them."""
 
-    __slots__ = ("ctors", "dependencies", "factories", "impls", "interfaces", "lifetime", "parameters")
+    __slots__ = (
+        "ctors",
+        "dependencies",
+        "depths",
+        "factories",
+        "impls",
+        "interfaces",
+        "lifetime",
+        "parameters",
+        "scoped_slots",
+        "singleton_slots",
+    )
 
     def __init__(
         self,
@@ -113,78 +134,121 @@ class ServiceRegistry:
         self.dependencies: dict[InjectionTarget, dict[str, AnnotatedParameter]] = defaultdict(defaultdict)
         self.lifetime: dict[ContainerObjectIdentifier, ServiceLifetime] = {}
         self.ctors: dict[ContainerObjectIdentifier, ServiceCreationDetails] = {}
+        # Cached instances are stored by containers in lists indexed by these slots rather than in dicts.
+        # Singletons and scoped services are numbered separately, as they are stored separately.
+        self.singleton_slots: dict[ContainerObjectIdentifier, int] = {}
+        self.scoped_slots: dict[ContainerObjectIdentifier, int] = {}
+        # Depth of each service in the dependency graph. Services without dependencies have a depth of 0.
+        self.depths: dict[ContainerObjectIdentifier, int] = {}
         self.extend(abstracts=abstracts or [], impls=impls or [])
 
+    def copy(self) -> ServiceRegistry:
+        """Return a registry with the same registrations which can be extended without affecting this one."""
+        res = ServiceRegistry.__new__(ServiceRegistry)
+        res.parameters = self.parameters
+        res.interfaces = {klass: dict(impls) for klass, impls in self.interfaces.items()}
+        res.impls = defaultdict(set, {klass: set(qualifiers) for klass, qualifiers in self.impls.items()})
+        res.factories = dict(self.factories)
+        res.dependencies = defaultdict(
+            defaultdict, {target: defaultdict(None, deps) for target, deps in self.dependencies.items()}
+        )
+        res.lifetime = dict(self.lifetime)
+        res.ctors = dict(self.ctors)
+        res.singleton_slots = dict(self.singleton_slots)
+        res.scoped_slots = dict(self.scoped_slots)
+        res.depths = dict(self.depths)
+
+        return res
+
+    def restrict(self, obj_ids: Container[ContainerObjectIdentifier]) -> ServiceRegistry:
+        """Return a registry of only the given implementations, without validating or analyzing them again.
+
+        Dependencies of the given implementations must be part of them, such as when obtained from `get_reachable`.
+        """
+        res = ServiceRegistry.__new__(ServiceRegistry)
+        res.parameters = self.parameters
+        res.interfaces = {
+            klass: {qualifier: impl for qualifier, impl in impls.items() if (impl, qualifier) in obj_ids}
+            for klass, impls in self.interfaces.items()
+        }
+        res.impls = defaultdict(set)
+        for klass, qualifiers in self.impls.items():
+            if kept := {qualifier for qualifier in qualifiers if (klass, qualifier) in obj_ids}:
+                res.impls[klass] = kept
+
+        res.factories = {obj_id: factory for obj_id, factory in self.factories.items() if obj_id in obj_ids}
+        targets = {factory.factory for factory in res.factories.values()}
+        res.dependencies = defaultdict(
+            defaultdict, {target: deps for target, deps in self.dependencies.items() if target in targets}
+        )
+        res.lifetime = {obj_id: lifetime for obj_id, lifetime in self.lifetime.items() if obj_id in obj_ids}
+        res.ctors = {obj_id: ctor for obj_id, ctor in self.ctors.items() if ctor[1] in obj_ids}
+        # Storage is sized after the number of slots, so the remaining services are numbered again.
+        res.singleton_slots = {
+            obj_id: slot for slot, obj_id in enumerate(obj_id for obj_id in self.singleton_slots if obj_id in obj_ids)
+        }
+        res.scoped_slots = {
+            obj_id: slot for slot, obj_id in enumerate(obj_id for obj_id in self.scoped_slots if obj_id in obj_ids)
+        }
+        res.depths = {obj_id: depth for obj_id, depth in self.depths.items() if obj_id in obj_ids}
+
+        return res
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Parameters are supplied to every container separately and are not part of the registrations.
+        return {name: getattr(self, name) for name in self.__slots__ if name != "parameters"}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.parameters = ParameterBag()
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def extend(
         self,
         *,
         abstracts: list[AbstractDeclaration] | None = None,
         impls: list[ServiceDeclaration] | None = None,
-    ) -> None:
+    ) -> list[ContainerObjectIdentifier]:
+        """Register the given declarations in bulk.
+
+        Only the new services and their dependencies are validated and analyzed, so registering services
+        in batches costs time proportional to the size of each batch rather than to the size of the registry.
+
+        :return: Identifiers of the new services as well as of interfaces they are bound to.
+        """
         for abstract in abstracts or []:
             self._register_abstract(abstract.obj)
 
-        for impl in impls or []:
-            self._register(obj=impl.obj, lifetime=impl.lifetime, qualifier=impl.qualifier)
+        obj_ids = [
+            self._register(obj=impl.obj, lifetime=impl.lifetime, qualifier=impl.qualifier) for impl in impls or []
+        ]
 
-        self.assert_dependencies_valid()
-        self._precompute_ctors()
-        self._update_factories_async_flag()
+        self.assert_dependencies_valid(obj_ids)
 
-    def _update_factories_async_flag(self) -> None:
-        """Update the is_async flag for factories"""
+        return self._precompute_ctors(obj_ids)
 
-        def _is_dependency_async(impl: type, qualifier: Qualifier) -> bool:
-            if self.is_interface_known(impl):
-                impl = self.interface_resolve_impl(impl, qualifier)
+    def _precompute_ctors(self, obj_ids: list[ContainerObjectIdentifier]) -> list[ContainerObjectIdentifier]:
+        res: list[ContainerObjectIdentifier] = []
 
+        for impl, qualifier in obj_ids:
             factory = self.factories[impl, qualifier]
+            ctor = (factory.factory, (impl, qualifier), factory.factory_type, self.lifetime[impl, qualifier])
+            self.ctors[impl, qualifier] = ctor
+            res.append((impl, qualifier))
 
-            if factory.is_async:
-                return True
+            for base in getattr(impl, "__mro__", ())[1:]:
+                if base in self.interfaces and self.interfaces[base].get(qualifier) is impl:
+                    self.ctors[base, qualifier] = ctor
+                    res.append((base, qualifier))
 
-            for dep in self.dependencies[factory.factory].values():
-                if dep.is_parameter:
-                    continue
-
-                if _is_dependency_async(dep.klass, dep.qualifier_value):
-                    return True
-
-            return False
-
-        for impl, qualifiers in self.impls.items():
-            for qualifier in qualifiers:
-                factory = self.factories[impl, qualifier]
-
-                factory.is_async = _is_dependency_async(impl, qualifier)
-
-    def _precompute_ctors(self) -> None:
-        for interface, impls in self.interfaces.items():
-            for qualifier, impl in impls.items():
-                factory = self.factories[impl, qualifier]
-                self.ctors[interface, qualifier] = (
-                    factory.factory,
-                    (impl, qualifier),
-                    factory.factory_type,
-                    self.lifetime[impl, qualifier],
-                )
-
-        for impl, qualifiers in self.impls.items():
-            for qualifier in qualifiers:
-                factory = self.factories[impl, qualifier]
-                self.ctors[impl, qualifier] = (
-                    factory.factory,
-                    (impl, qualifier),
-                    factory.factory_type,
-                    self.lifetime[impl, qualifier],
-                )
+        return res
 
     def _register(
         self,
         obj: Callable[..., Any],
         lifetime: ServiceLifetime = "singleton",
         qualifier: Qualifier | None = None,
-    ) -> None:
+    ) -> ContainerObjectIdentifier:
         if not callable(obj):
             raise InvalidRegistrationTypeError(obj)
 
@@ -210,12 +274,21 @@ class ServiceRegistry:
 
         self._target_init_context(obj)
         self.lifetime[klass, qualifier] = lifetime
+        self._assign_slot((klass, qualifier), lifetime)
         factory_type = _get_factory_type(obj)
         self.factories[klass, qualifier] = ServiceFactory(
             factory=obj, factory_type=factory_type, is_async=factory_type in ASYNC_FACTORY_TYPES
         )
         self.impls[klass].add(qualifier)
 
+        return klass, qualifier
+
+    def _assign_slot(self, obj_id: ContainerObjectIdentifier, lifetime: ServiceLifetime) -> None:
+        if lifetime == "singleton":
+            self.singleton_slots[obj_id] = len(self.singleton_slots)
+        elif lifetime == "scoped":
+            self.scoped_slots[obj_id] = len(self.scoped_slots)
+
     def _register_abstract(self, klass: type) -> None:
         self.interfaces[klass] = {}
 
@@ -224,9 +297,7 @@ class ServiceRegistry:
         target: InjectionTarget,
     ) -> None:
         """Init and collect all the necessary dependencies to initialize the specified target."""
-        for name, parameter in inspect.signature(target).parameters.items():
-            annotated_param = param_get_annotation(parameter, globalns=get_globals(target))
-
+        for name, annotated_param in get_annotated_parameters(target).items():
             if not annotated_param:
                 msg = f"Wireup dependencies must have types. Please add a type to the '{name}' parameter in {target}."
                 raise WireupError(msg)
@@ -271,9 +342,96 @@ class ServiceRegistry:
 
         raise UnknownQualifiedServiceRequestedError(klass, qualifier, set(impls.keys()))
 
-    def assert_dependencies_valid(self) -> None:
-        """Assert that all required dependencies exist for this registry instance."""
-        for (impl, impl_qualifier), service_factory in self.factories.items():
+    def resolve_obj_id(self, klass: type, qualifier: Qualifier | None) -> ContainerObjectIdentifier:
+        """Return the identifier of the concrete implementation bound to the given type and qualifier."""
+        if self.is_interface_known(klass):
+            return self.interface_resolve_impl(klass, qualifier), qualifier
+
+        return klass, qualifier
+
+    def get_service_dependencies(self, obj_id: ContainerObjectIdentifier) -> list[ContainerObjectIdentifier]:
+        """Return the identifiers of the services the given implementation directly depends on."""
+        return [
+            self.resolve_obj_id(dep.klass, dep.qualifier_value)
+            for dep in self.dependencies[self.factories[obj_id].factory].values()
+            if not dep.is_parameter
+        ]
+
+    def get_parameter_references(self) -> set[ParameterReference]:
+        """Return the parameter names and templated strings which registered services depend on."""
+        return {
+            dep.annotation.param
+            for deps in self.dependencies.values()
+            for dep in deps.values()
+            if isinstance(dep.annotation, ParameterWrapper)
+        }
+
+    def get_transitive_dependencies(self, obj_id: ContainerObjectIdentifier) -> set[ContainerObjectIdentifier]:
+        """Return the identifiers of all services the given implementation directly or indirectly depends on."""
+        res: set[ContainerObjectIdentifier] = set()
+        stack = self.get_service_dependencies(obj_id)
+
+        while stack:
+            dep = stack.pop()
+            if dep not in res:
+                res.add(dep)
+                stack.extend(self.get_service_dependencies(dep))
+
+        return res
+
+    def get_depths(
+        self, roots: Iterable[ContainerObjectIdentifier] | None = None
+    ) -> dict[ContainerObjectIdentifier, int]:
+        """Return the depth in the dependency graph of services reachable from roots.
+
+        Services without dependencies have a depth of 0. When roots are not specified, all registered services are used.
+        """
+        if roots is None:
+            return dict(self.depths)
+
+        return {obj_id: self.depths[obj_id] for obj_id in self.get_reachable(roots)}
+
+    def get_reachable(self, roots: Iterable[ContainerObjectIdentifier]) -> set[ContainerObjectIdentifier]:
+        """Return the identifiers of roots and of all services they directly or indirectly depend on.
+
+        Roots which are interfaces are resolved to the identifier of their implementation.
+        """
+        res: set[ContainerObjectIdentifier] = set()
+        stack = [self.resolve_obj_id(klass, qualifier) for klass, qualifier in roots]
+
+        while stack:
+            obj_id = stack.pop()
+            if obj_id not in res:
+                res.add(obj_id)
+                stack.extend(self.get_service_dependencies(obj_id))
+
+        return res
+
+    def get_singleton_levels(
+        self, roots: Iterable[ContainerObjectIdentifier] | None = None
+    ) -> list[list[ContainerObjectIdentifier]]:
+        """Group singletons reachable from roots by their depth in the dependency graph.
+
+        Singletons in a level only depend on singletons from earlier levels.
+        When roots are not specified, all registered services are used.
+        """
+        depths = self.get_depths(roots)
+        levels: list[list[ContainerObjectIdentifier]] = [[] for _ in range(max(depths.values(), default=-1) + 1)]
+        for obj_id, depth in depths.items():
+            if self.lifetime[obj_id] == "singleton":
+                levels[depth].append(obj_id)
+
+        return [level for level in levels if level]
+
+    def assert_dependencies_valid(self, obj_ids: Iterable[ContainerObjectIdentifier] | None = None) -> None:
+        """Assert that all required dependencies exist for this registry instance.
+
+        :param obj_ids: Only validate these services. Defaults to all registered services.
+        """
+        obj_ids = list(self.factories if obj_ids is None else obj_ids)
+
+        for impl, impl_qualifier in obj_ids:
+            service_factory = self.factories[impl, impl_qualifier]
             for name, dependency in self.dependencies[service_factory.factory].items():
                 self.assert_dependency_exists(parameter=dependency, target=impl, name=name)
                 self._assert_lifetime_valid(
@@ -283,7 +441,8 @@ class ServiceRegistry:
                     dependency=dependency,
                     factory=service_factory.factory,
                 )
-                self._assert_valid_resolution_path(dependency=dependency, path=[])
+
+        self._analyze_graph(obj_ids)
 
     def _assert_lifetime_valid(
         self,
@@ -337,29 +496,61 @@ class ServiceRegistry:
             )
             raise WireupError(msg)
 
-    def _assert_valid_resolution_path(
-        self, dependency: AnnotatedParameter, path: list[tuple[AnnotatedParameter, Any]]
-    ) -> None:
-        """Assert that the resolution path for a dependency does not create a cycle."""
-        if dependency.klass in self.interfaces or dependency.is_parameter:
-            return
-        dependency_service_factory = self.factories[dependency.klass, dependency.qualifier_value]
-        new_path: list[tuple[AnnotatedParameter, Any]] = [*path, (dependency, dependency_service_factory)]
-
-        if any(p.klass == dependency.klass and p.qualifier_value == dependency.qualifier_value for p, _ in path):
-
-            def stringify_dependency(p: AnnotatedParameter, factory: Any) -> str:
-                descriptors = [
-                    f'with qualifier "{p.qualifier_value}"' if p.qualifier_value else None,
-                    f"created via {factory.factory.__module__}.{factory.factory.__name__}" if factory else None,
-                ]
-                return (
-                    f"{p.klass.__module__}.{p.klass.__name__} ({', '.join([d for d in descriptors if d is not None])})"
-                )
-
-            cycle_path = "\n -> ".join(f"{stringify_dependency(p, factory)}" for p, factory in new_path)
-            msg = f"Circular dependency detected for {cycle_path} ! Cycle here"
-            raise WireupError(msg)
-
-        for next_dependency in self.dependencies[dependency_service_factory.factory].values():
-            self._assert_valid_resolution_path(next_dependency, path=new_path)
+    def _analyze_graph(self, roots: list[ContainerObjectIdentifier]) -> None:
+        """Detect cycles, propagate async flags and compute depths in a single pass over the dependency graph.
+
+        Services are visited depth-first without recursion and each one is finished only after all of its
+        dependencies, so every service and dependency is looked at once regardless of how many paths lead to it.
+        Services analyzed by an earlier call are not visited again, as their dependencies cannot have changed.
+        """
+        depths = self.depths
+        dependencies: dict[ContainerObjectIdentifier, list[ContainerObjectIdentifier]] = {}
+        # Services on the current path, mapped to their position in the stack.
+        on_path: dict[ContainerObjectIdentifier, int] = {}
+
+        for root in roots:
+            if root in depths:
+                continue
+
+            on_path[root] = 0
+            dependencies[root] = self.get_service_dependencies(root)
+            stack = [(root, iter(dependencies[root]))]
+
+            while stack:
+                obj_id, remaining = stack[-1]
+
+                for dep in remaining:
+                    if dep in depths:
+                        continue
+
+                    if dep in on_path:
+                        raise self._circular_dependency_error([node for node, _ in stack[on_path[dep] :]])
+
+                    on_path[dep] = len(stack)
+                    dependencies[dep] = self.get_service_dependencies(dep)
+                    stack.append((dep, iter(dependencies[dep])))
+                    break
+                else:
+                    stack.pop()
+                    del on_path[obj_id]
+                    factory = self.factories[obj_id]
+                    factory.is_async = factory.is_async or any(
+                        self.factories[dep].is_async for dep in dependencies[obj_id]
+                    )
+                    depths[obj_id] = 1 + max((depths[dep] for dep in dependencies[obj_id]), default=-1)
+
+    def _circular_dependency_error(self, cycle: list[ContainerObjectIdentifier]) -> WireupError:
+        def stringify_dependency(obj_id: ContainerObjectIdentifier) -> str:
+            klass, qualifier = obj_id
+            factory = self.factories[obj_id].factory
+            descriptors = [
+                f'with qualifier "{qualifier}"' if qualifier else None,
+                f"created via {factory.__module__}.{factory.__name__}",
+            ]
+            return f"{klass.__module__}.{klass.__name__} ({', '.join([d for d in descriptors if d is not None])})"
+
+        # Report the cycle starting from the first dependency of the service it was entered from.
+        cycle_path = "\n -> ".join(
+            stringify_dependency(obj_id) for obj_id in [*cycle[1:], cycle[0], cycle[1 % len(cycle)]]
+        )
+        return WireupError(f"Circular dependency detected for {cycle_path} ! Cycle here")
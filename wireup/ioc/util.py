@@ -6,6 +6,7 @@ import inspect
 import sys
 import types
 import typing
+import weakref
 from inspect import Parameter
 from typing import Any, Sequence, TypeVar, cast
 
@@ -15,6 +16,8 @@ from wireup.ioc.types import AnnotatedParameter, AnyCallable, InjectableType
 T = TypeVar("T")
 _OPTIONAL_UNION_ARG_COUNT = 2
 _eval_type = cast("Callable[..., Any]", typing._eval_type)  # type: ignore[attr-defined]
+_R = TypeVar("_R")
+_target_caches: list[weakref.WeakKeyDictionary[Any, Any]] = []
 
 if typing.TYPE_CHECKING:
     from collections.abc import Callable
@@ -81,6 +84,52 @@ def param_get_annotation(parameter: Parameter, *, globalns: dict[str, Any]) -> A
     return AnnotatedParameter(klass=inner_type, annotation=annotation)
 
 
+def cached_by_target(fn: Callable[[Any], _R]) -> Callable[[Any], _R]:
+    """Cache the result of fn for each target it is called with, for as long as the target is alive.
+
+    Targets are held weakly so that caching them does not keep classes or functions defined at runtime alive.
+    Results are shared by all callers, which must not mutate them.
+    """
+    cache: weakref.WeakKeyDictionary[Any, _R] = weakref.WeakKeyDictionary()
+    _target_caches.append(cache)
+
+    @functools.wraps(fn)
+    def _wrapper(target: Any) -> _R:
+        try:
+            return cache[target]
+        except KeyError:
+            pass
+        except TypeError:
+            # Some callables, such as bound methods, cannot be weakly referenced.
+            return fn(target)
+
+        res = cache[target] = fn(target)
+        return res
+
+    return _wrapper
+
+
+def clear_annotation_cache() -> None:
+    """Clear annotations resolved for services and injection targets.
+
+    Wireup inspects each class or function once per process and reuses the result in every container created
+    afterwards. Call this after changing the signature or annotations of an already inspected object at runtime.
+    """
+    for cache in _target_caches:
+        cache.clear()
+
+
+@cached_by_target
+def get_annotated_parameters(target: AnyCallable) -> dict[str, AnnotatedParameter | None]:
+    """Return the resolved annotation of each parameter of target, or None for parameters without a type."""
+    globalns = get_globals(target)
+
+    return {
+        name: param_get_annotation(parameter, globalns=globalns)
+        for name, parameter in inspect.signature(target).parameters.items()
+    }
+
+
 def get_globals(obj: type[Any] | Callable[..., Any]) -> dict[str, Any]:
     """Return the globals for the given object."""
     if isinstance(obj, type):
@@ -212,9 +261,8 @@ def get_inject_annotated_parameters(target: AnyCallable) -> dict[str, AnnotatedP
 
     return {
         name: param
-        for name, parameter in inspect.signature(target).parameters.items()
-        if (param := param_get_annotation(parameter, globalns=get_globals(target)))
-        and isinstance(param.annotation, InjectableType)
+        for name, param in get_annotated_parameters(target).items()
+        if param and isinstance(param.annotation, InjectableType)
     }
 
 